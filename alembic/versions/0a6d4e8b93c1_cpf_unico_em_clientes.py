@@ -0,0 +1,33 @@
+"""cpf unico em clientes
+
+Revision ID: 0a6d4e8b93c1
+Revises: f1c9a2e7b350
+Create Date: 2025-06-06 16:30:44.902117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0a6d4e8b93c1'
+down_revision: Union[str, None] = 'f1c9a2e7b350'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # O índice único substitui o índice simples criado para a busca por CPF. Falha se já
+    # houver CPFs duplicados, que precisam ser resolvidos antes da migração.
+    with op.get_context().autocommit_block():
+        op.execute("CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_customers_cpf ON customers (cpf)")
+    op.execute("ALTER TABLE customers ADD CONSTRAINT uq_customers_cpf UNIQUE USING INDEX uq_customers_cpf")
+    op.drop_index('ix_customers_cpf', table_name='customers', if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_customers_cpf', 'customers', ['cpf'])
+    op.drop_constraint('uq_customers_cpf', 'customers', type_='unique')
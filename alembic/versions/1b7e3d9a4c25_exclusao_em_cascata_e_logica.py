@@ -0,0 +1,77 @@
+"""exclusao em cascata e logica
+
+Revision ID: 1b7e3d9a4c25
+Revises: 0a6d4e8b93c1
+Create Date: 2025-06-07 10:12:31.558204
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1b7e3d9a4c25'
+down_revision: Union[str, None] = '0a6d4e8b93c1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (tabela, coluna, tabela referenciada, ON DELETE). Os nomes são os padrão do PostgreSQL,
+# já que as FKs vieram do create_all sem nome explícito.
+FOREIGN_KEYS = (
+    ('orders', 'customer_id', 'customers', 'CASCADE'),
+    ('addresses', 'customer_id', 'customers', 'CASCADE'),
+    ('order_products', 'order_id', 'orders', 'CASCADE'),
+    ('order_products', 'product_id', 'products', 'RESTRICT'),
+    ('product_categories', 'product_id', 'products', 'CASCADE'),
+    ('product_categories', 'category_id', 'categories', 'CASCADE'),
+)
+
+PARTIAL_INDEXES = (
+    ('ix_customers_live_email_uid', 'customers', ['email', 'uid']),
+    ('ix_customers_live_created_at_uid', 'customers', ['created_at', 'uid']),
+    ('ix_products_live_uid', 'products', ['uid']),
+    ('ix_categories_live_name', 'categories', ['name']),
+)
+
+
+def _replace_foreign_keys(restore: bool = False) -> None:
+    for table, column, referred, action in FOREIGN_KEYS:
+        name = f'{table}_{column}_fkey'
+        # NOT VALID + VALIDATE: a troca só segura o lock forte pelo tempo do ALTER, e a
+        # validação das linhas existentes roda com SHARE UPDATE EXCLUSIVE.
+        op.execute(
+            f'ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {name}, '
+            f'ADD CONSTRAINT {name} FOREIGN KEY ({column}) REFERENCES {referred} (uid) '
+            f"ON DELETE {'NO ACTION' if restore else action} NOT VALID"
+        )
+        op.execute(f'ALTER TABLE {table} VALIDATE CONSTRAINT {name}')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _replace_foreign_keys()
+
+    for table in ('customers', 'products', 'categories'):
+        op.add_column(table, sa.Column('deleted_at', sa.DateTime(), nullable=True))
+
+    with op.get_context().autocommit_block():
+        for name, table, columns in PARTIAL_INDEXES:
+            op.create_index(
+                name, table, columns,
+                postgresql_where=sa.text('deleted_at IS NULL'),
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _ in PARTIAL_INDEXES:
+        op.drop_index(name, table_name=table, if_exists=True)
+
+    for table in ('customers', 'products', 'categories'):
+        op.drop_column(table, 'deleted_at')
+
+    _replace_foreign_keys(restore=True)
@@ -0,0 +1,173 @@
+"""particionamento mensal de pedidos
+
+Revision ID: 2c4f8a1e6d07
+Revises: 1b7e3d9a4c25
+Create Date: 2025-06-08 09:41:17.320658
+
+"""
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2c4f8a1e6d07'
+down_revision: Union[str, None] = '1b7e3d9a4c25'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Mesmo padrão de src.db.partitions; o job da aplicação cria os meses seguintes.
+MONTHS_AHEAD = 3
+
+ORDERS_COLUMNS = 'uid, total_price, customer_id, status, created_at, updated_at'
+ORDER_PRODUCTS_COLUMNS = 'product_id, order_id, order_created_at, quantity, unit_price, discount_percentage'
+
+INDEXES = (
+    "CREATE INDEX ix_orders_customer_id_created_at ON orders (customer_id, created_at)",
+    "CREATE INDEX ix_orders_status_created_at ON orders (status, created_at)",
+    "CREATE INDEX ix_orders_created_at_uid ON orders (created_at, uid)",
+    "CREATE INDEX ix_orders_created_at_brin ON orders USING brin (created_at)",
+    "CREATE INDEX ix_order_products_order_id ON order_products (order_id)",
+    "CREATE INDEX ix_order_products_order_created_at_brin ON order_products USING brin (order_created_at)",
+)
+
+
+def _month_start(day: date, offset: int = 0) -> date:
+    month = day.month - 1 + offset
+    return date(day.year + month // 12, month % 12 + 1, 1)
+
+
+def _rename_legacy(table: str) -> None:
+    # Os nomes das constraints (a PK é um índice) são escolhidos no schema inteiro; renomeá-las
+    # libera os nomes padrão para a tabela nova, senão ela ganharia orders_customer_id_fkey1.
+    op.execute(f'ALTER TABLE {table} RENAME TO {table}_legacy')
+    op.execute(
+        f"""
+        DO $$
+        DECLARE c record;
+        BEGIN
+            FOR c IN
+                SELECT conname FROM pg_constraint
+                WHERE conrelid = '{table}_legacy'::regclass AND conparentid = 0
+            LOOP
+                EXECUTE format(
+                    'ALTER TABLE {table}_legacy RENAME CONSTRAINT %I TO %I', c.conname, 'legacy_' || c.conname
+                );
+            END LOOP;
+        END $$
+        """
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # A chave de partição precisa estar na PK e nas FKs: orders passa a ter PK (uid, created_at)
+    # e order_products ganha order_created_at, copiado do pedido.
+    _rename_legacy('order_products')
+    _rename_legacy('orders')
+
+    op.execute(
+        """
+        CREATE TABLE orders (
+            uid UUID NOT NULL,
+            total_price FLOAT NOT NULL,
+            customer_id UUID NOT NULL REFERENCES customers (uid) ON DELETE CASCADE,
+            status VARCHAR(20),
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            PRIMARY KEY (uid, created_at)
+        ) PARTITION BY RANGE (created_at)
+        """
+    )
+    op.execute(
+        """
+        CREATE TABLE order_products (
+            product_id UUID NOT NULL REFERENCES products (uid) ON DELETE RESTRICT,
+            order_id UUID NOT NULL,
+            order_created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            quantity INTEGER NOT NULL,
+            unit_price FLOAT NOT NULL,
+            discount_percentage FLOAT NOT NULL,
+            PRIMARY KEY (product_id, order_id, order_created_at),
+            FOREIGN KEY (order_id, order_created_at) REFERENCES orders (uid, created_at) ON DELETE CASCADE
+        ) PARTITION BY RANGE (order_created_at)
+        """
+    )
+
+    # Uma partição por mês, do pedido mais antigo até MONTHS_AHEAD meses à frente.
+    oldest = op.get_bind().exec_driver_sql('SELECT min(created_at) FROM orders_legacy').scalar()
+    today = date.today()
+    month = _month_start(oldest.date() if oldest else today)
+    last = _month_start(today, MONTHS_AHEAD)
+    while month <= last:
+        upper = _month_start(month, 1)
+        for table in ('orders', 'order_products'):
+            op.execute(
+                f"CREATE TABLE {table}_p{month:%Y_%m} PARTITION OF {table} "
+                f"FOR VALUES FROM ('{month}') TO ('{upper}')"
+            )
+        month = upper
+
+    op.execute(f'INSERT INTO orders ({ORDERS_COLUMNS}) SELECT {ORDERS_COLUMNS} FROM orders_legacy')
+    op.execute(
+        f"""
+        INSERT INTO order_products ({ORDER_PRODUCTS_COLUMNS})
+        SELECT op.product_id, op.order_id, o.created_at, op.quantity, op.unit_price, op.discount_percentage
+        FROM order_products_legacy op
+        JOIN orders_legacy o ON o.uid = op.order_id
+        """
+    )
+    op.execute('DROP TABLE order_products_legacy')
+    op.execute('DROP TABLE orders_legacy')
+
+    # Criados no pai, os índices se propagam para todas as partições (atuais e futuras).
+    for statement in INDEXES:
+        op.execute(statement)
+    op.execute('ANALYZE orders')
+    op.execute('ANALYZE order_products')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _rename_legacy('order_products')
+    _rename_legacy('orders')
+
+    op.execute(
+        """
+        CREATE TABLE orders (
+            uid UUID NOT NULL PRIMARY KEY,
+            total_price FLOAT NOT NULL,
+            customer_id UUID NOT NULL REFERENCES customers (uid) ON DELETE CASCADE,
+            status VARCHAR(20),
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL
+        )
+        """
+    )
+    op.execute(
+        """
+        CREATE TABLE order_products (
+            product_id UUID NOT NULL REFERENCES products (uid) ON DELETE RESTRICT,
+            order_id UUID NOT NULL REFERENCES orders (uid) ON DELETE CASCADE,
+            quantity INTEGER NOT NULL,
+            unit_price FLOAT NOT NULL,
+            discount_percentage FLOAT NOT NULL,
+            PRIMARY KEY (product_id, order_id)
+        )
+        """
+    )
+    op.execute(f'INSERT INTO orders ({ORDERS_COLUMNS}) SELECT {ORDERS_COLUMNS} FROM orders_legacy')
+    op.execute(
+        """
+        INSERT INTO order_products (product_id, order_id, quantity, unit_price, discount_percentage)
+        SELECT product_id, order_id, quantity, unit_price, discount_percentage FROM order_products_legacy
+        """
+    )
+    # Remove o pai particionado junto com todas as partições.
+    op.execute('DROP TABLE order_products_legacy')
+    op.execute('DROP TABLE orders_legacy')
+
+    for statement in INDEXES:
+        if 'brin' not in statement:
+            op.execute(statement)
@@ -0,0 +1,53 @@
+"""unicidade parcial para exclusao logica
+
+Revision ID: 3e9b5c7d2f14
+Revises: 2c4f8a1e6d07
+Create Date: 2025-06-08 15:02:48.716390
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3e9b5c7d2f14'
+down_revision: Union[str, None] = '2c4f8a1e6d07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (índice parcial, tabela, coluna, constraint única que ele substitui)
+UNIQUE_KEYS = (
+    ('uq_customers_email', 'customers', 'email', 'customers_email_key'),
+    ('uq_customers_cpf', 'customers', 'cpf', 'uq_customers_cpf'),
+    ('uq_categories_name', 'categories', 'name', 'categories_name_key'),
+    ('uq_products_bar_code', 'products', 'bar_code', 'products_bar_code_key'),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Os índices parciais são criados antes de remover as constraints, para a unicidade
+    # nunca ficar descoberta; o sufixo evita o conflito de nome com uq_customers_cpf.
+    with op.get_context().autocommit_block():
+        for name, table, column, _ in UNIQUE_KEYS:
+            op.execute(
+                f'CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS {name}_live '
+                f'ON {table} ({column}) WHERE deleted_at IS NULL'
+            )
+
+    for name, table, _, constraint in UNIQUE_KEYS:
+        op.execute(f'ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {constraint}')
+        op.execute(f'ALTER INDEX {name}_live RENAME TO {name}')
+
+    # uq_categories_name cobre a listagem por nome.
+    op.drop_index('ix_categories_live_name', table_name='categories', if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Falha se houver duplicatas entre linhas excluídas logicamente e ativas.
+    op.execute('CREATE INDEX IF NOT EXISTS ix_categories_live_name ON categories (name) WHERE deleted_at IS NULL')
+    for name, table, column, constraint in UNIQUE_KEYS:
+        op.drop_index(name, table_name=table)
+        op.execute(f'ALTER TABLE {table} ADD CONSTRAINT {constraint} UNIQUE ({column})')
@@ -0,0 +1,46 @@
+"""shards em vendas diarias
+
+Revision ID: 4a2d6f8b1c39
+Revises: 3e9b5c7d2f14
+Create Date: 2025-06-08 17:26:05.193847
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4a2d6f8b1c39'
+down_revision: Union[str, None] = '3e9b5c7d2f14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # As linhas existentes ficam no shard 0; os pedidos novos se espalham pelos demais.
+    op.add_column('daily_sales', sa.Column('shard', sa.Integer(), nullable=False, server_default='0'))
+    op.alter_column('daily_sales', 'shard', server_default=None)
+    op.drop_constraint('daily_sales_pkey', 'daily_sales', type_='primary')
+    op.create_primary_key('daily_sales_pkey', 'daily_sales', ['day', 'shard'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(
+        """
+        CREATE TEMP TABLE daily_sales_totals ON COMMIT DROP AS
+        SELECT day, sum(orders_count) AS orders_count, sum(items_count) AS items_count, sum(revenue) AS revenue
+        FROM daily_sales GROUP BY day
+        """
+    )
+    op.execute('DELETE FROM daily_sales')
+    op.drop_constraint('daily_sales_pkey', 'daily_sales', type_='primary')
+    op.drop_column('daily_sales', 'shard')
+    op.execute(
+        'INSERT INTO daily_sales (day, orders_count, items_count, revenue) '
+        'SELECT day, orders_count, items_count, revenue FROM daily_sales_totals'
+    )
+    op.create_primary_key('daily_sales_pkey', 'daily_sales', ['day'])
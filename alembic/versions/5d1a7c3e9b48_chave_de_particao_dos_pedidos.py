@@ -0,0 +1,37 @@
+"""chave de particao dos pedidos
+
+Revision ID: 5d1a7c3e9b48
+Revises: 4a2d6f8b1c39
+Create Date: 2025-06-09 10:12:44.508213
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d1a7c3e9b48'
+down_revision: Union[str, None] = '4a2d6f8b1c39'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'order_keys',
+        sa.Column('uid', sa.Uuid(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ['uid', 'created_at'], ['orders.uid', 'orders.created_at'], ondelete='CASCADE'
+        ),
+        sa.PrimaryKeyConstraint('uid'),
+    )
+    op.execute('INSERT INTO order_keys (uid, created_at) SELECT uid, created_at FROM orders')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('order_keys')
@@ -0,0 +1,50 @@
+"""busca textual em produtos
+
+Revision ID: c4e1a9d27b10
+Revises: 33a1464b7629
+Create Date: 2025-06-02 10:12:41.208315
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e1a9d27b10'
+down_revision: Union[str, None] = '33a1464b7629'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.add_column(
+        'products',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('portuguese', coalesce(title, '')), 'A') || "
+                "setweight(to_tsvector('portuguese', coalesce(brand, '')), 'B') || "
+                "setweight(to_tsvector('portuguese', coalesce(description, '')), 'C')",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index('ix_products_search_vector', 'products', ['search_vector'], postgresql_using='gin')
+    op.create_index(
+        'ix_products_title_trgm', 'products', ['title'],
+        postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_products_title_trgm', table_name='products')
+    op.drop_index('ix_products_search_vector', table_name='products')
+    op.drop_column('products', 'search_vector')
@@ -0,0 +1,75 @@
+"""totais de pedidos e vendas diarias
+
+Revision ID: d7a3f5c01e42
+Revises: c4e1a9d27b10
+Create Date: 2025-06-03 09:41:17.532904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7a3f5c01e42'
+down_revision: Union[str, None] = 'c4e1a9d27b10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('order_products', sa.Column('unit_price', sa.Float(), nullable=False, server_default='0'))
+    op.add_column(
+        'order_products', sa.Column('discount_percentage', sa.Float(), nullable=False, server_default='0')
+    )
+    op.create_table(
+        'daily_sales',
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('orders_count', sa.Integer(), nullable=False),
+        sa.Column('items_count', sa.Integer(), nullable=False),
+        sa.Column('revenue', sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint('day'),
+    )
+
+    # Pedidos antigos não guardaram o preço da compra: usa o preço atual como melhor estimativa.
+    op.execute(
+        """
+        UPDATE order_products op
+        SET unit_price = p.price, discount_percentage = p.discount_percentage
+        FROM products p
+        WHERE p.uid = op.product_id
+        """
+    )
+    op.execute(
+        """
+        UPDATE orders o
+        SET total_price = t.total
+        FROM (
+            SELECT order_id,
+                   round(sum(unit_price * quantity * (1 - discount_percentage / 100))::numeric, 2) AS total
+            FROM order_products
+            GROUP BY order_id
+        ) t
+        WHERE t.order_id = o.uid
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO daily_sales (day, orders_count, items_count, revenue)
+        SELECT o.created_at::date, count(*), coalesce(sum(i.items), 0), sum(o.total_price)
+        FROM orders o
+        LEFT JOIN (
+            SELECT order_id, sum(quantity) AS items FROM order_products GROUP BY order_id
+        ) i ON i.order_id = o.uid
+        GROUP BY o.created_at::date
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('daily_sales')
+    op.drop_column('order_products', 'discount_percentage')
+    op.drop_column('order_products', 'unit_price')
@@ -0,0 +1,44 @@
+"""indices compostos para filtros
+
+Revision ID: e2b8c6d41f93
+Revises: d7a3f5c01e42
+Create Date: 2025-06-04 14:22:05.118734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b8c6d41f93'
+down_revision: Union[str, None] = 'd7a3f5c01e42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (nome, tabela, colunas) derivados de OrderFilter, ProductFilter, dos joins e das buscas dos services.
+INDEXES = [
+    ('ix_orders_customer_id_created_at', 'orders', ['customer_id', 'created_at']),
+    ('ix_orders_status_created_at', 'orders', ['status', 'created_at']),
+    ('ix_orders_created_at_uid', 'orders', ['created_at', 'uid']),
+    ('ix_order_products_order_id', 'order_products', ['order_id']),
+    ('ix_product_categories_category_id', 'product_categories', ['category_id']),
+    ('ix_addresses_customer_id', 'addresses', ['customer_id']),
+    ('ix_customers_cpf', 'customers', ['cpf']),
+    ('ix_products_is_published_price', 'products', ['is_published', 'price']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY não trava escritas, mas não pode rodar dentro de uma transação.
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
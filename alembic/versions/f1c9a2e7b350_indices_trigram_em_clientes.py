@@ -0,0 +1,39 @@
+"""indices trigram em clientes
+
+Revision ID: f1c9a2e7b350
+Revises: e2b8c6d41f93
+Create Date: 2025-06-05 11:07:52.640219
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1c9a2e7b350'
+down_revision: Union[str, None] = 'e2b8c6d41f93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        for column in ('username', 'email'):
+            op.create_index(
+                f'ix_customers_{column}_trgm', 'customers', [column],
+                postgresql_using='gin', postgresql_ops={column: 'gin_trgm_ops'},
+                postgresql_concurrently=True, if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for column in ('email', 'username'):
+            op.drop_index(
+                f'ix_customers_{column}_trgm', table_name='customers',
+                postgresql_concurrently=True, if_exists=True,
+            )
@@ -1,16 +1,22 @@
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi_pagination import add_pagination
 from fastapi_pagination.utils import disable_installed_extensions_check
 
 from src.api.v1.api import api_router
-from src.core.logger import logger
+from src.auth.revocation import RevocationRegistry
+from src.core.logger import Logger, logger
+from src.core.metrics import mark_process_dead, render_metrics
+from src.core.responses import ORJSONResponse
 from src.core.middleware import register_middleware
 from src.core.settings import settings
 from src.db.database import async_engine
 from src.db.database import init_db
+from src.db.database import get_pool_stats
+from src.db.partitions import PartitionMaintenance
 from src.exceptions.errors import register_all_errors
+from src.utils.passwords import PasswordHasher
 
 description = """
     Welcome to the Lu Estilo E-commerce API documentation. 🚀
@@ -48,7 +54,14 @@ def include_router(app):
 @asynccontextmanager
 async def lifespan(app):
     await init_db()
+    await PartitionMaintenance.start()
+    await RevocationRegistry.start()
     yield
+    await RevocationRegistry.stop()
+    await PartitionMaintenance.stop()
+    PasswordHasher.shutdown()
+    mark_process_dead()
+    Logger.stop_listeners()
 
 
 app = FastAPI(
@@ -56,6 +69,7 @@ app = FastAPI(
     title="Lu Estilo E-commerce API",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     contact={
         "name": "Matheus Feu",
         "url": "https://github.com/matheus-feu"
@@ -87,3 +101,28 @@ async def healthcheck():
     Healthcheck endpoint to verify if the API is running.
     """
     return {"message": "Welcome to the Lu Estilo E-commerce API! 🚀"}
+
+
+@app.get("/api/v1/healthcheck/db-pool", tags=["healthcheck"])
+async def db_pool_healthcheck():
+    """
+    Connection pool gauges: connections in use, overflow and time spent waiting for a checkout.
+    """
+    return get_pool_stats()
+
+
+@app.get("/api/v1/healthcheck/revocation", tags=["healthcheck"])
+async def revocation_healthcheck():
+    """
+    Local JWT blocklist mirror: size, sync state and hit/miss/fallback counters.
+    """
+    return RevocationRegistry.stats()
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """
+    Prometheus metrics, aggregated across workers when PROMETHEUS_MULTIPROC_DIR is set.
+    """
+    payload, content_type = render_metrics()
+    return Response(content=payload, media_type=content_type)
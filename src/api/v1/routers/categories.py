@@ -1,16 +1,16 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 from fastapi_filter import FilterDepends
-from fastapi_pagination import Page, paginate
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio.session import AsyncSession
 
 from src.auth.security import RoleChecker
-from src.db.database import get_session
-from src.exceptions.errors import ErrorResponse
+from src.db.database import get_read_session, get_session
+from src.exceptions.errors import ErrorResponse, InvalidCursorError
 from src.filters.categories import CategoryFilter
 from src.models.category import Category
+from src.schemas.pagination import CountMode, CountedPage, CursorPage
 from src.schemas.categories import (
     CategoryBaseModel,
     CategoryOutModel,
@@ -19,6 +19,7 @@ from src.schemas.categories import (
     CategoryOutDeleteModel
 )
 from src.services.categories import CategoryService
+from src.utils.pagination import keyset_paginate, paginate_rows
 
 role_checker = RoleChecker(["admin", "customer"])
 categories_router = APIRouter(
@@ -29,24 +30,54 @@ categories_router = APIRouter(
 @categories_router.get(
     "/",
     status_code=status.HTTP_200_OK,
-    response_model=Page[CategoryBaseModel],
+    response_model=CountedPage[CategoryBaseModel],
 )
 async def get_all_categories(
-        session: AsyncSession = Depends(get_session),
+        session: AsyncSession = Depends(get_read_session),
         category_filter: CategoryFilter = FilterDepends(CategoryFilter),
+        count: CountMode = Query("exact", description="exact: count(*); estimate: estimativa ou contagem em cache"),
 ):
     """
     Get all categories with optional filters.
     :param session:
     :param category_filter:
+    :param count:
     :return:
     """
     try:
-        query = select(Category)
-        query = category_filter.filter(query)
-        result = await session.execute(query)
-        categories = result.scalars().unique().all()
-        return paginate(categories)
+        query = select(Category).where(Category.deleted_at.is_(None))
+        query = category_filter.filter(query).order_by(Category.name)
+        return await paginate_rows(
+            session, query, count, "categories", category_filter.model_dump(exclude_none=True)
+        )
+    except Exception as e:
+        raise ErrorResponse(message=str(e))
+
+
+@categories_router.get(
+    "/cursor",
+    status_code=status.HTTP_200_OK,
+    response_model=CursorPage[CategoryBaseModel],
+)
+async def get_categories_by_cursor(
+        session: AsyncSession = Depends(get_read_session),
+        category_filter: CategoryFilter = FilterDepends(CategoryFilter),
+        cursor: str | None = Query(None, description="Cursor retornado pela página anterior"),
+        size: int = Query(50, ge=1, le=100, description="Tamanho da página"),
+):
+    """
+    Get categories with cursor (keyset) pagination, ordered by uid.
+    :param session:
+    :param category_filter:
+    :param cursor:
+    :param size:
+    :return:
+    """
+    try:
+        query = category_filter.filter(select(Category).where(Category.deleted_at.is_(None)))
+        return await keyset_paginate(session, query, [Category.uid], cursor, size)
+    except InvalidCursorError:
+        raise
     except Exception as e:
         raise ErrorResponse(message=str(e))
 
@@ -56,7 +87,7 @@ async def get_all_categories(
     status_code=status.HTTP_200_OK,
     response_model=CategoryOutModel
 )
-async def get_category(category_id: UUID, session: AsyncSession = Depends(get_session)):
+async def get_category(category_id: UUID, session: AsyncSession = Depends(get_read_session)):
     """
     Get a category by its ID.
     :param category_id:
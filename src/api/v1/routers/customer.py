@@ -1,15 +1,17 @@
+from typing import Literal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import StreamingResponse
 from fastapi_filter import FilterDepends
-from fastapi_pagination import paginate, Page
 from sqlalchemy import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.auth.security import RoleChecker
-from src.db.database import get_session
+from src.db.database import get_read_session, get_session
 from src.filters.customers import CustomerFilter
 from src.models.customer import Customer
+from src.schemas.pagination import CountMode, CountedPage, CursorPage
 from src.schemas.customers import (
     CustomerModel,
     CustomerCreateModel,
@@ -17,9 +19,12 @@ from src.schemas.customers import (
     CustomersOutModel,
     CustomerOutModel
 )
-from src.services.customers import CustomerService
+from src.services.customers import CUSTOMER_LIST_COLUMNS, CustomerService
+from src.services.exports import ExportService, EXPORT_MEDIA_TYPES
+from src.utils.pagination import keyset_paginate
 
 role_checker = RoleChecker(["admin", "customer"])
+admin_checker = RoleChecker(["admin"])
 customers_router = APIRouter(
     dependencies=[Depends(role_checker)],
 )
@@ -27,18 +32,69 @@ customers_router = APIRouter(
 
 @customers_router.get(
     "/",
-    response_model=Page[CustomerModel],
+    response_model=CountedPage[CustomerModel],
     status_code=status.HTTP_200_OK
 )
 async def get_all_customers(
         customer_filter: CustomerFilter = FilterDepends(CustomerFilter),
-        session: AsyncSession = Depends(get_session),
+        include_addresses: bool = Query(False, description="Incluir os endereços de cada cliente"),
+        count: CountMode = Query("exact", description="exact: count(*); estimate: estimativa ou contagem em cache"),
+        session: AsyncSession = Depends(get_read_session),
 ):
-    query = select(Customer)
-    query = customer_filter.filter(query)
-    result = await session.execute(query)
-    customers = result.scalars().unique().all()
-    return paginate(customers)
+    """
+    List customers with filters and database-side pagination.
+    :param customer_filter:
+    :param include_addresses:
+    :param count:
+    :param session:
+    :return:
+    """
+    return await CustomerService.list_customers(session, customer_filter, include_addresses, count)
+
+
+@customers_router.get(
+    "/cursor",
+    response_model=CursorPage[CustomerModel],
+    status_code=status.HTTP_200_OK
+)
+async def get_customers_by_cursor(
+        customer_filter: CustomerFilter = FilterDepends(CustomerFilter),
+        cursor: str | None = Query(None, description="Cursor retornado pela página anterior"),
+        size: int = Query(50, ge=1, le=100, description="Tamanho da página"),
+        session: AsyncSession = Depends(get_read_session),
+):
+    """
+    List customers with cursor (keyset) pagination, ordered by (created_at, uid).
+    :param customer_filter:
+    :param cursor:
+    :param size:
+    :param session:
+    :return:
+    """
+    query = customer_filter.filter(select(*CUSTOMER_LIST_COLUMNS).where(Customer.deleted_at.is_(None)))
+    return await keyset_paginate(session, query, [Customer.created_at, Customer.uid], cursor, size)
+
+
+@customers_router.get(
+    "/export",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(admin_checker)],
+)
+async def export_customers(
+        customer_filter: CustomerFilter = FilterDepends(CustomerFilter),
+        file_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+):
+    """
+    Export customers as a stream (NDJSON or CSV).
+    :param customer_filter:
+    :param file_format:
+    :return:
+    """
+    return StreamingResponse(
+        ExportService.export_customers(customer_filter, file_format),
+        media_type=EXPORT_MEDIA_TYPES[file_format],
+        headers={"Content-Disposition": f'attachment; filename="customers.{file_format}"'},
+    )
 
 
 @customers_router.post(
@@ -61,7 +117,7 @@ async def create_new_customer(customer: CustomerCreateModel, session: AsyncSessi
     response_model=CustomerOutModel,
     status_code=status.HTTP_200_OK
 )
-async def get_customer(customer_id: UUID, session: AsyncSession = Depends(get_session)):
+async def get_customer(customer_id: UUID, session: AsyncSession = Depends(get_read_session)):
     """
     Get a customer by ID.
     :param customer_id:
@@ -1,36 +1,103 @@
+from datetime import date
+from typing import Literal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 from fastapi_filter import FilterDepends
-from fastapi_pagination import Page
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.auth.security import RoleChecker
-from src.db.database import get_session
+from src.db.database import get_read_session, get_session
 from src.filters.orders import OrderFilter
+from src.schemas.pagination import CountMode, CountedPage, CursorPage
 from src.schemas.orders import (
     OrderResponseModel,
     OrderBaseModel,
     OrderCreateModel,
+    OrderStatsModel,
     OrderUpdateModel
 )
+from src.services.exports import ExportService, EXPORT_MEDIA_TYPES
 from src.services.orders import OrderService
 
 role_checker = RoleChecker(["admin", "customer"])
+admin_checker = RoleChecker(["admin"])
 orders_router = APIRouter(
     # dependencies=[Depends(role_checker)],
 )
 
 
-@orders_router.get("/", response_model=Page[OrderBaseModel], status_code=status.HTTP_200_OK)
+@orders_router.get("/", response_model=CountedPage[OrderBaseModel], status_code=status.HTTP_200_OK)
 async def list_orders(
-        session: AsyncSession = Depends(get_session),
+        session: AsyncSession = Depends(get_read_session),
         order_filter: OrderFilter = FilterDepends(OrderFilter),
+        count: CountMode = Query("exact", description="exact: count(*); estimate: estimativa ou contagem em cache"),
 ):
     """
     Listar produtos com filtros e paginação.
     """
-    return await OrderService.list_orders(session, order_filter)
+    return await OrderService.list_orders(session, order_filter, count)
+
+
+@orders_router.get("/cursor", response_model=CursorPage[OrderBaseModel], status_code=status.HTTP_200_OK)
+async def list_orders_by_cursor(
+        session: AsyncSession = Depends(get_read_session),
+        order_filter: OrderFilter = FilterDepends(OrderFilter),
+        cursor: str | None = Query(None, description="Cursor retornado pela página anterior"),
+        size: int = Query(50, ge=1, le=100, description="Tamanho da página"),
+):
+    """
+    Listar pedidos com paginação por cursor (keyset).
+    """
+    return await OrderService.list_orders_by_cursor(session, order_filter, cursor, size)
+
+
+@orders_router.get("/export", status_code=status.HTTP_200_OK, dependencies=[Depends(admin_checker)])
+async def export_orders(
+        order_filter: OrderFilter = FilterDepends(OrderFilter),
+        file_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+):
+    """
+    Exportar pedidos em stream (NDJSON ou CSV), filtrados por status e período.
+    """
+    return StreamingResponse(
+        ExportService.export_orders(order_filter, file_format),
+        media_type=EXPORT_MEDIA_TYPES[file_format],
+        headers={"Content-Disposition": f'attachment; filename="orders.{file_format}"'},
+    )
+
+
+@orders_router.get("/items/export", status_code=status.HTTP_200_OK, dependencies=[Depends(admin_checker)])
+async def export_order_items(
+        order_filter: OrderFilter = FilterDepends(OrderFilter),
+        file_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+):
+    """
+    Exportar itens de pedidos em stream (NDJSON ou CSV), filtrados pelos pedidos.
+    """
+    return StreamingResponse(
+        ExportService.export_order_items(order_filter, file_format),
+        media_type=EXPORT_MEDIA_TYPES[file_format],
+        headers={"Content-Disposition": f'attachment; filename="order_items.{file_format}"'},
+    )
+
+
+@orders_router.get(
+    "/stats",
+    response_model=OrderStatsModel,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(admin_checker)],
+)
+async def order_stats(
+        start: date | None = Query(None, description="Data inicial (padrão: 30 dias atrás)"),
+        end: date | None = Query(None, description="Data final (padrão: hoje)"),
+        session: AsyncSession = Depends(get_read_session),
+):
+    """
+    Vendas agregadas por dia (pedidos, itens e faturamento) no período.
+    """
+    return await OrderService.get_stats(session, start, end)
 
 
 @orders_router.post(
@@ -49,7 +116,7 @@ async def create_order(
 @orders_router.get(
     "/{order_id}", response_model=OrderBaseModel, status_code=status.HTTP_200_OK
 )
-async def get_order(order_id: UUID, session: AsyncSession = Depends(get_session)):
+async def get_order(order_id: UUID, session: AsyncSession = Depends(get_read_session)):
     """
     Obter pedido por ID.
     """
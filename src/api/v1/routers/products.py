@@ -1,19 +1,24 @@
+from typing import Literal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Request, status
 from fastapi_filter import FilterDepends
-from fastapi_pagination import Page
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.auth.security import RoleChecker
-from src.db.database import get_session
+from src.core.responses import ORJSONResponse
+from src.db.database import get_read_session, get_session
+from src.exceptions.errors import ErrorResponse
 from src.filters.products import ProductFilter
+from src.schemas.pagination import CountMode, CountedPage, CursorPage
 from src.schemas.products import (
     ProductOutModel,
     ProductCreateModel,
     ProductUpdateModel,
-    ProductBaseModel
+    ProductBaseModel,
+    ProductImportReportModel
 )
+from src.services.product_import import ProductImportService
 from src.services.products import ProductService
 
 role_checker = RoleChecker(["admin", "customer"])
@@ -23,15 +28,39 @@ products_router = APIRouter(
 )
 
 
-@products_router.get("/", response_model=Page[ProductBaseModel], status_code=status.HTTP_200_OK)
+def _page_response(page: dict | None) -> ORJSONResponse:
+    """
+    Serializa a página com orjson. Essas rotas não passam pela validação do response_model,
+    então uma falha no serviço (que devolve None) precisa virar erro aqui, não um 200 com null.
+    """
+    if page is None:
+        raise ErrorResponse(message="Erro ao listar produtos")
+    return ORJSONResponse(page)
+
+
+@products_router.get("/", response_model=CountedPage[ProductBaseModel], status_code=status.HTTP_200_OK)
 async def list_products(
-        session: AsyncSession = Depends(get_session),
+        session: AsyncSession = Depends(get_read_session),
         product_filter: ProductFilter = FilterDepends(ProductFilter),
+        count: CountMode = Query("exact", description="exact: count(*); estimate: estimativa ou contagem em cache"),
 ):
     """
     Listar produtos com filtros e paginação.
     """
-    return await ProductService.list_products(session, product_filter)
+    return _page_response(await ProductService.list_products(session, product_filter, count))
+
+
+@products_router.get("/cursor", response_model=CursorPage[ProductBaseModel], status_code=status.HTTP_200_OK)
+async def list_products_by_cursor(
+        session: AsyncSession = Depends(get_read_session),
+        product_filter: ProductFilter = FilterDepends(ProductFilter),
+        cursor: str | None = Query(None, description="Cursor retornado pela página anterior"),
+        size: int = Query(50, ge=1, le=100, description="Tamanho da página"),
+):
+    """
+    Listar produtos com paginação por cursor (keyset).
+    """
+    return _page_response(await ProductService.list_products_by_cursor(session, product_filter, cursor, size))
 
 
 @products_router.post(
@@ -46,10 +75,40 @@ async def create_product(
     return await ProductService.create_product(session, product_data)
 
 
+@products_router.get("/search", response_model=CountedPage[ProductBaseModel], status_code=status.HTTP_200_OK)
+async def search_products(
+        q: str = Query(..., min_length=2, description="Texto a buscar no título, marca e descrição"),
+        session: AsyncSession = Depends(get_read_session),
+        product_filter: ProductFilter = FilterDepends(ProductFilter),
+        count: CountMode = Query("exact", description="exact: count(*); estimate: contagem em cache"),
+):
+    """
+    Buscar produtos por relevância (busca textual com tolerância a erros de digitação).
+    """
+    return _page_response(await ProductService.search_products(session, q, product_filter, count))
+
+
+@products_router.post(
+    "/import", response_model=ProductImportReportModel, status_code=status.HTTP_200_OK
+)
+async def import_products(
+        request: Request,
+        file_format: Literal["csv", "ndjson"] = Query("csv", alias="format", description="Formato do corpo"),
+        session: AsyncSession = Depends(get_session),
+):
+    """
+    Importar produtos em massa a partir do corpo da requisição (CSV ou NDJSON).
+
+    Produtos com o mesmo código de barras são atualizados. No CSV, `categories` usa `;`
+    e `images` usa `|` como separador. Retorna o relatório de erros por linha.
+    """
+    return await ProductImportService.import_products(session, request.stream(), file_format)
+
+
 @products_router.get(
     "/{product_id}", response_model=ProductOutModel, status_code=status.HTTP_200_OK
 )
-async def get_product(product_id: UUID, session: AsyncSession = Depends(get_session)):
+async def get_product(product_id: UUID, session: AsyncSession = Depends(get_read_session)):
     """
     Obter produto por ID.
     """
@@ -60,7 +119,7 @@ async def get_product(product_id: UUID, session: AsyncSession = Depends(get_sess
     "/{product_id}", response_model=ProductOutModel, status_code=status.HTTP_200_OK
 )
 async def update_product(
-        product_id: int,
+        product_id: UUID,
         product: ProductUpdateModel,
         session: AsyncSession = Depends(get_session)
 ):
@@ -0,0 +1,96 @@
+import time
+from collections import OrderedDict
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+from redis.exceptions import RedisError
+
+from src.core.logger import logger
+from src.core.settings import settings
+from src.db.redis import redis_client
+
+
+class Principal(BaseModel):
+    """
+    Authenticated user as seen by the permission checks.
+    """
+    uid: UUID
+    email: str
+    role: str
+    is_verified: bool
+    is_active: bool
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class PrincipalCache:
+    """
+    Short-lived cache of principals keyed by e-mail.
+
+    Entries live in a per-process LRU with TTL and, optionally, in Redis so that
+    workers share lookups. Writes that touch a user must call `invalidate`.
+    """
+    _entries: "OrderedDict[str, tuple[float, Principal]]" = OrderedDict()
+
+    @classmethod
+    def _redis_key(cls, email: str) -> str:
+        return f"principal:{email}"
+
+    @classmethod
+    async def get(cls, email: str) -> Principal | None:
+        entry = cls._entries.get(email)
+        if entry is not None:
+            expires_at, principal = entry
+            if expires_at > time.monotonic():
+                cls._entries.move_to_end(email)
+                return principal
+            cls._entries.pop(email, None)
+
+        if not settings.auth.PRINCIPAL_CACHE_REDIS:
+            return None
+
+        try:
+            payload = await redis_client.get(cls._redis_key(email))
+        except RedisError as e:
+            logger.warning(f"Falha ao ler cache de usuário: {e}")
+            return None
+        if payload is None:
+            return None
+
+        principal = Principal.model_validate_json(payload)
+        cls._store_local(principal)
+        return principal
+
+    @classmethod
+    async def set(cls, principal: Principal) -> None:
+        cls._store_local(principal)
+        if not settings.auth.PRINCIPAL_CACHE_REDIS:
+            return
+        try:
+            await redis_client.set(
+                cls._redis_key(principal.email),
+                principal.model_dump_json(),
+                ex=settings.auth.PRINCIPAL_CACHE_TTL
+            )
+        except RedisError as e:
+            logger.warning(f"Falha ao gravar cache de usuário: {e}")
+
+    @classmethod
+    async def invalidate(cls, *emails: str | None) -> None:
+        emails = [email for email in emails if email]
+        for email in emails:
+            cls._entries.pop(email, None)
+
+        if not emails or not settings.auth.PRINCIPAL_CACHE_REDIS:
+            return
+        try:
+            await redis_client.delete(*[cls._redis_key(email) for email in emails])
+        except RedisError as e:
+            logger.warning(f"Falha ao invalidar cache de usuário: {e}")
+
+    @classmethod
+    def _store_local(cls, principal: Principal) -> None:
+        cls._entries[principal.email] = (time.monotonic() + settings.auth.PRINCIPAL_CACHE_TTL, principal)
+        cls._entries.move_to_end(principal.email)
+        while len(cls._entries) > settings.auth.PRINCIPAL_CACHE_MAXSIZE:
+            cls._entries.popitem(last=False)
@@ -2,7 +2,7 @@ from fastapi import Request
 from fastapi.security import HTTPBearer
 from fastapi.security.http import HTTPAuthorizationCredentials
 
-from src.db.redis import token_in_blocklist
+from src.auth.revocation import RevocationRegistry
 from src.exceptions.errors import (
     InvalidTokenError, AccessTokenRequiredError, RefreshTokenRequiredError,
 )
@@ -21,7 +21,7 @@ class JWTBearer(HTTPBearer):
         if not self.token_valid(token_data):
             raise InvalidTokenError()
 
-        if await token_in_blocklist(token_data["jti"]):
+        if await RevocationRegistry.is_revoked(token_data["jti"]):
             raise InvalidTokenError()
 
         self.verify_token(token_data)
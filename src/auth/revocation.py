@@ -0,0 +1,141 @@
+import asyncio
+import time
+
+from redis.exceptions import RedisError
+
+from src.core.logger import logger
+from src.core.metrics import REVOCATION_CHECKS, REVOCATION_MIRROR_SIZE, REVOCATION_MIRROR_SYNCED
+from src.core.settings import settings
+from src.db.redis import (
+    backfill_revoked_jtis,
+    redis_client,
+    revoked_jtis,
+    token_in_blocklist,
+    REVOKED_JTIS_CHANNEL,
+)
+
+
+class RevocationRegistry:
+    """
+    In-process mirror of the JWT blocklist.
+
+    Each worker keeps the revoked JTIs (with their expiry) in a bounded dict that is
+    bootstrapped from Redis and kept in sync through pub/sub. While the mirror is in
+    sync, a JTI missing from it is known not to be revoked and Redis is not consulted;
+    a local hit is still confirmed against Redis. Whenever the mirror may be stale
+    (not started, subscription lost, capacity exceeded) every check goes to Redis.
+    """
+    _revoked: dict[str, float] = {}
+    _synced: bool = False
+    _saturated: bool = False
+    _task: asyncio.Task | None = None
+    _counters: dict[str, int] = {"hits": 0, "misses": 0, "confirmed": 0, "fallbacks": 0}
+
+    @classmethod
+    async def is_revoked(cls, jti: str) -> bool:
+        if not cls._synced or cls._saturated:
+            cls._count("fallbacks", "fallback")
+            return await token_in_blocklist(jti)
+
+        expires_at = cls._revoked.get(jti)
+        if expires_at is None or expires_at <= time.time():
+            cls._count("misses", "miss")
+            return False
+
+        cls._count("hits", "hit")
+        revoked = await token_in_blocklist(jti)
+        if revoked:
+            cls._count("confirmed", "confirmed")
+        return revoked
+
+    @classmethod
+    def _count(cls, counter: str, result: str) -> None:
+        cls._counters[counter] += 1
+        REVOCATION_CHECKS.labels(result=result).inc()
+
+    @classmethod
+    def _report_state(cls) -> None:
+        REVOCATION_MIRROR_SIZE.set(len(cls._revoked))
+        REVOCATION_MIRROR_SYNCED.set(int(cls._synced and not cls._saturated))
+
+    @classmethod
+    def stats(cls) -> dict:
+        return {
+            **cls._counters,
+            "size": len(cls._revoked),
+            "synced": cls._synced,
+            "saturated": cls._saturated,
+        }
+
+    @classmethod
+    async def start(cls) -> None:
+        if settings.redis.REVOCATION_CACHE_ENABLED and cls._task is None:
+            cls._task = asyncio.create_task(cls._run())
+
+    @classmethod
+    async def stop(cls) -> None:
+        if cls._task is not None:
+            cls._task.cancel()
+            try:
+                await cls._task
+            except asyncio.CancelledError:
+                pass
+            cls._task = None
+        cls._synced = False
+        cls._report_state()
+
+    @classmethod
+    def _add(cls, jti: str, expires_at: float) -> None:
+        if jti not in cls._revoked and len(cls._revoked) >= settings.redis.REVOCATION_CACHE_MAXSIZE:
+            cls._purge()
+            if len(cls._revoked) >= settings.redis.REVOCATION_CACHE_MAXSIZE:
+                if not cls._saturated:
+                    logger.warning("Espelho local da blocklist cheio; consultando o Redis em todas as requisições.")
+                cls._saturated = True
+                cls._report_state()
+                return
+        cls._revoked[jti] = expires_at
+        cls._report_state()
+
+    @classmethod
+    def _purge(cls) -> None:
+        now = time.time()
+        cls._revoked = {jti: expires_at for jti, expires_at in cls._revoked.items() if expires_at > now}
+        if len(cls._revoked) < settings.redis.REVOCATION_CACHE_MAXSIZE:
+            cls._saturated = False
+        cls._report_state()
+
+    @classmethod
+    async def _run(cls) -> None:
+        while True:
+            pubsub = redis_client.pubsub()
+            try:
+                # Subscribe before bootstrapping so no revocation falls in between.
+                await pubsub.subscribe(REVOKED_JTIS_CHANNEL)
+                # JTIs revoked before the zset existed live only in their own keys.
+                await backfill_revoked_jtis()
+                cls._revoked, cls._saturated = {}, False
+                for jti, expires_at in await revoked_jtis():
+                    cls._add(jti, expires_at)
+                cls._synced = True
+                cls._report_state()
+
+                last_purge = time.monotonic()
+                while True:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if message is not None:
+                        jti, expires_at = message["data"].decode().rsplit(":", 1)
+                        cls._add(jti, float(expires_at))
+                    if time.monotonic() - last_purge > 60:
+                        cls._purge()
+                        last_purge = time.monotonic()
+
+            except asyncio.CancelledError:
+                raise
+            except (RedisError, ValueError) as e:
+                cls._synced = False
+                cls._report_state()
+                logger.warning(f"Sincronização da blocklist interrompida: {e}")
+                await asyncio.sleep(5)
+            finally:
+                await pubsub.aclose()
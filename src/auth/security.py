@@ -3,10 +3,10 @@ from typing import List, Any
 from fastapi import Depends
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from src.auth.cache import Principal, PrincipalCache
 from src.auth.dependencies import AccessTokenBearer
 from src.db.database import get_session
 from src.exceptions.errors import InsufficientPermissionError, AccountNotVerifiedError, InvalidTokenError, UserNotFoundError
-from src.models.customer import Customer
 from src.services.accounts import UserService
 
 
@@ -19,9 +19,12 @@ async def get_current_user(
         if not user_email:
             raise InvalidTokenError("Token inválido ou expirado.")
 
-        user = await UserService.get_user_by_email(user_email, session)
-        if not user:
-            raise UserNotFoundError("Usuário não encontrado.")
+        user = await PrincipalCache.get(user_email)
+        if user is None:
+            user = await UserService.get_principal_by_email(user_email, session)
+            if not user:
+                raise UserNotFoundError("Usuário não encontrado.")
+            await PrincipalCache.set(user)
 
         if not user.is_verified:
             raise AccountNotVerifiedError("Usuário não verificado.")
@@ -35,7 +38,7 @@ class RoleChecker:
     def __init__(self, allowed_roles: List[str]) -> None:
         self.allowed_roles = allowed_roles
 
-    def __call__(self, current_user: Customer = Depends(get_current_user)) -> Any:
+    def __call__(self, current_user: Principal = Depends(get_current_user)) -> Any:
         if not current_user.is_verified:
             raise AccountNotVerifiedError()
         if current_user.role in self.allowed_roles:
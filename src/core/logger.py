@@ -1,13 +1,38 @@
+import atexit
+import json
 import logging
 import os
-from logging.handlers import TimedRotatingFileHandler
+import queue
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 
 from src.core.settings import settings
 
 
+class JsonFormatter(logging.Formatter):
+    """
+    One JSON object per line; fields passed as `extra={"fields": {...}}` are merged in.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        payload.update(getattr(record, "fields", {}))
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        return json.dumps(payload, default=str)
+
+
 class Logger:
+    # Os handlers de arquivo rodam em threads de QueueListener; o event loop só enfileira.
+    _listeners: list[QueueListener] = []
+
     @staticmethod
-    def get_logger(filename: str = "", name: str = ""):
+    def get_logger(filename: str = "", name: str = "", json_format: bool = False, level: int = None):
         # Get directory
         parent_directory = os.path.dirname(filename)
         parent_directory = os.path.join(settings.logs.LOGS_DIR, parent_directory)
@@ -19,22 +44,43 @@ class Logger:
         log_file_name = os.path.join(
             parent_directory, os.path.basename(filename) + ".log"
         )
-        logging_level = settings.logs.LOGGING_LEVEL
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        )
+        logging_level = settings.logs.LOGGING_LEVEL if level is None else level
+        if json_format:
+            formatter = JsonFormatter()
+        else:
+            formatter = logging.Formatter(
+                "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+            )
         logger = logging.getLogger(name)
 
-        # Add Time Rotating File Handler
+        # Add Time Rotating File Handler, fed through a queue
         handler = TimedRotatingFileHandler(
             filename=log_file_name, when="midnight", interval=1, backupCount=30
         )
         handler.suffix = "%Y-%m-%d"
         handler.setFormatter(formatter)
-        logger.addHandler(handler)
+
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, handler, respect_handler_level=True)
+        listener.start()
+        Logger._listeners.append(listener)
+
+        logger.addHandler(QueueHandler(log_queue))
         logger.setLevel(logging_level)
 
         return logger
 
+    @staticmethod
+    def stop_listeners():
+        """
+        Flush pending records and stop the writer threads.
+        """
+        while Logger._listeners:
+            Logger._listeners.pop().stop()
+
+
+atexit.register(Logger.stop_listeners)
 
 logger = Logger.get_logger(__name__)
+access_logger = Logger.get_logger("access", name="access", json_format=True, level=logging.INFO)
+access_logger.propagate = False
@@ -1,8 +1,11 @@
 from pathlib import Path
 
+from fastapi import BackgroundTasks
 from fastapi_mail import ConnectionConfig
 from fastapi_mail import FastMail, MessageSchema, MessageType
 
+from src.core.logger import logger
+from src.core.metrics import EMAIL_QUEUE_DEPTH, EMAIL_SEND_FAILURES
 from src.core.settings import settings
 
 BASE_DIR = Path(__file__).resolve().parent
@@ -31,3 +34,22 @@ async def send_email(email: str, subject: str, template_body: dict):
         subtype=MessageType.html
     )
     await mail.send_message(message)
+
+
+def enqueue_email(background_tasks: BackgroundTasks, email: str, subject: str, template_body: dict):
+    """
+    Schedule an email as a background task, tracking it in the email_queue_depth gauge.
+    """
+    EMAIL_QUEUE_DEPTH.inc()
+    background_tasks.add_task(_send_queued_email, email=email, subject=subject, template_body=template_body)
+
+
+async def _send_queued_email(email: str, subject: str, template_body: dict):
+    try:
+        await send_email(email=email, subject=subject, template_body=template_body)
+    except Exception as e:
+        EMAIL_SEND_FAILURES.inc()
+        logger.error(f"Erro ao enviar e-mail para {email}: {e}")
+        raise
+    finally:
+        EMAIL_QUEUE_DEPTH.dec()
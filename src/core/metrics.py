@@ -0,0 +1,96 @@
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    REGISTRY,
+    generate_latest,
+    multiprocess,
+)
+
+# Com vários workers do uvicorn, defina PROMETHEUS_MULTIPROC_DIR (um diretório vazio a cada
+# deploy): cada processo grava suas métricas ali e o /metrics agrega todos eles.
+MULTIPROCESS_ENABLED = "PROMETHEUS_MULTIPROC_DIR" in os.environ
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "Requisições HTTP concluídas.",
+    ["method", "route", "status"],
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Latência das requisições HTTP.",
+    ["method", "route"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "Requisições HTTP em andamento.",
+    multiprocess_mode="livesum",
+)
+
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_connections_checked_out",
+    "Conexões do pool em uso.",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Tempo de espera por uma conexão livre no pool.",
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 30),
+)
+DB_POOL_TIMEOUTS = Counter(
+    "db_pool_checkout_timeouts_total",
+    "Checkouts que estouraram o pool_timeout.",
+)
+
+REDIS_COMMAND_DURATION = Histogram(
+    "redis_command_duration_seconds",
+    "Latência dos comandos Redis.",
+    ["command"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5, 1),
+)
+
+EMAIL_QUEUE_DEPTH = Gauge(
+    "email_queue_depth",
+    "E-mails agendados em background e ainda não enviados.",
+    multiprocess_mode="livesum",
+)
+EMAIL_SEND_FAILURES = Counter(
+    "email_send_failures_total",
+    "E-mails em background que falharam no envio.",
+)
+
+REVOCATION_CHECKS = Counter(
+    "jwt_revocation_checks_total",
+    "Consultas à blocklist de JWT por resultado no espelho local (hit, miss, confirmed, fallback).",
+    ["result"],
+)
+REVOCATION_MIRROR_SIZE = Gauge(
+    "jwt_revocation_mirror_size",
+    "JTIs revogados no espelho local da blocklist.",
+    multiprocess_mode="livemax",
+)
+REVOCATION_MIRROR_SYNCED = Gauge(
+    "jwt_revocation_mirror_synced",
+    "1 enquanto o espelho local está sincronizado e abaixo da capacidade.",
+    multiprocess_mode="livemin",
+)
+
+
+def render_metrics() -> tuple[bytes, str]:
+    if MULTIPROCESS_ENABLED:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead() -> None:
+    if MULTIPROCESS_ENABLED:
+        multiprocess.mark_process_dead(os.getpid())
@@ -1,27 +1,109 @@
 import logging
 import time
+from uuid import uuid4
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.requests import Request
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.logger import access_logger, logger as app_logger
+from src.core.metrics import HTTP_REQUEST_DURATION, HTTP_REQUESTS, HTTP_REQUESTS_IN_FLIGHT
+from src.core.settings import settings
+from src.db.query_stats import start_query_stats
 
 logger = logging.getLogger("uvicorn.access")
 logger.disabled = True
 
 
-def register_middleware(app: FastAPI):
-    @app.middleware("http")
-    async def custom_logging(request: Request, call_next):
-        start_time = time.time()
+class AccessLogMiddleware:
+    """
+    Pure ASGI access log: one JSON record per request with the route template, status,
+    latency, response size, SQL statement count and a request id (X-Request-ID).
+
+    Unlike @app.middleware("http") it does not wrap the app in an extra task nor buffer
+    streaming responses, and the record is only enqueued; the file is written by the
+    QueueListener thread.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        request_id = self._header(scope, b"x-request-id") or uuid4().hex
+        scope.setdefault("state", {})["request_id"] = request_id
+        query_stats = start_query_stats(track_shapes=settings.app.SQL_N_PLUS_ONE_DETECTION)
+        status_code = 500
+        response_bytes = 0
 
-        response = await call_next(request)
-        processing_time = time.time() - start_time
-        message = f"{request.client.host}:{request.client.port} - {request.method} - {request.url.path} - {response.status_code} completed after {processing_time}s"
-        logging.info(message)
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, response_bytes
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers.append("X-Request-ID", request_id)
+                headers.append(
+                    "Server-Timing",
+                    f'db;dur={query_stats.duration * 1000:.2f};desc="{query_stats.count} queries", '
+                    f"app;dur={(time.perf_counter() - start_time) * 1000:.2f}",
+                )
+            elif message["type"] == "http.response.body":
+                response_bytes += len(message.get("body", b""))
+            await send(message)
 
-        return response
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            elapsed = time.perf_counter() - start_time
+            # Usa o template da rota (/products/{product_id}) para não explodir a cardinalidade.
+            route_path = getattr(scope.get("route"), "path", "unmatched")
+            HTTP_REQUESTS.labels(scope["method"], route_path, status_code).inc()
+            HTTP_REQUEST_DURATION.labels(scope["method"], route_path).observe(elapsed)
+            self._log(scope, request_id, route_path, status_code, elapsed, response_bytes, query_stats)
 
+    @staticmethod
+    def _header(scope: Scope, name: bytes) -> str | None:
+        for key, value in scope["headers"]:
+            if key == name:
+                return value.decode("latin-1")
+        return None
+
+    @staticmethod
+    def _log(scope, request_id, route_path, status_code, elapsed, response_bytes, query_stats) -> None:
+        client = scope.get("client")
+        access_logger.info(
+            "request",
+            extra={
+                "fields": {
+                    "request_id": request_id,
+                    "client": f"{client[0]}:{client[1]}" if client else None,
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "route": route_path,
+                    "status": status_code,
+                    "duration_ms": round(elapsed * 1000, 2),
+                    "response_bytes": response_bytes,
+                    "db_queries": query_stats.count,
+                    "db_duration_ms": round(query_stats.duration * 1000, 2),
+                }
+            },
+        )
+
+        for shape, times in query_stats.repeated_shapes(settings.app.SQL_N_PLUS_ONE_THRESHOLD):
+            app_logger.warning(
+                f"Possível N+1 em {scope['method']} {route_path} ({request_id}): {times}x {shape[:300]}"
+            )
+
+
+def register_middleware(app: FastAPI):
     app.add_middleware(
         CORSMiddleware,
         allow_origins=["*"],
@@ -34,3 +116,5 @@ def register_middleware(app: FastAPI):
         TrustedHostMiddleware,
         allowed_hosts=["localhost", "127.0.0.1", "bookly-api-dc03.onrender.com", "0.0.0.0"],
     )
+
+    app.add_middleware(AccessLogMiddleware)
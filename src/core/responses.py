@@ -0,0 +1,29 @@
+from typing import Any
+from uuid import UUID
+
+import orjson
+from fastapi.responses import JSONResponse
+
+# Datetimes sem fuso são tratados como UTC (como o validador ensure_utc dos schemas) e
+# serializados com "Z", igual ao pydantic.
+ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def _default(value: Any) -> Any:
+    # O asyncpg devolve sua própria subclasse de UUID, que o orjson não reconhece como uuid.UUID.
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def orjson_dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=_default, option=ORJSON_OPTIONS)
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response encoded with orjson; UUIDs and datetimes are serialized natively.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson_dumps(content)
@@ -1,4 +1,5 @@
 import logging
+from typing import Literal
 
 from dotenv import load_dotenv
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -11,6 +12,18 @@ class AppSettings(BaseSettings):
     APP_V1_PREFIX: str
     APP_PROTOCOL: str = "http"
     APP_PORT: int
+    IMPORT_CHUNK_SIZE: int = 500
+    IMPORT_MAX_REPORTED_ERRORS: int = 1000
+    EXPORT_YIELD_PER: int = 1000
+    SQL_QUERY_STATS_ENABLED: bool = True
+    # Modo dev/teste: avisa quando a mesma forma de SQL se repete na requisição (N+1).
+    SQL_N_PLUS_ONE_DETECTION: bool = False
+    SQL_N_PLUS_ONE_THRESHOLD: int = 3
+    # Exclusão lógica: DELETE de clientes/produtos/categorias só preenche deleted_at.
+    SOFT_DELETE_ENABLED: bool = False
+    # Linhas por dia em daily_sales; cada pedido soma em uma delas, ao acaso, para que
+    # checkouts concorrentes não disputem o lock da mesma linha.
+    DAILY_SALES_SHARDS: int = 16
 
 
 class AuthSettings(BaseSettings):
@@ -22,6 +35,9 @@ class AuthSettings(BaseSettings):
     REFRESH_TOKEN_EXPIRE_MINUTES: int
     ACCESS_TOKEN_EXPIRY: int
     REFRESH_TOKEN_EXPIRY: int
+    PRINCIPAL_CACHE_TTL: int = 30
+    PRINCIPAL_CACHE_MAXSIZE: int = 10_000
+    PRINCIPAL_CACHE_REDIS: bool = False
 
 
 class ProductionDBSettings(BaseSettings):
@@ -31,11 +47,30 @@ class ProductionDBSettings(BaseSettings):
     POSTGRES_HOST: str
     POSTGRES_PORT: int
     DATABASE_URL: str
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    DB_PGBOUNCER_TRANSACTION_MODE: bool = False
+    # URLs das réplicas de leitura separadas por vírgula; vazio = tudo no primário.
+    DATABASE_REPLICA_URLS: str = ""
+    DB_REPLICA_CONNECT_TIMEOUT: float = 2
+    DB_REPLICA_RETRY_AFTER: int = 30
+    # orders/order_products são particionadas por mês; partições futuras são criadas com antecedência.
+    DB_PARTITION_MONTHS_AHEAD: int = 3
+    DB_PARTITION_CHECK_INTERVAL: int = 6 * 60 * 60
 
 
 class SecuritySettings(BaseSettings):
     JWT_SECRET_KEY: str
     JWT_ALGORITHM: str
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_EXECUTOR: Literal["thread", "process"] = "thread"
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 64
+    PASSWORD_REHASH_ON_LOGIN: bool = True
 
 
 class WhatsAppSettings(BaseSettings):
@@ -55,6 +90,12 @@ class LoggingSettings(BaseSettings):
 class RedisSettings(BaseSettings):
     JTI_EXPIRY: int
     REDIS_URL: str = "redis://localhost:6379/0"
+    PRODUCT_CACHE_ENABLED: bool = True
+    PRODUCT_CACHE_TTL: int = 300
+    PRODUCT_LIST_CACHE_TTL: int = 60
+    REVOCATION_CACHE_ENABLED: bool = True
+    REVOCATION_CACHE_MAXSIZE: int = 100_000
+    COUNT_CACHE_TTL: int = 30
 
 
 class SentrySettings(BaseSettings):
@@ -1,5 +1,5 @@
 from src.models.address import Address # noqa: F401
 from src.models.category import ProductCategory, Category # noqa: F401
 from src.models.customer import Customer # noqa: F401
-from src.models.orders import Order, OrderProduct # noqa: F401
+from src.models.orders import DailySales, Order, OrderKey, OrderProduct # noqa: F401
 from src.models.product import Product # noqa: F401
@@ -0,0 +1,154 @@
+import hashlib
+import json
+from uuid import UUID
+
+import orjson
+from redis.exceptions import RedisError
+
+from src.core.logger import logger
+from src.core.responses import orjson_dumps
+from src.core.settings import settings
+from src.db.redis import redis_client
+
+
+class ProductCache:
+    """
+    Read-through cache of serialized products in Redis.
+
+    Keys live under versioned namespaces: invalidating a whole group (every list page,
+    or every detail after a category rename) is a single INCR instead of a SCAN.
+    """
+    DETAIL_NS = "products:ns:detail"
+    LIST_NS = "products:ns:list"
+
+    @classmethod
+    def _enabled(cls) -> bool:
+        return settings.redis.PRODUCT_CACHE_ENABLED
+
+    @classmethod
+    async def _version(cls, namespace: str) -> int:
+        version = await redis_client.get(namespace)
+        return int(version) if version else 0
+
+    @classmethod
+    async def _detail_key(cls, product_id: UUID) -> str:
+        version = await cls._version(cls.DETAIL_NS)
+        return f"products:v{version}:detail:{product_id}"
+
+    @classmethod
+    async def _list_key(cls, params: dict) -> str:
+        version = await cls._version(cls.LIST_NS)
+        digest = hashlib.sha1(
+            json.dumps(params, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        return f"products:v{version}:list:{digest}"
+
+    @classmethod
+    async def _get(cls, key_factory, *args) -> dict | None:
+        if not cls._enabled():
+            return None
+        try:
+            payload = await redis_client.get(await key_factory(*args))
+        except RedisError as e:
+            logger.warning(f"Falha ao ler cache de produtos: {e}")
+            return None
+
+        return orjson.loads(payload) if payload else None
+
+    @classmethod
+    async def _set(cls, key_factory, arg, payload: dict, ttl: int) -> None:
+        if not cls._enabled():
+            return
+        try:
+            await redis_client.set(await key_factory(arg), orjson_dumps(payload), ex=ttl)
+        except RedisError as e:
+            logger.warning(f"Falha ao gravar cache de produtos: {e}")
+
+    @classmethod
+    async def get_product(cls, product_id: UUID) -> dict | None:
+        return await cls._get(cls._detail_key, product_id)
+
+    @classmethod
+    async def set_product(cls, product_id: UUID, payload: dict) -> None:
+        await cls._set(cls._detail_key, product_id, payload, settings.redis.PRODUCT_CACHE_TTL)
+
+    @classmethod
+    async def get_list(cls, params: dict) -> dict | None:
+        return await cls._get(cls._list_key, params)
+
+    @classmethod
+    async def set_list(cls, params: dict, payload: dict) -> None:
+        await cls._set(cls._list_key, params, payload, settings.redis.PRODUCT_LIST_CACHE_TTL)
+
+    @classmethod
+    async def invalidate_product(cls, product_id: UUID | None = None) -> None:
+        """
+        Drops the cached detail of a product (if given) and every cached list page.
+        """
+        if not cls._enabled():
+            return
+        try:
+            if product_id is not None:
+                await redis_client.delete(await cls._detail_key(product_id))
+            await redis_client.incr(cls.LIST_NS)
+        except RedisError as e:
+            logger.warning(f"Falha ao invalidar cache de produtos: {e}")
+
+    @classmethod
+    async def invalidate_details(cls, product_ids) -> None:
+        """
+        Drops only the cached details, e.g. after a stock debit. List pages expire by TTL.
+        """
+        if not cls._enabled():
+            return
+        try:
+            version = await cls._version(cls.DETAIL_NS)
+            keys = [f"products:v{version}:detail:{product_id}" for product_id in product_ids]
+            if keys:
+                await redis_client.delete(*keys)
+        except RedisError as e:
+            logger.warning(f"Falha ao invalidar cache de produtos: {e}")
+
+    @classmethod
+    async def invalidate_categories(cls) -> None:
+        """
+        Category changes are embedded in every product payload, so both namespaces move.
+        """
+        if not cls._enabled():
+            return
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.incr(cls.DETAIL_NS)
+                pipe.incr(cls.LIST_NS)
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Falha ao invalidar cache de produtos: {e}")
+
+
+class CountCache:
+    """
+    Short-lived cache of filtered row counts used by the estimated pagination mode.
+    """
+
+    @classmethod
+    def _key(cls, table_name: str, params: dict) -> str:
+        digest = hashlib.sha1(
+            json.dumps(params, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        return f"counts:{table_name}:{digest}"
+
+    @classmethod
+    async def get(cls, table_name: str, params: dict) -> int | None:
+        try:
+            total = await redis_client.get(cls._key(table_name, params))
+        except RedisError as e:
+            logger.warning(f"Falha ao ler contagem em cache: {e}")
+            return None
+        return int(total) if total is not None else None
+
+    @classmethod
+    async def set(cls, table_name: str, params: dict, total: int) -> None:
+        try:
+            await redis_client.set(cls._key(table_name, params), total, ex=settings.redis.COUNT_CACHE_TTL)
+        except RedisError as e:
+            logger.warning(f"Falha ao gravar contagem em cache: {e}")
@@ -1,20 +1,161 @@
-from sqlalchemy.exc import ProgrammingError
+import asyncio
+import itertools
+import time
+from contextlib import asynccontextmanager
+from uuid import uuid4
+
+from sqlalchemy import event, text
+from sqlalchemy.exc import ProgrammingError, SQLAlchemyError, TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.core.settings import settings
 from src.core.logger import logger
+from src.core.metrics import DB_POOL_CHECKED_OUT, DB_POOL_TIMEOUTS, DB_POOL_WAIT
+from src.db.query_stats import install_query_instrumentation
+
+
+class PoolStats:
+    """
+    Checkout counters shared by every pool of the process (they survive pool recreation).
+    """
+    checkouts: int = 0
+    timeouts: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Queue pool that measures how long each checkout waits for a free connection.
+    """
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            PoolStats.timeouts += 1
+            DB_POOL_TIMEOUTS.inc()
+            raise
+        finally:
+            waited = time.perf_counter() - start
+            DB_POOL_WAIT.observe(waited)
+            PoolStats.checkouts += 1
+            PoolStats.wait_seconds_total += waited
+            PoolStats.wait_seconds_max = max(PoolStats.wait_seconds_max, waited)
+
+
+def track_checked_out(engine, pool_name: str) -> None:
+    gauge = DB_POOL_CHECKED_OUT.labels(pool=pool_name)
+    event.listen(engine.sync_engine, "checkout", lambda *args: gauge.inc())
+    event.listen(engine.sync_engine, "checkin", lambda *args: gauge.dec())
+
 
-async_engine = create_async_engine(settings.db.DATABASE_URL)
+def create_engine_from_settings(url: str, **extra_connect_args):
+    db = settings.db
+    connect_args = {"statement_cache_size": db.DB_STATEMENT_CACHE_SIZE}
+    if db.DB_PGBOUNCER_TRANSACTION_MODE:
+        # PgBouncer em modo transação não mantém prepared statements entre transações.
+        connect_args = {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        }
+    connect_args.update(extra_connect_args)
+
+    return create_async_engine(
+        url,
+        poolclass=InstrumentedQueuePool,
+        pool_size=db.DB_POOL_SIZE,
+        max_overflow=db.DB_MAX_OVERFLOW,
+        pool_timeout=db.DB_POOL_TIMEOUT,
+        pool_recycle=db.DB_POOL_RECYCLE,
+        pool_pre_ping=db.DB_POOL_PRE_PING,
+        connect_args=connect_args,
+    )
+
+
+async_engine = create_engine_from_settings(settings.db.DATABASE_URL)
 async_session = async_sessionmaker(bind=async_engine, expire_on_commit=False)
 
+replica_engines = [
+    create_engine_from_settings(url.strip(), timeout=settings.db.DB_REPLICA_CONNECT_TIMEOUT)
+    for url in settings.db.DATABASE_REPLICA_URLS.split(",")
+    if url.strip()
+]
+replica_sessions = [
+    async_sessionmaker(bind=engine, expire_on_commit=False) for engine in replica_engines
+]
+
+track_checked_out(async_engine, "primary")
+for index, engine in enumerate(replica_engines):
+    track_checked_out(engine, f"replica{index}")
+
+if settings.app.SQL_QUERY_STATS_ENABLED:
+    for engine in (async_engine, *replica_engines):
+        install_query_instrumentation(engine)
+
+
+class ReplicaRouter:
+    """
+    Escolhe a réplica de leitura em round-robin, pulando as que falharam recentemente.
+
+    Uma réplica que não aceita conexão fica fora da rotação por DB_REPLICA_RETRY_AFTER
+    segundos; sem réplicas saudáveis, as leituras vão para o primário.
+    """
+    _counter = itertools.count()
+    _down_until: dict[int, float] = {}
+
+    @classmethod
+    def candidates(cls) -> list[int]:
+        if not replica_sessions:
+            return []
+        start = next(cls._counter) % len(replica_sessions)
+        order = [(start + offset) % len(replica_sessions) for offset in range(len(replica_sessions))]
+        now = time.monotonic()
+        return [index for index in order if cls._down_until.get(index, 0) <= now]
+
+    @classmethod
+    def mark_down(cls, index: int) -> None:
+        cls._down_until[index] = time.monotonic() + settings.db.DB_REPLICA_RETRY_AFTER
+
+    @classmethod
+    def stats(cls) -> list[dict]:
+        now = time.monotonic()
+        return [
+            {
+                "replica": index,
+                "healthy": cls._down_until.get(index, 0) <= now,
+                "checked_out": engine.pool.checkedout(),
+            }
+            for index, engine in enumerate(replica_engines)
+        ]
+
+
+def get_pool_stats() -> dict:
+    pool = async_engine.pool
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "checkouts": PoolStats.checkouts,
+        "timeouts": PoolStats.timeouts,
+        "wait_seconds_total": round(PoolStats.wait_seconds_total, 6),
+        "wait_seconds_max": round(PoolStats.wait_seconds_max, 6),
+        "replicas": ReplicaRouter.stats(),
+    }
+
 
 async def init_db() -> None:
     try:
         import src.db.base # noqa: F401
         async with async_engine.begin() as conn:
             logger.info("Criando tabelas do banco de dados...")
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
             await conn.run_sync(SQLModel.metadata.create_all)
     except ProgrammingError as e:
         logger.error(f"Erro ao criar tabelas: {e}")
@@ -23,3 +164,33 @@ async def init_db() -> None:
 async def get_session() -> AsyncSession:
     async with async_session() as session:
         yield session
+
+
+@asynccontextmanager
+async def read_session():
+    """
+    Sessão somente leitura: uma réplica saudável ou, na falta dela, o primário.
+
+    Fluxos que precisam ler o que acabaram de gravar devem continuar usando o primário.
+    """
+    for index in ReplicaRouter.candidates():
+        session = replica_sessions[index]()
+        try:
+            await session.connection()
+        except (SQLAlchemyError, OSError, asyncio.TimeoutError) as e:
+            await session.close()
+            ReplicaRouter.mark_down(index)
+            logger.warning(f"Réplica de leitura {index} indisponível: {e}")
+            continue
+
+        async with session:
+            yield session
+        return
+
+    async with async_session() as session:
+        yield session
+
+
+async def get_read_session() -> AsyncSession:
+    async with read_session() as session:
+        yield session
@@ -0,0 +1,26 @@
+from datetime import datetime
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import SQLModel
+
+from src.core.settings import settings
+
+
+async def delete_row(session: AsyncSession, instance: SQLModel) -> None:
+    """
+    Exclui a linha de `instance` (clientes, produtos e categorias, todos com PK `uid`).
+
+    Com SOFT_DELETE_ENABLED só preenche deleted_at; as listagens filtram `deleted_at IS NULL`
+    e usam os índices parciais. Senão emite um único DELETE e as FKs ON DELETE CASCADE
+    removem os dependentes no banco, sem o ORM carregar as coleções (passive_deletes).
+    """
+    if settings.app.SOFT_DELETE_ENABLED:
+        instance.deleted_at = datetime.now()
+        return
+
+    model = type(instance)
+    await session.execute(
+        delete(model).where(model.uid == instance.uid),
+        execution_options={"synchronize_session": False},
+    )
@@ -0,0 +1,25 @@
+from typing import TypeVar
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import noload
+from sqlmodel import SQLModel
+
+ModelT = TypeVar("ModelT", bound=SQLModel)
+
+
+async def insert_unique(session: AsyncSession, model: type[ModelT], values: dict) -> ModelT | None:
+    """
+    INSERT ... ON CONFLICT DO NOTHING RETURNING em uma única ida ao banco.
+
+    Devolve a entidade criada ou None se alguma constraint única (ou a PK) já tinha o
+    valor. A unicidade fica com o banco, então não há SELECT prévio nem corrida entre
+    requisições concorrentes.
+
+    A linha acabou de ser criada, então nenhum relacionamento tem o que carregar: o
+    noload evita o SELECT extra dos relacionamentos `lazy="selectin"` (endereços do cliente).
+    """
+    statement = (
+        insert(model).values(**values).on_conflict_do_nothing().returning(model).options(noload("*"))
+    )
+    return await session.scalar(statement)
@@ -0,0 +1,104 @@
+import asyncio
+from datetime import date
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from src.core.logger import logger
+from src.core.settings import settings
+from src.db.database import async_engine
+
+# Tabelas particionadas por mês (RANGE) e a coluna de partição de cada uma.
+PARTITIONED_TABLES = {"orders": "created_at", "order_products": "order_created_at"}
+
+# Serializa a criação entre workers/instâncias que sobem ao mesmo tempo.
+_ADVISORY_LOCK_KEY = 7_305_202_506
+
+
+def month_start(day: date, offset: int = 0) -> date:
+    """Primeiro dia do mês de `day` deslocado `offset` meses."""
+    month = day.month - 1 + offset
+    return date(day.year + month // 12, month % 12 + 1, 1)
+
+
+def partition_name(table: str, start: date) -> str:
+    return f"{table}_p{start:%Y_%m}"
+
+
+async def ensure_partitions(conn: AsyncConnection, months_ahead: int, today: date | None = None) -> list[str]:
+    """
+    Cria as partições mensais do mês corrente até `months_ahead` meses à frente.
+
+    Idempotente: partições existentes são ignoradas, e tabelas que ainda não são
+    particionadas (migração pendente) são puladas. Devolve os nomes criados.
+    """
+    today = today or date.today()
+    await conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _ADVISORY_LOCK_KEY})
+
+    created = []
+    for table in PARTITIONED_TABLES:
+        partitioned = await conn.scalar(
+            text("SELECT EXISTS (SELECT 1 FROM pg_class WHERE oid = to_regclass(:table) AND relkind = 'p')"),
+            {"table": table},
+        )
+        if not partitioned:
+            continue
+
+        for offset in range(months_ahead + 1):
+            start, end = month_start(today, offset), month_start(today, offset + 1)
+            name = partition_name(table, start)
+            if await conn.scalar(text("SELECT to_regclass(:name)"), {"name": name}) is not None:
+                continue
+            await conn.execute(text(
+                f"CREATE TABLE {name} PARTITION OF {table} FOR VALUES FROM ('{start}') TO ('{end}')"
+            ))
+            created.append(name)
+    return created
+
+
+class PartitionMaintenance:
+    """
+    Garante partições futuras de orders/order_products.
+
+    Roda uma vez na subida (antes de aceitar pedidos) e depois a cada
+    DB_PARTITION_CHECK_INTERVAL segundos, para a virada do mês nunca encontrar a
+    partição faltando.
+    """
+    _task: asyncio.Task | None = None
+
+    @classmethod
+    async def run_once(cls) -> list[str]:
+        async with async_engine.begin() as conn:
+            created = await ensure_partitions(conn, settings.db.DB_PARTITION_MONTHS_AHEAD)
+        if created:
+            logger.info(f"Partições criadas: {', '.join(created)}")
+        return created
+
+    @classmethod
+    async def start(cls) -> None:
+        try:
+            await cls.run_once()
+        except SQLAlchemyError as e:
+            logger.error(f"Erro ao criar partições: {e}")
+        if cls._task is None:
+            cls._task = asyncio.create_task(cls._run())
+
+    @classmethod
+    async def stop(cls) -> None:
+        if cls._task is not None:
+            cls._task.cancel()
+            try:
+                await cls._task
+            except asyncio.CancelledError:
+                pass
+            cls._task = None
+
+    @classmethod
+    async def _run(cls) -> None:
+        while True:
+            await asyncio.sleep(settings.db.DB_PARTITION_CHECK_INTERVAL)
+            try:
+                await cls.run_once()
+            except SQLAlchemyError as e:
+                logger.error(f"Erro ao criar partições: {e}")
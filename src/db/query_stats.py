@@ -0,0 +1,70 @@
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+_PLACEHOLDER = re.compile(r"\$\d+|%\(\w+\)s|\?")
+_PLACEHOLDER_LIST = re.compile(r"\?(\s*,\s*\?)+")
+
+
+class QueryStats:
+    """
+    Statements executed while handling one request: how many, how long they took and,
+    when N+1 detection is on, how many times each statement shape was seen.
+    """
+
+    def __init__(self, track_shapes: bool = False):
+        self.count = 0
+        self.duration = 0.0
+        self.shapes: Counter[str] | None = Counter() if track_shapes else None
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        if self.shapes is not None:
+            self.shapes[statement_shape(statement)] += 1
+
+    def repeated_shapes(self, threshold: int) -> list[tuple[str, int]]:
+        if self.shapes is None:
+            return []
+        return [(shape, times) for shape, times in self.shapes.most_common() if times >= threshold]
+
+
+_query_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def statement_shape(statement: str) -> str:
+    """
+    Normalizes a statement so that executions differing only in parameters (including
+    the size of an expanded IN list) share the same shape.
+    """
+    shape = _PLACEHOLDER.sub("?", statement)
+    shape = _PLACEHOLDER_LIST.sub("?", shape)
+    return " ".join(shape.split())
+
+
+def start_query_stats(track_shapes: bool = False) -> QueryStats:
+    stats = QueryStats(track_shapes)
+    _query_stats.set(stats)
+    return stats
+
+
+def get_query_stats() -> QueryStats | None:
+    return _query_stats.get()
+
+
+def install_query_instrumentation(engine: AsyncEngine) -> None:
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        context._query_start_time = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        stats = _query_stats.get()
+        if stats is not None:
+            stats.record(statement, time.perf_counter() - context._query_start_time)
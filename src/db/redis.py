@@ -1,12 +1,97 @@
+import time
+
 import redis.asyncio as aioredis
+from redis.asyncio.client import Pipeline
 
+from src.core.metrics import REDIS_COMMAND_DURATION
 from src.core.settings import settings
 
-token_blocklist = aioredis.from_url(settings.redis.REDIS_URL)
+
+class InstrumentedPipeline(Pipeline):
+    async def execute(self, raise_on_error: bool = True):
+        with REDIS_COMMAND_DURATION.labels(command="PIPELINE").time():
+            return await super().execute(raise_on_error)
+
+
+class InstrumentedRedis(aioredis.Redis):
+    """
+    Redis client that records the latency of every command (and of each pipeline as a whole).
+    """
+
+    async def execute_command(self, *args, **options):
+        with REDIS_COMMAND_DURATION.labels(command=str(args[0]).upper()).time():
+            return await super().execute_command(*args, **options)
+
+    def pipeline(self, transaction: bool = True, shard_hint: str | None = None) -> InstrumentedPipeline:
+        return InstrumentedPipeline(self.connection_pool, self.response_callbacks, transaction, shard_hint)
+
+
+redis_client = InstrumentedRedis.from_url(settings.redis.REDIS_URL)
+token_blocklist = redis_client
+
+REVOKED_JTIS_KEY = "jti:revoked"
+REVOKED_JTIS_CHANNEL = "jti:revocations"
+REVOKED_JTIS_BACKFILLED_KEY = "jti:revoked:backfilled"
+# Before the zset, a revoked JTI was only its own key: the token's uuid4 with an empty value.
+LEGACY_JTI_PATTERN = "????????-????-????-????-????????????"
 
 
 async def add_jti_to_blocklist(jti: str) -> None:
-    await token_blocklist.set(name=jti, value="", ex=settings.redis.JTI_EXPIRY)
+    now = time.time()
+    async with token_blocklist.pipeline(transaction=False) as pipe:
+        pipe.set(name=jti, value="", ex=settings.redis.JTI_EXPIRY)
+        pipe.zadd(REVOKED_JTIS_KEY, {jti: now + settings.redis.JTI_EXPIRY})
+        pipe.zremrangebyscore(REVOKED_JTIS_KEY, "-inf", now)
+        pipe.publish(REVOKED_JTIS_CHANNEL, f"{jti}:{now + settings.redis.JTI_EXPIRY}")
+        await pipe.execute()
+
+
+async def revoked_jtis() -> list[tuple[str, float]]:
+    """
+    Returns every revoked JTI that has not expired yet, with its expiry timestamp.
+    """
+    entries = await token_blocklist.zrangebyscore(REVOKED_JTIS_KEY, time.time(), "+inf", withscores=True)
+    return [(jti.decode(), expires_at) for jti, expires_at in entries]
+
+
+async def backfill_revoked_jtis(batch_size: int = 500) -> int:
+    """
+    Copies the JTIs revoked before the zset existed into REVOKED_JTIS_KEY, with the expiry
+    derived from each key's TTL, so the local mirrors bootstrap them too. Runs once per
+    Redis (a marker key records it); ZADD is idempotent, so workers may race on it.
+    """
+    if await token_blocklist.exists(REVOKED_JTIS_BACKFILLED_KEY):
+        return 0
+
+    copied = 0
+    keys: list[bytes] = []
+
+    async def copy(batch: list[bytes]) -> int:
+        async with token_blocklist.pipeline(transaction=False) as pipe:
+            for key in batch:
+                pipe.get(key)
+                pipe.pttl(key)
+            replies = await pipe.execute()
+        now = time.time()
+        revoked = {
+            key.decode(): now + ttl / 1000
+            for key, value, ttl in zip(batch, replies[::2], replies[1::2])
+            if value == b"" and ttl > 0
+        }
+        if revoked:
+            await token_blocklist.zadd(REVOKED_JTIS_KEY, revoked)
+        return len(revoked)
+
+    async for key in token_blocklist.scan_iter(match=LEGACY_JTI_PATTERN, count=batch_size):
+        keys.append(key)
+        if len(keys) >= batch_size:
+            copied += await copy(keys)
+            keys = []
+    if keys:
+        copied += await copy(keys)
+
+    await token_blocklist.set(REVOKED_JTIS_BACKFILLED_KEY, str(copied))
+    return copied
 
 
 async def token_in_blocklist(jti: str) -> bool:
@@ -124,6 +124,38 @@ class CategoryAlreadyExistsError(BaseExceptionError):
         super().__init__(self.message)
 
 
+class InsufficientStockError(BaseExceptionError):
+    """One or more products do not have enough stock"""
+
+    def __init__(self, message="Insufficient stock"):
+        self.message = message
+        super().__init__(self.message)
+
+
+class InvalidCursorError(BaseExceptionError):
+    """Pagination cursor is malformed"""
+
+    def __init__(self, message="Invalid cursor"):
+        self.message = message
+        super().__init__(self.message)
+
+
+class PasswordHashingBusyError(BaseExceptionError):
+    """Too many password hashing operations are queued"""
+
+    def __init__(self, message="Server busy, try again later"):
+        self.message = message
+        super().__init__(self.message)
+
+
+class ProductInUseError(BaseExceptionError):
+    """Product is referenced by existing orders"""
+
+    def __init__(self, message="Product has orders and cannot be deleted"):
+        self.message = message
+        super().__init__(self.message)
+
+
 class ErrorResponse(BaseExceptionError):
     """Erro genérico de resposta"""
 
@@ -249,6 +281,30 @@ def register_all_errors(app: FastAPI):
             initial_detail={"message": "Product not found", "error_code": "product_not_found"}
         ),
     )
+    app.add_exception_handler(
+        InvalidCursorError, create_exception_handler(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            initial_detail={"message": "Cursor inválido", "error_code": "invalid_cursor"}
+        ),
+    )
+    app.add_exception_handler(
+        PasswordHashingBusyError, create_exception_handler(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            initial_detail={"message": "Servidor ocupado, tente novamente", "error_code": "password_hashing_busy"}
+        ),
+    )
+    app.add_exception_handler(
+        InsufficientStockError, create_exception_handler(
+            status_code=status.HTTP_409_CONFLICT,
+            initial_detail={"message": "Estoque insuficiente", "error_code": "insufficient_stock"}
+        ),
+    )
+    app.add_exception_handler(
+        ProductInUseError, create_exception_handler(
+            status_code=status.HTTP_409_CONFLICT,
+            initial_detail={"message": "Produto possui pedidos", "error_code": "product_in_use"}
+        ),
+    )
 
     @app.exception_handler(500)
     async def internal_server_error(request, exc):
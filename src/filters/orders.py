@@ -1,25 +1,66 @@
-from datetime import date
+from datetime import date, timedelta
 from typing import Optional
+from uuid import UUID
 
 from fastapi_filter.contrib.sqlalchemy import Filter
+from sqlalchemy import select
 
-from src.models.orders import Order, OrderStatusEnum
+from src.models.orders import Order, OrderKey, OrderProduct, OrderStatusEnum
+from src.models.product import Product
+
+
+def order_created_at(order_id: UUID):
+    """
+    created_at (a chave de partição) do pedido, lido de order_keys. Comparado com a coluna
+    particionada, faz a busca por uid visitar só a partição do pedido.
+    """
+    return select(OrderKey.created_at).where(OrderKey.uid == order_id).scalar_subquery()
 
 
 class OrderFilter(Filter):
     class Constants(Filter.Constants):
         model = Order
-        ordering_field_name = "created_at"
+        ordering_field_name = "order_by"
 
-    uid: Optional[str] = None
-    customer_id: Optional[int] = None
-    order_id: Optional[int] = None
+    uid: Optional[UUID] = None
+    customer_id: Optional[UUID] = None
     status: Optional[OrderStatusEnum] = None
     section: Optional[str] = None
     created_at__ge: Optional[date] = None
     created_at__le: Optional[date] = None
+    order_by: Optional[list[str]] = ["-created_at"]
 
     def apply_filters(self, query):
-        if hasattr(self, "status") and self.status:
-            query = query.filter(Order.status == self.status)
+        """
+        Aplica todos os filtros como predicados SQL (sem ordenação).
+        """
+        if self.uid:
+            query = query.where(Order.uid == self.uid, Order.created_at == order_created_at(self.uid))
+        if self.customer_id:
+            query = query.where(Order.customer_id == self.customer_id)
+        if self.status:
+            query = query.where(Order.status == self.status)
+        query = query.where(*self.created_at_predicates(Order.created_at))
+        if self.section:
+            # Pedidos com ao menos um item da seção, via EXISTS (sem duplicar linhas com JOIN).
+            query = query.where(
+                Order.products.any(OrderProduct.product.has(Product.section == self.section))
+            )
         return query
+
+    def created_at_predicates(self, column) -> list:
+        """
+        Intervalo de datas sobre `column` (a chave de partição), em comparações simples
+        que o PostgreSQL usa para descartar as partições mensais fora do período.
+        """
+        predicates = []
+        if self.created_at__ge:
+            predicates.append(column >= self.created_at__ge)
+        if self.created_at__le:
+            # Data inclusiva: considera o dia inteiro informado.
+            predicates.append(column < self.created_at__le + timedelta(days=1))
+        return predicates
+
+    def sort(self, query):
+        # uid desempata pedidos com o mesmo created_at e mantém a paginação estável.
+        return super().sort(query).order_by(Order.uid)
@@ -2,7 +2,11 @@ from typing import Optional
 from uuid import UUID
 
 from fastapi_filter.contrib.sqlalchemy import Filter
+from sqlalchemy import and_
 
+from src.filters.orders import order_created_at
+from src.models.category import Category, ProductCategory
+from src.models.orders import OrderProduct
 from src.models.product import Product
 
 
@@ -10,12 +14,50 @@ class ProductFilter(Filter):
     class Constants(Filter.Constants):
         model = Product
         ordering_field_name = "uid"
+        relationship_fields = (
+            "categories__name__ilike",
+            "order_products__order_id__eq",
+            "order_products__quantity__ge",
+        )
 
-    titulo__ilike: Optional[str] = None
-    preco__ge: Optional[float] = None
-    preco__le: Optional[float] = None
-    estoque__ge: Optional[int] = None
+    title__ilike: Optional[str] = None
+    price__gte: Optional[float] = None
+    price__lte: Optional[float] = None
+    stock__gte: Optional[int] = None
     is_published: Optional[bool] = None
     categories__name__ilike: Optional[str] = None
     order_products__order_id__eq: Optional[UUID] = None
     order_products__quantity__ge: Optional[int] = None
+
+    @property
+    def filtering_fields(self):
+        fields = dict(super().filtering_fields)
+        for field_name in self.Constants.relationship_fields:
+            fields.pop(field_name, None)
+        return fields.items()
+
+    def filter(self, query):
+        query = super().filter(query)
+
+        if self.categories__name__ilike:
+            name = self.categories__name__ilike
+            name = name if "%" in name else f"%{name}%"
+            query = query.where(
+                Product.categories.any(
+                    ProductCategory.category.has(and_(Category.name.ilike(name), Category.deleted_at.is_(None)))
+                )
+            )
+
+        order_filters = []
+        if self.order_products__order_id__eq:
+            order_id = self.order_products__order_id__eq
+            order_filters.extend([
+                OrderProduct.order_id == order_id,
+                OrderProduct.order_created_at == order_created_at(order_id),
+            ])
+        if self.order_products__quantity__ge is not None:
+            order_filters.append(OrderProduct.quantity >= self.order_products__quantity__ge)
+        if order_filters:
+            query = query.where(Product.order_products.any(*order_filters))
+
+        return query
@@ -3,6 +3,7 @@ from datetime import datetime
 from typing import Optional
 
 import sqlalchemy.dialects.postgresql as pg
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel, Relationship, Column
 
 
@@ -11,9 +12,10 @@ class Address(SQLModel, table=True):
     Address model for the database.
     """
     __tablename__ = "addresses"
+    __table_args__ = (Index("ix_addresses_customer_id", "customer_id"),)
 
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
-    customer_id: uuid.UUID = Field(foreign_key="customers.uid")
+    customer_id: uuid.UUID = Field(foreign_key="customers.uid", ondelete="CASCADE")
     address_type: str
     street: str
     city: str
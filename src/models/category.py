@@ -1,8 +1,10 @@
 import uuid
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 from typing import TYPE_CHECKING
 
 import sqlalchemy.dialects.postgresql as pg
+from sqlalchemy import Index, text
 from sqlmodel import SQLModel, Field, Relationship, Column
 
 if TYPE_CHECKING:
@@ -11,20 +13,27 @@ if TYPE_CHECKING:
 
 class Category(SQLModel, table=True):
     __tablename__ = "categories"
+    __table_args__ = (
+        Index("uq_categories_name", "name", unique=True, postgresql_where=text("deleted_at IS NULL")),
+    )
 
     uid: uuid.UUID = Field(
         sa_column=Column(pg.UUID, primary_key=True, default=uuid.uuid4)
     )
     name: str = Field(
-        sa_column=Column(pg.VARCHAR(length=100), nullable=False, unique=True)
+        sa_column=Column(pg.VARCHAR(length=100), nullable=False)
+    )
+    deleted_at: Optional[datetime] = Field(default=None, nullable=True)
+    products: List["ProductCategory"] = Relationship(
+        back_populates="category", sa_relationship_kwargs={"passive_deletes": True}
     )
-    products: List["ProductCategory"] = Relationship(back_populates="category")
 
 
 class ProductCategory(SQLModel, table=True):
     __tablename__ = "product_categories"
+    __table_args__ = (Index("ix_product_categories_category_id", "category_id"),)
 
-    product_id: uuid.UUID = Field(foreign_key="products.uid", primary_key=True)
-    category_id: uuid.UUID = Field(foreign_key="categories.uid", primary_key=True)
+    product_id: uuid.UUID = Field(foreign_key="products.uid", primary_key=True, ondelete="CASCADE")
+    category_id: uuid.UUID = Field(foreign_key="categories.uid", primary_key=True, ondelete="CASCADE")
     product: "Product" = Relationship(back_populates="categories")
     category: "Category" = Relationship(back_populates="products")
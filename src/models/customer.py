@@ -2,6 +2,7 @@ import uuid
 from datetime import datetime
 from typing import Optional, List
 
+from sqlalchemy import Index, text
 from sqlmodel import Field, SQLModel, Relationship
 
 from src.models.address import Address
@@ -14,10 +15,27 @@ class Customer(SQLModel, table=True):
     """
 
     __tablename__ = "customers"
+    __table_args__ = (
+        # Unicidade só entre registros ativos: um cliente excluído logicamente libera e-mail e CPF.
+        Index("uq_customers_email", "email", unique=True, postgresql_where=text("deleted_at IS NULL")),
+        Index("uq_customers_cpf", "cpf", unique=True, postgresql_where=text("deleted_at IS NULL")),
+        # Os filtros username__like/email__like viram LIKE '%valor%'; só trigramas atendem.
+        Index(
+            "ix_customers_username_trgm", "username",
+            postgresql_using="gin", postgresql_ops={"username": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_customers_email_trgm", "email",
+            postgresql_using="gin", postgresql_ops={"email": "gin_trgm_ops"},
+        ),
+        # Índices parciais das listagens: linhas com deleted_at ficam fora deles.
+        Index("ix_customers_live_email_uid", "email", "uid", postgresql_where=text("deleted_at IS NULL")),
+        Index("ix_customers_live_created_at_uid", "created_at", "uid", postgresql_where=text("deleted_at IS NULL")),
+    )
 
     uid: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True, index=True)
     username: Optional[str] = Field(default=None, nullable=True, max_length=50)
-    email: str = Field(nullable=False, unique=True, max_length=100)
+    email: str = Field(nullable=False, max_length=100)
     first_name: Optional[str] = Field(default=None, max_length=100)
     last_name: Optional[str] = Field(default=None, max_length=100)
     role: str = Field(default="customer", nullable=False, max_length=20)
@@ -29,11 +47,12 @@ class Customer(SQLModel, table=True):
     is_active: bool = Field(default=True, nullable=False)
     is_superuser: bool = Field(default=False, nullable=False)
     is_verified: bool = Field(default=False, nullable=False)
+    deleted_at: Optional[datetime] = Field(default=None, nullable=True)
     orders: List["Order"] = Relationship(
         back_populates="customer",
-        sa_relationship_kwargs={"cascade": "all, delete-orphan"}
+        sa_relationship_kwargs={"cascade": "all, delete-orphan", "passive_deletes": True}
     )
     addresses: List["Address"] = Relationship(
         back_populates="customer",
-        sa_relationship_kwargs={"cascade": "all, delete-orphan", "lazy": "selectin"}
+        sa_relationship_kwargs={"cascade": "all, delete-orphan", "lazy": "selectin", "passive_deletes": True}
     )
\ No newline at end of file
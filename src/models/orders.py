@@ -1,8 +1,9 @@
 import uuid
-from datetime import datetime
+from datetime import date, datetime
 from enum import Enum
 from typing import List, Optional
 
+from sqlalchemy import ForeignKeyConstraint, Index
 from sqlalchemy.dialects import postgresql as pg
 from sqlmodel import SQLModel, Field, Relationship, Column
 
@@ -19,19 +20,42 @@ class Order(SQLModel, table=True):
     """
     Order model for the database.
     This model represents an order placed by a customer. (N:1 relationship with Customer)
+    Partitioned by month on created_at, so the partition key is part of the primary key.
     """
     __tablename__ = "orders"
+    __table_args__ = (
+        Index("ix_orders_customer_id_created_at", "customer_id", "created_at"),
+        Index("ix_orders_status_created_at", "status", "created_at"),
+        Index("ix_orders_created_at_uid", "created_at", "uid"),
+        Index("ix_orders_created_at_brin", "created_at", postgresql_using="brin"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
     uid: uuid.UUID = Field(
         sa_column=Column(pg.UUID, primary_key=True, default=uuid.uuid4)
     )
     total_price: float = Field(default=0.0)
-    customer_id: uuid.UUID = Field(foreign_key="customers.uid")
+    customer_id: uuid.UUID = Field(foreign_key="customers.uid", ondelete="CASCADE")
     status: OrderStatusEnum = Field(sa_column=Column(pg.VARCHAR(length=20)))
-    created_at: datetime = Field(default_factory=datetime.now)
+    created_at: datetime = Field(default_factory=datetime.now, primary_key=True)
     updated_at: datetime = Field(default_factory=datetime.now)
-    customer_id: uuid.UUID = Field(foreign_key="customers.uid")
     customer: Optional["Customer"] = Relationship(back_populates="orders")
-    products: List["OrderProduct"] = Relationship(back_populates="order")
+    products: List["OrderProduct"] = Relationship(
+        back_populates="order", sa_relationship_kwargs={"passive_deletes": True}
+    )
+
+
+class OrderKey(SQLModel, table=True):
+    """
+    OrderKey model for the database.
+    Partition key (created_at) of each order by uid: orders is partitioned by created_at, so
+    a lookup by uid alone would visit every monthly partition. Written with the order.
+    """
+    __tablename__ = "order_keys"
+    __table_args__ = (
+        ForeignKeyConstraint(["uid", "created_at"], ["orders.uid", "orders.created_at"], ondelete="CASCADE"),
+    )
+    uid: uuid.UUID = Field(primary_key=True)
+    created_at: datetime
 
 
 class OrderProduct(SQLModel, table=True):
@@ -39,10 +63,43 @@ class OrderProduct(SQLModel, table=True):
     OrderProduct model for the database.
     This model represents the many-to-many relationship between orders and products.
     (N:M relationship)
+    Partitioned like orders: order_created_at carries the order's partition key.
     """
     __tablename__ = "order_products"
-    product_id: uuid.UUID = Field(foreign_key="products.uid", primary_key=True)
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["order_id", "order_created_at"], ["orders.uid", "orders.created_at"], ondelete="CASCADE"
+        ),
+        # A PK começa por product_id; a carga dos itens de um pedido precisa do índice por order_id.
+        Index("ix_order_products_order_id", "order_id"),
+        Index("ix_order_products_order_created_at_brin", "order_created_at", postgresql_using="brin"),
+        {"postgresql_partition_by": "RANGE (order_created_at)"},
+    )
+    # RESTRICT: excluir um produto não pode apagar o histórico dos pedidos (use a exclusão lógica).
+    product_id: uuid.UUID = Field(foreign_key="products.uid", primary_key=True, ondelete="RESTRICT")
     product: "Product" = Relationship(back_populates="order_products")
-    order_id: uuid.UUID = Field(foreign_key="orders.uid", primary_key=True)
+    order_id: uuid.UUID = Field(primary_key=True)
+    # Preenchido pelo relacionamento a partir de Order.created_at (FK composta).
+    order_created_at: datetime = Field(primary_key=True)
     order: "Order" = Relationship(back_populates="products")
     quantity: int = Field(default=1)
+    unit_price: float = Field(default=0.0)
+    discount_percentage: float = Field(default=0.0)
+
+    @property
+    def line_total(self) -> float:
+        return self.unit_price * self.quantity * (1 - self.discount_percentage / 100)
+
+
+class DailySales(SQLModel, table=True):
+    """
+    DailySales model for the database.
+    Pre-aggregated sales per day, updated in the same transaction that creates each order.
+    Each day is split into shards so concurrent orders rarely lock the same row; reads sum them.
+    """
+    __tablename__ = "daily_sales"
+    day: date = Field(primary_key=True)
+    shard: int = Field(default=0, primary_key=True)
+    orders_count: int = Field(default=0)
+    items_count: int = Field(default=0)
+    revenue: float = Field(default=0.0)
@@ -4,7 +4,9 @@ from typing import List, Optional
 from typing import TYPE_CHECKING
 
 import sqlalchemy.dialects.postgresql as pg
+from sqlalchemy import Computed, Index, text
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.dialects.postgresql import UUID
 from sqlmodel import Field, SQLModel, Column, Relationship
 
@@ -20,6 +22,13 @@ class Product(SQLModel, table=True):
     """
 
     __tablename__ = "products"
+    __table_args__ = (
+        Index("ix_products_is_published_price", "is_published", "price"),
+        # Listagens ordenam por uid e ignoram produtos excluídos logicamente.
+        Index("ix_products_live_uid", "uid", postgresql_where=text("deleted_at IS NULL")),
+        # bar_code é único só entre produtos ativos; um excluído logicamente libera o código.
+        Index("uq_products_bar_code", "bar_code", unique=True, postgresql_where=text("deleted_at IS NULL")),
+    )
     uid: uuid.UUID = Field(
         sa_column=Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     )
@@ -29,7 +38,7 @@ class Product(SQLModel, table=True):
     stock: int
     brand: str
     bar_code: str = Field(
-        sa_column=Column(pg.VARCHAR(length=100), nullable=False, unique=True)
+        sa_column=Column(pg.VARCHAR(length=100), nullable=False)
     )
     section: str = Field(
         sa_column=Column(pg.VARCHAR(length=100), nullable=False)
@@ -47,6 +56,36 @@ class Product(SQLModel, table=True):
     )
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
+    deleted_at: Optional[datetime] = Field(default=None, nullable=True)
+
+    order_products: List["OrderProduct"] = Relationship(
+        back_populates="product", sa_relationship_kwargs={"passive_deletes": True}
+    )
+    categories: List["ProductCategory"] = Relationship(
+        back_populates="product", sa_relationship_kwargs={"passive_deletes": True}
+    )
+
 
-    order_products: List["OrderProduct"] = Relationship(back_populates="product")
-    categories: List["ProductCategory"] = Relationship(back_populates="product")
+# Coluna gerada para a busca textual. Fica fora do mapeamento do modelo para não ser
+# carregada em todo SELECT de produtos; as consultas de busca usam `products.c.search_vector`.
+PRODUCT_SEARCH_CONFIG = "portuguese"
+
+Product.__table__.append_column(
+    Column(
+        "search_vector",
+        TSVECTOR,
+        Computed(
+            f"setweight(to_tsvector('{PRODUCT_SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+            f"setweight(to_tsvector('{PRODUCT_SEARCH_CONFIG}', coalesce(brand, '')), 'B') || "
+            f"setweight(to_tsvector('{PRODUCT_SEARCH_CONFIG}', coalesce(description, '')), 'C')",
+            persisted=True,
+        ),
+    )
+)
+Index("ix_products_search_vector", Product.__table__.c.search_vector, postgresql_using="gin")
+Index(
+    "ix_products_title_trgm",
+    Product.__table__.c.title,
+    postgresql_using="gin",
+    postgresql_ops={"title": "gin_trgm_ops"},
+)
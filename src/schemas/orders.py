@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import date, datetime
 from typing import List, Optional
 from uuid import UUID
 
@@ -13,7 +13,8 @@ class OrderProductItemModel(BaseModel):
 
 
 class OrderProductOutModel(OrderProductItemModel):
-   pass
+    unit_price: float = 0.0
+    discount_percentage: float = 0.0
 
 
 class OrderBaseModel(BaseModel):
@@ -39,7 +40,9 @@ class OrderBaseModel(BaseModel):
             items=[
                 OrderProductOutModel(
                     product_id=op.product_id,
-                    quantity=op.quantity
+                    quantity=op.quantity,
+                    unit_price=op.unit_price,
+                    discount_percentage=op.discount_percentage,
                 )
                 for op in getattr(order, "products", [])
             ],
@@ -73,3 +76,21 @@ class OrderListResponseModel(BaseModel):
 
 class OrderUpdateModel(BaseModel):
     status: Optional[str] = None
+
+
+class DailySalesModel(BaseModel):
+    day: date
+    orders_count: int
+    items_count: int
+    revenue: float
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class OrderStatsModel(BaseModel):
+    start: date
+    end: date
+    orders_count: int
+    items_count: int
+    revenue: float
+    days: List[DailySalesModel]
@@ -0,0 +1,27 @@
+from typing import Generic, List, Literal, Optional, TypeVar
+
+from fastapi_pagination import Page
+from pydantic import BaseModel, Field
+
+T = TypeVar("T")
+
+# exact: count(*) a cada página; estimate: estatística do planner sem filtros, ou
+# contagem em cache no Redis (COUNT_CACHE_TTL) quando há filtros.
+CountMode = Literal["exact", "estimate"]
+
+
+class CountedPage(Page[T], Generic[T]):
+    """
+    Page whose total may come from an estimate or a cached count.
+    """
+    total_exact: bool = Field(True, description="Se o total é uma contagem exata e atual")
+
+
+class CursorPage(BaseModel, Generic[T]):
+    """
+    Page returned by the cursor (keyset) paginated endpoints.
+    """
+    items: List[T]
+    size: int = Field(..., description="Tamanho da página")
+    next_cursor: Optional[str] = Field(None, description="Cursor para a próxima página")
+    prev_cursor: Optional[str] = Field(None, description="Cursor para a página anterior")
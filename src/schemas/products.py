@@ -98,3 +98,23 @@ class ProductOutDeleteModel(BaseModel):
     message: str
     status: str
     data: ProductDeleteModel
+
+
+class ProductImportErrorModel(BaseModel):
+    """
+    A row rejected by the bulk import.
+    """
+    line: int = Field(..., description="Linha do arquivo")
+    bar_code: Optional[str] = Field(None, description="Código de barras informado na linha")
+    message: str
+
+
+class ProductImportReportModel(BaseModel):
+    """
+    Model for the response of a bulk product import.
+    """
+    total_rows: int = 0
+    imported: int = 0
+    failed: int = 0
+    errors: List[ProductImportErrorModel] = Field(default_factory=list)
+    errors_truncated: bool = False
@@ -6,11 +6,18 @@ from fastapi.responses import JSONResponse
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from src.auth.cache import Principal, PrincipalCache
 from src.core.sentry import send_to_sentry
 from src.core.settings import settings
-from src.core.mail import send_email
+from src.core.mail import enqueue_email
 from src.db.database import get_session
-from src.exceptions.errors import UserNotFoundError, InvalidTokenError
+from src.db.inserts import insert_unique
+from src.exceptions.errors import (
+    UserNotFoundError,
+    UserAlreadyExistsError,
+    InvalidTokenError,
+    PasswordHashingBusyError
+)
 from src.models.customer import Customer
 from src.schemas.accounts import UserCreateModel
 from src.schemas.accounts import PasswordResetConfirmModel
@@ -21,7 +28,7 @@ from src.utils.utils import (
     decode_token,
     create_access_token
 )
-from src.utils.utils import generate_password_hash
+from src.utils.passwords import PasswordHasher
 
 
 class UserService:
@@ -32,7 +39,7 @@ class UserService:
         Get a user from the database by email.
         """
         try:
-            statement = select(Customer).where(Customer.email == email)
+            statement = select(Customer).where(Customer.email == email, Customer.deleted_at.is_(None))
             result = await session.execute(statement)
             user = result.scalars().first()
             return user
@@ -42,6 +49,18 @@ class UserService:
                 detail=f"An error occurred: {str(e)}"
             )
 
+    @classmethod
+    async def get_principal_by_email(cls, email: str, session: AsyncSession) -> Principal | None:
+        """
+        Get only the fields the permission checks need, without loading relationships.
+        """
+        statement = select(
+            Customer.uid, Customer.email, Customer.role, Customer.is_verified, Customer.is_active
+        ).where(Customer.email == email, Customer.deleted_at.is_(None))
+        result = await session.execute(statement)
+        row = result.first()
+        return Principal.model_validate(row) if row else None
+
     @classmethod
     async def user_exists(cls, email: str, session: AsyncSession):
         """
@@ -58,13 +77,16 @@ class UserService:
         user_dict = user.model_dump()
         new_user = Customer(**user_dict)
 
-        new_user.password_hash = generate_password_hash(user_dict["password"])
+        new_user.password_hash = await PasswordHasher.hash(user_dict["password"])
         new_user.role = "customer"
         new_user.is_active = True
         new_user.is_superuser = False
         new_user.created_at = datetime.now()
 
-        session.add(new_user)
+        # A constraint única de e-mail decide a corrida entre cadastros simultâneos.
+        new_user = await insert_unique(session, Customer, new_user.model_dump())
+        if new_user is None:
+            raise UserAlreadyExistsError()
         await session.commit()
 
         return new_user
@@ -80,6 +102,7 @@ class UserService:
 
         user.updated_at = datetime.now()
         await session.commit()
+        await PrincipalCache.invalidate(user.email)
 
         return user
 
@@ -184,8 +207,8 @@ class AccountService:
                 """
 
             email_body_str = render_email_template(template_str, email_body)
-            background_tasks.add_task(
-                send_email,
+            enqueue_email(
+                background_tasks,
                 email=email,
                 subject="Password Reset Request",
                 template_body=email_body_str
@@ -230,7 +253,7 @@ class AccountService:
                 if not user:
                     raise UserNotFoundError()
 
-                hashed_password = generate_password_hash(password_data.new_password)
+                hashed_password = await PasswordHasher.hash(password_data.new_password)
                 user.password_hash = hashed_password
                 await UserService.update_user(user, {"password_hash": hashed_password}, session)
 
@@ -241,5 +264,7 @@ class AccountService:
 
         except UserNotFoundError:
             raise UserNotFoundError("User not found.")
+        except PasswordHashingBusyError as e:
+            raise PasswordHashingBusyError(str(e))
         except Exception as e:
             send_to_sentry(e)
@@ -6,18 +6,19 @@ from starlette.responses import JSONResponse
 
 from src.core.sentry import send_to_sentry
 from src.core.settings import settings
-from src.core.mail import send_email
+from src.core.mail import enqueue_email
 from src.db.redis import add_jti_to_blocklist
 from src.exceptions.errors import (
     UserAlreadyExistsError,
     InvalidCredentialsError,
-    InvalidTokenError
+    InvalidTokenError,
+    PasswordHashingBusyError
 )
 from src.schemas.accounts import SignupResponseModel, UserResponseModel
 from src.services.accounts import UserService
+from src.utils.passwords import PasswordHasher
 from src.utils.utils import (
     create_access_token,
-    verify_password,
     create_url_safe_token,
     render_email_template,
     decode_token
@@ -33,12 +34,9 @@ class AuthService:
         """
         try:
             email = user_data.email
-            if await UserService.user_exists(email=email, session=session):
-                raise UserAlreadyExistsError()
+            new_user = await UserService.create_user(user_data, session)
 
             token = create_url_safe_token({"email": email})
-
-            new_user = await UserService.create_user(user_data, session)
             verification_url = f"{settings.app.APP_PROTOCOL}://{settings.app.APP_HOST}:{settings.APP_PORT}{settings.app.APP_V1_PREFIX}/accounts/verify-email?token={token}"
 
             email_body = {
@@ -53,8 +51,8 @@ class AuthService:
                 """
 
             email_body_str = render_email_template(template_str, email_body)
-            background_tasks.add_task(
-                send_email,
+            enqueue_email(
+                background_tasks,
                 email=email,
                 subject="Email Verification",
                 template_body=email_body_str
@@ -68,6 +66,8 @@ class AuthService:
 
         except UserAlreadyExistsError:
             raise UserAlreadyExistsError("User with this email already exists.")
+        except PasswordHashingBusyError as e:
+            raise PasswordHashingBusyError(str(e))
         except Exception as e:
             send_to_sentry(e)
 
@@ -81,12 +81,19 @@ class AuthService:
             password = login_data.password
             user = await UserService.get_user_by_email(email=email, session=session)
 
-            if not user or not verify_password(password, user.password_hash):
+            if not user:
+                raise InvalidCredentialsError()
+
+            valid, new_hash = await PasswordHasher.verify_and_update(password, user.password_hash)
+            if not valid:
                 raise InvalidCredentialsError()
 
             if not getattr(user, "is_verified", False):
                 raise InvalidCredentialsError()
 
+            if new_hash:
+                await UserService.update_user(user, {"password_hash": new_hash}, session)
+
             access_token = create_access_token(
                 user_data={
                     "email": user.email,
@@ -118,6 +125,8 @@ class AuthService:
             raise UserAlreadyExistsError("User with this email already exists.")
         except InvalidCredentialsError:
             raise InvalidCredentialsError("Account not verified. Please check your email to verify your account.")
+        except PasswordHashingBusyError as e:
+            raise PasswordHashingBusyError(str(e))
         except Exception as e:
             send_to_sentry(e)
 
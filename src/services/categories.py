@@ -2,6 +2,9 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio.session import AsyncSession
 
 from src.core.sentry import send_to_sentry
+from src.db.cache import ProductCache
+from src.db.deletes import delete_row
+from src.db.inserts import insert_unique
 from src.exceptions.errors import (
     ErrorResponse,
     CategoryNotFoundError,
@@ -17,7 +20,7 @@ class CategoryService:
     async def get_category(cls, session: AsyncSession, category_id: int):
         try:
             result = await session.execute(
-                select(Category).where(Category.uid == category_id)
+                select(Category).where(Category.uid == category_id, Category.deleted_at.is_(None))
             )
             db_category = result.scalar_one_or_none()
             if not db_category:
@@ -36,23 +39,20 @@ class CategoryService:
 
     @classmethod
     async def create_category(cls, session: AsyncSession, category_data: CategoryCreateModel):
-        result = await session.execute(
-            select(Category).where(Category.name == category_data.name)
-        )
-        existing = result.scalar_one_or_none()
-        if existing:
-            raise CategoryAlreadyExistsError()
         try:
-            db_category = Category(**category_data.model_dump())
-            session.add(db_category)
+            values = Category(**category_data.model_dump(exclude_none=True)).model_dump()
+            db_category = await insert_unique(session, Category, values)
+            if db_category is None:
+                raise CategoryAlreadyExistsError()
             await session.commit()
-            await session.refresh(db_category)
 
             return {
                 "message": "Category created successfully",
                 "status": "success",
                 "data": db_category,
             }
+        except CategoryAlreadyExistsError as e:
+            raise CategoryAlreadyExistsError(str(e))
         except Exception as e:
             send_to_sentry(e)
 
@@ -60,7 +60,7 @@ class CategoryService:
     async def update_category(cls, session: AsyncSession, category_id: int, updated_category):
         try:
             result = await session.execute(
-                select(Category).where(Category.uid == category_id)
+                select(Category).where(Category.uid == category_id, Category.deleted_at.is_(None))
             )
             db_category = result.scalar_one_or_none()
             if not db_category:
@@ -71,7 +71,7 @@ class CategoryService:
 
             session.add(db_category)
             await session.commit()
-            await session.refresh(db_category)
+            await ProductCache.invalidate_categories()
 
             return {
                 "message": "Category updated successfully",
@@ -85,14 +85,15 @@ class CategoryService:
     async def delete_category(cls, session: AsyncSession, category_id: int):
         try:
             result = await session.execute(
-                select(Category).where(Category.uid == category_id)
+                select(Category).where(Category.uid == category_id, Category.deleted_at.is_(None))
             )
             db_category = result.scalar_one_or_none()
             if not db_category:
                 raise CategoryNotFoundError()
 
-            await session.delete(db_category)
+            await delete_row(session, db_category)
             await session.commit()
+            await ProductCache.invalidate_categories()
 
             return {
                 "status": "success",
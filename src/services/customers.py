@@ -1,32 +1,82 @@
+from collections import defaultdict
 from uuid import UUID
 
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from src.auth.cache import PrincipalCache
 from src.core.sentry import send_to_sentry
+from src.db.deletes import delete_row
+from src.db.inserts import insert_unique
 from src.exceptions.errors import (
     UserNotFoundError,
-    CustomerAlreadyExistsError
+    CustomerAlreadyExistsError,
+    PasswordHashingBusyError
 )
 from src.models.address import Address
 from src.models.customer import Customer
+from src.schemas.address import AddressModel
 from src.schemas.customers import (
     CustomerModel,
     CustomerCreateModel,
     CustomerUpdateModel
 )
-from src.utils.utils import generate_password_hash
+from src.utils.pagination import paginate_rows
+from src.utils.passwords import PasswordHasher
+
+# Colunas de CustomerModel: a listagem não carrega password_hash nem os endereços.
+CUSTOMER_LIST_COLUMNS = (
+    Customer.uid, Customer.username, Customer.email, Customer.first_name, Customer.last_name,
+    Customer.cpf, Customer.is_active, Customer.created_at, Customer.updated_at,
+)
 
 
 class CustomerService:
 
+    @classmethod
+    async def list_customers(
+            cls,
+            session: AsyncSession,
+            customer_filter,
+            include_addresses: bool = False,
+            count_mode: str = "exact"
+    ):
+        """
+        Lista clientes paginando no banco, só com as colunas da resposta.
+        Os endereços são carregados (em uma consulta para a página) apenas se pedidos.
+        """
+        try:
+            query = customer_filter.filter(select(*CUSTOMER_LIST_COLUMNS).where(Customer.deleted_at.is_(None)))
+            query = query.order_by(Customer.email, Customer.uid)
+            page = await paginate_rows(
+                session, query, count_mode, "customers", customer_filter.model_dump(exclude_none=True)
+            )
+            customers = [row._asdict() for row in page["items"]]
+
+            if include_addresses and customers:
+                result = await session.execute(
+                    select(Address).where(Address.customer_id.in_([customer["uid"] for customer in customers]))
+                )
+                addresses = defaultdict(list)
+                for address in result.scalars():
+                    addresses[address.customer_id].append(AddressModel.model_validate(address))
+                for customer in customers:
+                    customer["addresses"] = addresses.get(customer["uid"], [])
+
+            page["items"] = customers
+            return page
+
+        except Exception as e:
+            send_to_sentry(e)
+
     @classmethod
     async def get_customer(cls, session: AsyncSession, customer_id: UUID):
         try:
             query = (
                 select(Customer)
-                .where(Customer.uid == customer_id)
+                .where(Customer.uid == customer_id, Customer.deleted_at.is_(None))
                 .options(selectinload(Customer.addresses))
             )
             result = await session.execute(query)
@@ -48,29 +98,22 @@ class CustomerService:
     @classmethod
     async def create_customer(cls, session: AsyncSession, costumer: CustomerCreateModel):
         try:
-            query = select(Customer).where(
-                (Customer.email == costumer.email) | (Customer.cpf == costumer.cpf)
-            )
-            result = await session.execute(query)
-            existing_customer = result.scalar_one_or_none()
-            if existing_customer:
-                raise CustomerAlreadyExistsError()
-
-            hashed_password = generate_password_hash(costumer.password)
-            customer_data = costumer.dict(exclude={"password"})
+            hashed_password = await PasswordHasher.hash(costumer.password)
+            customer_data = costumer.dict(exclude={"password", "address"})
             customer_data["password_hash"] = hashed_password
 
-            db_customer = Customer(**customer_data)
-            session.add(db_customer)
-            await session.flush()
-
-            address_data = costumer.address.dict(exclude_unset=True)
-            db_address = Address(**address_data, customer_id=db_customer.uid)
-            session.add(db_address)
+            # E-mail e CPF são únicos no banco: um conflito em qualquer um deles vira None.
+            db_customer = await insert_unique(session, Customer, Customer(**customer_data).model_dump())
+            if db_customer is None:
+                raise CustomerAlreadyExistsError()
 
+            addresses = []
+            if costumer.address:
+                addresses.append(Address(**costumer.address.dict(exclude_unset=True), customer_id=db_customer.uid))
+                session.add_all(addresses)
             await session.commit()
-            await session.refresh(db_customer)
-            await session.refresh(db_address)
+            # A resposta sai dos objetos em memória, sem recarregar o relacionamento.
+            set_committed_value(db_customer, "addresses", addresses)
 
             return {
                 "message": "Successful Customer",
@@ -79,20 +122,23 @@ class CustomerService:
             }
         except CustomerAlreadyExistsError as e:
             raise CustomerAlreadyExistsError(str(e))
+        except PasswordHashingBusyError as e:
+            raise PasswordHashingBusyError(str(e))
         except Exception as e:
             send_to_sentry(e)
 
     @classmethod
     async def update_customer(cls, session: AsyncSession, customer_id: int, update_customer: CustomerUpdateModel):
         try:
-            query = select(Customer).where(Customer.uid == customer_id)
+            query = select(Customer).where(Customer.uid == customer_id, Customer.deleted_at.is_(None))
             result = await session.execute(query)
             db_customer = result.scalar_one_or_none()
             if not db_customer:
                 raise UserNotFoundError(f"Cliente com ID {customer_id} não encontrado.")
 
+            previous_email = db_customer.email
             if update_customer.password:
-                hashed_password = generate_password_hash(update_customer.password)
+                hashed_password = await PasswordHasher.hash(update_customer.password)
                 db_customer.password_hash = hashed_password
 
             for key, value in update_customer.dict(exclude_unset=True, exclude={"password"}).items():
@@ -100,7 +146,7 @@ class CustomerService:
                     setattr(db_customer, key, value)
 
             await session.commit()
-            await session.refresh(db_customer)
+            await PrincipalCache.invalidate(previous_email, db_customer.email)
 
             return {
                 "message": "Cliente atualizado com sucesso",
@@ -110,20 +156,23 @@ class CustomerService:
 
         except UserNotFoundError as e:
             raise UserNotFoundError(str(e))
+        except PasswordHashingBusyError as e:
+            raise PasswordHashingBusyError(str(e))
         except Exception as e:
             send_to_sentry(e)
 
     @classmethod
     async def delete_customer(cls, session: AsyncSession, customer_id: int):
         try:
-            query = select(Customer).where(Customer.uid == customer_id)
+            query = select(Customer).where(Customer.uid == customer_id, Customer.deleted_at.is_(None))
             result = await session.execute(query)
             db_customer = result.scalar_one_or_none()
             if not db_customer:
                 raise UserNotFoundError(f"Cliente com ID {customer_id} não encontrado.")
 
-            await session.delete(db_customer)
+            await delete_row(session, db_customer)
             await session.commit()
+            await PrincipalCache.invalidate(db_customer.email)
 
             return {
                 "message": "Cliente atualizado com sucesso",
@@ -0,0 +1,105 @@
+import csv
+import io
+import json
+from datetime import date, datetime
+from enum import Enum
+from typing import AsyncIterator
+from uuid import UUID
+
+from sqlalchemy import select
+
+from src.core.logger import logger
+from src.core.settings import settings
+from src.db.database import read_session
+from src.filters.customers import CustomerFilter
+from src.filters.orders import OrderFilter
+from src.models.customer import Customer
+from src.models.orders import Order, OrderProduct
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def _jsonable(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+class ExportService:
+    """
+    Exportações em stream (NDJSON ou CSV).
+
+    Cada exportação abre a própria sessão e lê o resultado com cursor do servidor em
+    blocos de EXPORT_YIELD_PER linhas, então o primeiro byte sai antes de o resultado
+    inteiro ser lido e a memória não cresce com o número de linhas.
+    """
+
+    @classmethod
+    def export_orders(cls, order_filter: OrderFilter, file_format: str) -> AsyncIterator[str]:
+        query = select(
+            Order.uid, Order.customer_id, Order.status, Order.total_price, Order.created_at, Order.updated_at
+        )
+        query = order_filter.apply_filters(query).order_by(Order.created_at, Order.uid)
+        return cls._stream(query, file_format)
+
+    @classmethod
+    def export_order_items(cls, order_filter: OrderFilter, file_format: str) -> AsyncIterator[str]:
+        query = select(
+            OrderProduct.order_id, OrderProduct.product_id, OrderProduct.quantity,
+            OrderProduct.unit_price, OrderProduct.discount_percentage, Order.created_at,
+        ).join(OrderProduct.order)
+        # O período também vai para a chave de partição dos itens, para podar order_products.
+        query = order_filter.apply_filters(query).where(
+            *order_filter.created_at_predicates(OrderProduct.order_created_at)
+        )
+        query = query.order_by(Order.created_at, OrderProduct.order_id)
+        return cls._stream(query, file_format)
+
+    @classmethod
+    def export_customers(cls, customer_filter: CustomerFilter, file_format: str) -> AsyncIterator[str]:
+        query = select(
+            Customer.uid, Customer.username, Customer.email, Customer.first_name, Customer.last_name,
+            Customer.cpf, Customer.role, Customer.is_active, Customer.is_verified,
+            Customer.created_at, Customer.updated_at,
+        )
+        query = customer_filter.filter(query.where(Customer.deleted_at.is_(None)))
+        query = query.order_by(Customer.created_at, Customer.uid)
+        return cls._stream(query, file_format)
+
+    @classmethod
+    async def _stream(cls, query, file_format: str) -> AsyncIterator[str]:
+        async with read_session() as session:
+            try:
+                result = await session.stream(
+                    query.execution_options(yield_per=settings.app.EXPORT_YIELD_PER)
+                )
+                columns = list(result.keys())
+
+                if file_format == "csv":
+                    yield cls._csv_line(columns)
+
+                async for rows in result.partitions():
+                    if file_format == "csv":
+                        yield "".join(cls._csv_line([_jsonable(value) for value in row]) for row in rows)
+                    else:
+                        yield "".join(
+                            json.dumps({column: _jsonable(value) for column, value in zip(columns, row)}) + "\n"
+                            for row in rows
+                        )
+            except Exception as e:
+                # Os cabeçalhos já foram enviados; só resta registrar e interromper o stream.
+                logger.error(f"Erro durante a exportação: {e}")
+                raise
+
+    @classmethod
+    def _csv_line(cls, values: list) -> str:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow(values)
+        return buffer.getvalue()
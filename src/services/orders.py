@@ -1,33 +1,86 @@
-from uuid import UUID
+import random
+from datetime import date, timedelta
+from uuid import UUID, uuid4
 
-from fastapi_pagination import paginate
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
 
 from src.core.sentry import send_to_sentry
-from src.exceptions.errors import ErrorResponse, ProductNotFoundError
-from src.filters.orders import OrderFilter
+from src.core.settings import settings
+from src.db.cache import ProductCache
+from src.exceptions.errors import (
+    ErrorResponse,
+    ProductNotFoundError,
+    InvalidCursorError,
+    InsufficientStockError,
+)
+from src.filters.orders import OrderFilter, order_created_at
 from src.models.address import Address
 from src.models.customer import Customer
-from src.models.orders import Order, OrderProduct
-from src.models.product import Product
-from src.schemas.orders import OrderResponseModel, OrderBaseModel, OrderCreateModel
+from src.models.orders import DailySales, Order, OrderKey, OrderProduct
+from src.schemas.orders import (
+    DailySalesModel,
+    OrderBaseModel,
+    OrderCreateModel,
+    OrderResponseModel,
+    OrderStatsModel,
+)
+from src.services.stock import StockService
+from src.utils.pagination import keyset_paginate, paginate_rows
 
 
 class OrderService:
     @classmethod
-    async def list_orders(cls, session: AsyncSession, order_filter: OrderFilter):
+    async def list_orders(cls, session: AsyncSession, order_filter: OrderFilter, count_mode: str = "exact"):
         """
         Listar pedidos com filtros e paginação.
         """
+        try:
+            query = select(Order).options(selectinload(Order.products))
+            query = order_filter.sort(order_filter.apply_filters(query))
+
+            page = await paginate_rows(
+                session,
+                query,
+                count_mode,
+                "orders",
+                order_filter.model_dump(exclude_none=True, exclude={"order_by"}),
+            )
+            page["items"] = [OrderBaseModel.from_orm_with_items(order) for order in page["items"]]
+            return page
+
+        except Exception as e:
+            send_to_sentry(e)
+
+    @classmethod
+    async def list_orders_by_cursor(
+            cls,
+            session: AsyncSession,
+            order_filter: OrderFilter,
+            cursor: str | None,
+            size: int
+    ):
+        """
+        Listar pedidos com paginação por cursor, ordenados por (created_at, uid).
+        """
         try:
             query = select(Order).options(selectinload(Order.products))
             query = order_filter.apply_filters(query)
-            result = await session.execute(query)
-            orders = result.scalars().all()
-            return paginate(orders)
 
+            return await keyset_paginate(
+                session,
+                query,
+                [Order.created_at, Order.uid],
+                cursor,
+                size,
+                transformer=lambda orders: [OrderBaseModel.from_orm_with_items(order) for order in orders],
+            )
+
+        except InvalidCursorError as e:
+            raise InvalidCursorError(message=str(e))
         except Exception as e:
             send_to_sentry(e)
 
@@ -42,58 +95,39 @@ class OrderService:
             if not address or address.customer_id != order_data.customer_id:
                 raise ErrorResponse("Endereço inválido ou não pertence ao cliente.")
 
-            # 1. Obter todos os products_ids do pedido
-            products_uids = [item.product_id for item in order_data.items]
-
-            # 2. Consulta todos os produtos envolvidos
-            products = await session.execute(
-                select(Product).where(Product.uid.in_(products_uids))
-            )
-            products = products.scalars().all()
-
-            products_map = {product.uid: product for product in products}
-            if len(products_map) != len(products_uids):
-                raise ProductNotFoundError("Um ou mais produtos não foram encontrados.")
-
-            # 3. Mapeia as quantidades solicitadas
-            product_quantities = {item.product_id: item.quantity for item in order_data.items}
-
-            # 4. Valida o estoque de cada produto
-            insufficient = [
-                product for pid, product in products_map.items()
-                if product.stock < product_quantities[pid]
-            ]
-            if insufficient:
-                names = ", ".join([p.name for p in insufficient])
-                raise ErrorResponse(f"Estoque insuficiente para: {names}")
+            # 1. Agrupa as quantidades por produto
+            product_quantities: dict[UUID, int] = {}
+            for item in order_data.items:
+                product_quantities[item.product_id] = product_quantities.get(item.product_id, 0) + item.quantity
 
-            # 5. Debita o estoque
-            for pid, product in products_map.items():
-                product.stock -= product_quantities[pid]
-                session.add(product)
+            # 2. Reserva o estoque de todos os itens em uma única instrução
+            reserved = await StockService.reserve(session, product_quantities)
 
-            # 6. Cria o pedido e associa produtos e endereço
+            # 3. Cria o pedido com preço e desconto congelados no momento da compra
             new_order = Order(
+                uid=uuid4(),
                 customer_id=order_data.customer_id,
                 status=order_data.status,
                 shipping_address_id=address.id,
             )
             order_products = [
                 OrderProduct(
-                    order_id=new_order.uid,
-                    product_id=item.product_id,
-                    quantity=item.quantity
+                    product_id=product_id,
+                    quantity=quantity,
+                    unit_price=reserved[product_id]["price"],
+                    discount_percentage=reserved[product_id]["discount_percentage"],
                 )
-                for item in order_data.items
+                for product_id, quantity in product_quantities.items()
             ]
             new_order.products = order_products
+            new_order.total_price = round(sum(op.line_total for op in order_products), 2)
 
-            # 7. Salva o pedido
+            # 4. Salva o pedido, sua chave de partição e o agregado diário na mesma transação
             session.add(new_order)
+            session.add(OrderKey(uid=new_order.uid, created_at=new_order.created_at))
+            await cls._record_daily_sales(session, new_order)
             await session.commit()
-            await session.refresh(new_order)
-
-            await session.refresh(new_order, attribute_names=["products"])
+            await ProductCache.invalidate_details(product_quantities)
 
             return OrderResponseModel(
                 status="success",
@@ -101,6 +135,12 @@ class OrderService:
                 data=OrderBaseModel.from_orm_with_items(new_order)
             )
 
+        except ErrorResponse as e:
+            raise ErrorResponse(str(e))
+        except ProductNotFoundError as e:
+            raise ProductNotFoundError(str(e))
+        except InsufficientStockError as e:
+            raise InsufficientStockError(str(e))
         except Exception as e:
             send_to_sentry(e)
 
@@ -113,7 +153,7 @@ class OrderService:
             result = await session.execute(
                 select(Order)
                 .options(selectinload(Order.products))
-                .where(Order.uid == order_id)
+                .where(Order.uid == order_id, Order.created_at == order_created_at(order_id))
             )
             order = result.scalar_one_or_none()
             if not order:
@@ -123,3 +163,64 @@ class OrderService:
 
         except Exception as e:
             send_to_sentry(e)
+
+    @classmethod
+    async def _record_daily_sales(cls, session: AsyncSession, order: Order) -> None:
+        """
+        Soma o pedido a um shard do agregado do dia com um upsert atômico (sem ler a linha
+        antes). O lock da linha dura até o commit, por isso o shard é sorteado.
+        """
+        statement = insert(DailySales).values(
+            day=order.created_at.date(),
+            shard=random.randrange(settings.app.DAILY_SALES_SHARDS),
+            orders_count=1,
+            items_count=sum(op.quantity for op in order.products),
+            revenue=order.total_price,
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[DailySales.day, DailySales.shard],
+            set_={
+                "orders_count": DailySales.orders_count + statement.excluded.orders_count,
+                "items_count": DailySales.items_count + statement.excluded.items_count,
+                "revenue": DailySales.revenue + statement.excluded.revenue,
+            },
+        )
+        await session.execute(statement)
+
+    @classmethod
+    async def get_stats(cls, session: AsyncSession, start: date | None, end: date | None):
+        """
+        Vendas por dia no período (padrão: últimos 30 dias), lidas do agregado diário.
+        """
+        try:
+            end = end or date.today()
+            start = start or end - timedelta(days=29)
+            if start > end:
+                raise ErrorResponse("A data inicial deve ser anterior à data final.")
+
+            result = await session.execute(
+                select(
+                    DailySales.day,
+                    func.sum(DailySales.orders_count).label("orders_count"),
+                    func.sum(DailySales.items_count).label("items_count"),
+                    func.sum(DailySales.revenue).label("revenue"),
+                )
+                .where(DailySales.day >= start, DailySales.day <= end)
+                .group_by(DailySales.day)
+                .order_by(DailySales.day)
+            )
+            days = [DailySalesModel.model_validate(row) for row in result.all()]
+
+            return OrderStatsModel(
+                start=start,
+                end=end,
+                orders_count=sum(day.orders_count for day in days),
+                items_count=sum(day.items_count for day in days),
+                revenue=round(sum(day.revenue for day in days), 2),
+                days=days,
+            )
+
+        except ErrorResponse as e:
+            raise ErrorResponse(str(e))
+        except Exception as e:
+            send_to_sentry(e)
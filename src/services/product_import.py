@@ -0,0 +1,232 @@
+import codecs
+import csv
+import json
+import uuid
+from datetime import datetime
+from typing import AsyncIterator
+
+from pydantic import ValidationError
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.logger import logger
+from src.core.settings import settings
+from src.db.cache import ProductCache
+from src.models.category import Category, ProductCategory
+from src.models.product import Product
+from src.schemas.products import (
+    ProductCreateModel,
+    ProductImportErrorModel,
+    ProductImportReportModel
+)
+
+_UPDATABLE_COLUMNS = (
+    "title", "description", "price", "stock", "brand", "section", "date_validation",
+    "discount_percentage", "rating", "is_published", "images", "updated_at",
+)
+
+
+class ProductImportService:
+    """
+    Importação em massa de produtos a partir de um corpo CSV ou NDJSON transmitido em stream.
+
+    As linhas são validadas e gravadas em blocos de IMPORT_CHUNK_SIZE: cada bloco resolve
+    suas categorias em uma consulta, faz upsert por bar_code com INSERT ... ON CONFLICT e
+    é confirmado separadamente, então a memória usada não depende do tamanho do arquivo.
+    """
+
+    @classmethod
+    async def import_products(cls, session: AsyncSession, body: AsyncIterator[bytes], file_format: str):
+        report = ProductImportReportModel()
+        records = cls._read_csv(body) if file_format == "csv" else cls._read_ndjson(body)
+
+        chunk: list[tuple[int, dict | None, str | None]] = []
+        async for record in records:
+            chunk.append(record)
+            if len(chunk) >= settings.app.IMPORT_CHUNK_SIZE:
+                await cls._import_chunk(session, chunk, report)
+                chunk = []
+        if chunk:
+            await cls._import_chunk(session, chunk, report)
+
+        await ProductCache.invalidate_product()
+        return report
+
+    @classmethod
+    async def _lines(cls, body: AsyncIterator[bytes]) -> AsyncIterator[str]:
+        decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        pending = ""
+        async for data in body:
+            pending += decoder.decode(data)
+            *lines, pending = pending.split("\n")
+            for line in lines:
+                yield line
+        pending += decoder.decode(b"", final=True)
+        if pending:
+            yield pending
+
+    @classmethod
+    async def _read_ndjson(cls, body: AsyncIterator[bytes]):
+        line_number = 0
+        async for line in cls._lines(body):
+            line_number += 1
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+                if not isinstance(row, dict):
+                    raise ValueError("a linha deve ser um objeto JSON")
+            except ValueError as e:
+                yield line_number, None, f"JSON inválido: {e}"
+                continue
+
+            row["categories"] = [
+                cat if isinstance(cat, dict) else {"name": cat}
+                for cat in row.get("categories") or []
+            ]
+            yield line_number, row, None
+
+    @classmethod
+    async def _read_csv(cls, body: AsyncIterator[bytes]):
+        header = None
+        line_number = 0
+        record, record_line = "", 0
+        async for line in cls._lines(body):
+            line_number += 1
+            record = f"{record}\n{line}" if record else line
+            record_line = record_line or line_number
+            # Um campo entre aspas pode conter quebras de linha; espera fechar as aspas.
+            if record.count('"') % 2:
+                continue
+
+            text, start = record, record_line
+            record, record_line = "", 0
+            if not text.strip():
+                continue
+
+            values = next(csv.reader([text.rstrip("\r")]))
+            if header is None:
+                header = [name.strip() for name in values]
+                continue
+            if len(values) != len(header):
+                yield start, None, f"Esperadas {len(header)} colunas, encontradas {len(values)}"
+                continue
+
+            row = dict(zip(header, values))
+            try:
+                yield start, cls._normalize_csv_row(row), None
+            except ValueError as e:
+                yield start, row, str(e)
+
+        if record:
+            yield record_line, None, "Aspas não fechadas no fim do arquivo"
+
+    @classmethod
+    def _normalize_csv_row(cls, row: dict) -> dict:
+        row = {key: value.strip() for key, value in row.items() if value is not None}
+        row = {key: value for key, value in row.items() if value != ""}
+        for key in ("price", "discount_percentage", "rating"):
+            if key in row:
+                row[key] = float(row[key])
+        row["images"] = [image for image in row.get("images", "").split("|") if image]
+        row["categories"] = [
+            {"name": name.strip()} for name in row.get("categories", "").split(";") if name.strip()
+        ]
+        return row
+
+    @classmethod
+    async def _import_chunk(cls, session: AsyncSession, chunk: list, report: ProductImportReportModel) -> None:
+        report.total_rows += len(chunk)
+
+        valid: dict[str, tuple[int, ProductCreateModel]] = {}
+        for line, row, error in chunk:
+            if error is not None:
+                cls._add_error(report, line, row, error)
+                continue
+            try:
+                product = ProductCreateModel.model_validate(row)
+            except (ValidationError, TypeError) as e:
+                cls._add_error(report, line, row, cls._format_error(e))
+                continue
+            if product.bar_code in valid:
+                previous_line, _ = valid[product.bar_code]
+                cls._add_error(report, previous_line, row, "bar_code repetido no arquivo; mantida a última linha")
+            valid[product.bar_code] = (line, product)
+
+        if not valid:
+            return
+
+        names = {cat.name for _, product in valid.values() for cat in product.categories}
+        result = await session.execute(
+            select(Category.uid, Category.name).where(Category.name.in_(names), Category.deleted_at.is_(None))
+        )
+        categories = {row.name: row.uid for row in result}
+
+        rows, links = [], {}
+        now = datetime.now()
+        for bar_code, (line, product) in list(valid.items()):
+            missing = [cat.name for cat in product.categories if cat.name not in categories]
+            if not product.categories or missing:
+                del valid[bar_code]
+                message = f"Categorias não encontradas: {', '.join(missing)}" if missing else "Informe ao menos uma categoria"
+                cls._add_error(report, line, {"bar_code": bar_code}, message)
+                continue
+
+            values = product.model_dump(exclude={"uid", "categories", "created_at", "updated_at"})
+            rows.append({**values, "uid": uuid.uuid4(), "created_at": now, "updated_at": now})
+            links[bar_code] = {categories[cat.name] for cat in product.categories}
+
+        if not rows:
+            return
+
+        try:
+            statement = insert(Product).values(rows)
+            statement = statement.on_conflict_do_update(
+                index_elements=[Product.bar_code],
+                # Alvo do índice único parcial: um bar_code excluído logicamente gera um produto novo.
+                index_where=Product.deleted_at.is_(None),
+                set_={column: statement.excluded[column] for column in _UPDATABLE_COLUMNS},
+            ).returning(Product.uid, Product.bar_code)
+            product_ids = {row.bar_code: row.uid for row in await session.execute(statement)}
+
+            await session.execute(
+                delete(ProductCategory).where(ProductCategory.product_id.in_(product_ids.values()))
+            )
+            await session.execute(
+                insert(ProductCategory)
+                .values([
+                    {"product_id": product_ids[bar_code], "category_id": category_id}
+                    for bar_code, category_ids in links.items()
+                    for category_id in category_ids
+                ])
+                .on_conflict_do_nothing()
+            )
+            await session.commit()
+        except SQLAlchemyError as e:
+            await session.rollback()
+            logger.error(f"Erro ao importar bloco de produtos: {e}")
+            for bar_code, (line, _) in valid.items():
+                cls._add_error(report, line, {"bar_code": bar_code}, "Erro ao gravar o bloco no banco de dados")
+            return
+
+        report.imported += len(product_ids)
+        await ProductCache.invalidate_details(product_ids.values())
+
+    @classmethod
+    def _add_error(cls, report: ProductImportReportModel, line: int, row: dict | None, message: str) -> None:
+        report.failed += 1
+        if len(report.errors) >= settings.app.IMPORT_MAX_REPORTED_ERRORS:
+            report.errors_truncated = True
+            return
+        bar_code = row.get("bar_code") if isinstance(row, dict) else None
+        report.errors.append(ProductImportErrorModel(line=line, bar_code=bar_code, message=message))
+
+    @classmethod
+    def _format_error(cls, error: Exception) -> str:
+        if isinstance(error, ValidationError):
+            return "; ".join(
+                f"{'.'.join(str(loc) for loc in err['loc'])}: {err['msg']}" for err in error.errors()
+            )
+        return str(error)
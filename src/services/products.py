@@ -1,19 +1,24 @@
+from collections import defaultdict
 from uuid import UUID
 
-from fastapi_pagination import paginate
-from sqlalchemy import or_
-from sqlalchemy.exc import NoResultFound
+from fastapi_pagination.api import resolve_params
+from sqlalchemy import func, or_
+from sqlalchemy.exc import IntegrityError, NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
 
 from src.core.sentry import send_to_sentry
+from src.db.cache import ProductCache
+from src.db.deletes import delete_row
+from src.db.inserts import insert_unique
 from src.exceptions.errors import (
     ProductAlreadyExistsError,
     CategoryNotFoundError,
+    InvalidCursorError,
+    ProductInUseError,
 )
 from src.models.category import Category, ProductCategory
-from src.models.product import Product
+from src.models.product import Product, PRODUCT_SEARCH_CONFIG
 from src.schemas.categories import CategoryBaseModel
 from src.schemas.products import (
     ProductCreateModel,
@@ -21,6 +26,15 @@ from src.schemas.products import (
     ProductOutModel,
     ProductBaseModel
 )
+from src.utils.pagination import keyset_paginate, paginate_rows
+
+# Colunas de ProductBaseModel: as listagens selecionam só elas, sem montar objetos ORM.
+PRODUCT_LIST_COLUMNS = (
+    Product.uid, Product.title, Product.description, Product.price, Product.bar_code,
+    Product.section, Product.date_validation, Product.stock, Product.brand,
+    Product.discount_percentage, Product.rating, Product.is_published, Product.images,
+    Product.created_at, Product.updated_at,
+)
 
 
 class ProductService:
@@ -29,80 +43,159 @@ class ProductService:
     """
 
     @classmethod
-    async def list_products(cls, session: AsyncSession, product_filter):
+    async def list_products(cls, session: AsyncSession, product_filter, count_mode: str = "exact"):
+        """
+        Lista produtos paginando no banco (LIMIT/OFFSET + count).
+        As categorias são carregadas apenas para os produtos da página.
+
+        Retorna o dict da página pronto para serializar (ver `_rows_to_dicts`).
+        """
         try:
-            query = select(Product).options(
-                selectinload(Product.categories).selectinload(ProductCategory.category)
-            )
-            query = product_filter.filter(query)
-            result = await session.execute(query)
-            products = result.scalars().unique().all()
-
-            products_out: list = []
-            for prod in products:
-                categories = [
-                    CategoryBaseModel(uid=cat.category.uid, name=cat.category.name)
-                    for cat in prod.categories
-                ]
-                prod_dict = prod.model_dump(exclude={"categories"})
-                prod_dict["categories"] = categories
-                product_out = ProductBaseModel(**prod_dict)
-                products_out.append(product_out)
-
-            return paginate(products_out)
+            filter_params = product_filter.model_dump(exclude_none=True)
+            cache_params = {
+                "filter": filter_params,
+                "page": resolve_params().model_dump(),
+                "count": count_mode,
+            }
+            cached = await ProductCache.get_list(cache_params)
+            if cached is not None:
+                return cached
+
+            query = product_filter.filter(select(*PRODUCT_LIST_COLUMNS).where(Product.deleted_at.is_(None)))
+            query = query.order_by(Product.uid)
+
+            page = await paginate_rows(session, query, count_mode, "products", filter_params)
+            page["items"] = await cls._rows_to_dicts(session, page["items"])
+            await ProductCache.set_list(cache_params, page)
+
+            return page
 
         except Exception as e:
             send_to_sentry(e)
 
     @classmethod
-    async def create_product(cls, session, product_data: ProductCreateModel):
+    async def list_products_by_cursor(cls, session: AsyncSession, product_filter, cursor: str | None, size: int):
+        """
+        Lista produtos com paginação por cursor, ordenados por uid.
+        """
+        try:
+            query = product_filter.filter(select(*PRODUCT_LIST_COLUMNS).where(Product.deleted_at.is_(None)))
+
+            page = await keyset_paginate(session, query, [Product.uid], cursor, size)
+            page["items"] = await cls._rows_to_dicts(session, page["items"])
+            return page
+
+        except InvalidCursorError as e:
+            raise InvalidCursorError(message=str(e))
+        except Exception as e:
+            send_to_sentry(e)
+
+    @classmethod
+    async def search_products(cls, session: AsyncSession, search: str, product_filter, count_mode: str = "exact"):
+        """
+        Busca textual ordenada por relevância, paginada no banco.
+
+        Combina o tsvector de título/marca/descrição (índice GIN) com similaridade por
+        trigramas no título (pg_trgm), que tolera erros de digitação.
+        """
         try:
-            # 1. Verifica se o produto já existe pelo bar_code
-            query = await session.execute(
-                select(Product).where(Product.bar_code == product_data.bar_code)
+            search_vector = Product.__table__.c.search_vector
+            ts_query = func.websearch_to_tsquery(PRODUCT_SEARCH_CONFIG, search)
+            rank = func.ts_rank_cd(search_vector, ts_query) + func.similarity(Product.title, search)
+
+            query = select(*PRODUCT_LIST_COLUMNS).where(
+                or_(search_vector.op("@@")(ts_query), Product.title.op("%")(search)),
+                Product.deleted_at.is_(None),
             )
-            existing_bar_code_product = query.scalar_one_or_none()
-            if existing_bar_code_product:
-                raise ProductAlreadyExistsError("Product with this bar code already exists.")
+            query = product_filter.filter(query).order_by(rank.desc(), Product.uid)
+
+            filter_params = {"q": search, **product_filter.model_dump(exclude_none=True)}
+            page = await paginate_rows(session, query, count_mode, "products", filter_params)
+            page["items"] = await cls._rows_to_dicts(session, page["items"])
+            return page
+
+        except Exception as e:
+            send_to_sentry(e)
+
+    @classmethod
+    async def _rows_to_dicts(cls, session: AsyncSession, rows) -> list[dict]:
+        """
+        Monta os itens da listagem direto das linhas, com as categorias da página em uma
+        única consulta. Os dicts vão para o ORJSONResponse sem passar de novo pelo pydantic.
+        """
+        products = [row._asdict() for row in rows]
+        if not products:
+            return products
+
+        result = await session.execute(
+            select(ProductCategory.product_id, Category.uid, Category.name)
+            .join(Category, Category.uid == ProductCategory.category_id)
+            .where(
+                ProductCategory.product_id.in_([product["uid"] for product in products]),
+                Category.deleted_at.is_(None),
+            )
+        )
+        categories = defaultdict(list)
+        for row in result:
+            categories[row.product_id].append({"uid": row.uid, "name": row.name})
+
+        for product in products:
+            product["categories"] = categories.get(product["uid"], [])
+        return products
+
+    @classmethod
+    async def _load_product_out(cls, session: AsyncSession, product_id: UUID) -> ProductBaseModel | None:
+        """
+        Produto ativo com as categorias ativas, pelo mesmo caminho das listagens.
+        """
+        result = await session.execute(
+            select(*PRODUCT_LIST_COLUMNS).where(Product.uid == product_id, Product.deleted_at.is_(None))
+        )
+        row = result.first()
+        if row is None:
+            return None
+        product = (await cls._rows_to_dicts(session, [row]))[0]
+        return ProductBaseModel.model_validate(product)
 
-            # 2. Separa os UIDs e nomes das categorias
+    @classmethod
+    async def create_product(cls, session, product_data: ProductCreateModel):
+        try:
+            # 1. Separa os UIDs e nomes das categorias
             category_uids = [cat.uid for cat in product_data.categories if cat.uid]
             category_names = [cat.name for cat in product_data.categories if cat.name]
 
             if not category_uids and not category_names:
                 raise CategoryNotFoundError("At least one category UID or name must be provided.")
 
-            # 3. Busca as categorias no banco de dados
+            # 2. Busca as categorias no banco de dados
             result = await session.execute(
                 select(Category).where(
                     or_(
                         Category.uid.in_(category_uids),
                         Category.name.in_(category_names)
-                    )
+                    ),
+                    Category.deleted_at.is_(None),
                 )
             )
             found_categories = result.scalars().all()
             if len(found_categories) != len(product_data.categories):
                 raise CategoryNotFoundError("One or more categories were not found.")
 
-            # 4. Cria o produto e associa as categorias
-            product_dict = product_data.model_dump(exclude={"categories"})
-            db_product = Product(**product_dict)
-            db_product.categories = [
-                ProductCategory(product=db_product, category=cat) for cat in found_categories
-            ]
+            # 3. Cria o produto; a unicidade do bar_code é garantida pela constraint
+            product_dict = product_data.model_dump(exclude={"categories"}, exclude_none=True)
+            db_product = await insert_unique(session, Product, Product(**product_dict).model_dump())
+            if db_product is None:
+                raise ProductAlreadyExistsError("Product with this bar code already exists.")
 
-            session.add(db_product)
+            session.add_all([
+                ProductCategory(product_id=db_product.uid, category_id=cat.uid) for cat in found_categories
+            ])
             await session.commit()
-            await session.refresh(db_product)
-
-            # 5. Carrega as categorias associadas para evitar o problema de lazy loading
-            await session.refresh(db_product, attribute_names=["categories"])
+            await ProductCache.invalidate_product()
 
-            #  6. Monta a resposta serializável
+            # 4. Monta a resposta com o que já está em memória (expire_on_commit=False)
             categories_out = [
-                CategoryBaseModel(uid=cat.category.uid, name=cat.category.name)
-                for cat in db_product.categories
+                CategoryBaseModel(uid=cat.uid, name=cat.name) for cat in found_categories
             ]
             product_out = ProductBaseModel(**db_product.model_dump(exclude={"categories"}), categories=categories_out)
 
@@ -122,25 +215,23 @@ class ProductService:
     @classmethod
     async def get_product(cls, session: AsyncSession, product_id: UUID):
         try:
-            result = await session.execute(
-                select(Product)
-                .options(selectinload(Product.categories).selectinload(ProductCategory.category))
-                .where(Product.uid == product_id)
-            )
-            product = result.scalar_one_or_none()
-            if not product:
+            cached = await ProductCache.get_product(product_id)
+            if cached is not None:
+                return ProductOutModel(
+                    message="Produto encontrado com sucesso.",
+                    status="success",
+                    data=ProductBaseModel.model_validate(cached)
+                )
+
+            product_out = await cls._load_product_out(session, product_id)
+            if not product_out:
                 raise NoResultFound("Produto não encontrado")
+            await ProductCache.set_product(product_id, product_out.model_dump(mode="json"))
 
             return ProductOutModel(
                 message="Produto encontrado com sucesso.",
                 status="success",
-                data=ProductBaseModel(
-                    **product.model_dump(exclude={"categories"}),
-                    categories=[
-                        CategoryBaseModel(uid=cat.category.uid, name=cat.category.name)
-                        for cat in product.categories
-                    ]
-                )
+                data=product_out
             )
 
         except NoResultFound as e:
@@ -151,22 +242,27 @@ class ProductService:
     @classmethod
     async def update_product(cls, session: AsyncSession, product_id: UUID, product_data: ProductUpdateModel):
         try:
-            result = await session.execute(select(Product).where(Product.id == product_id))
+            result = await session.execute(
+                select(Product).where(Product.uid == product_id, Product.deleted_at.is_(None))
+            )
             product = result.scalar_one_or_none()
 
             if not product:
                 raise NoResultFound("Produto não encontrado")
-            for key, value in product_data.model_dump(exclude_unset=True).items():
+            # Categorias não são alteradas por aqui; o relacionamento não aceita os dicts do payload.
+            for key, value in product_data.model_dump(exclude_unset=True, exclude={"categories"}).items():
                 setattr(product, key, value)
 
             session.add(product)
             await session.commit()
-            await session.refresh(product)
+            await ProductCache.invalidate_product(product_id)
 
+            # A resposta é montada das colunas, como no get: serializar o ORM tocaria o
+            # relacionamento lazy `categories` fora do contexto async (MissingGreenlet).
             return {
                 "message": "Product updated successfully",
                 "status": "success",
-                "data": product
+                "data": await cls._load_product_out(session, product_id)
             }
         except NoResultFound as e:
             raise NoResultFound(message=str(e))
@@ -176,12 +272,15 @@ class ProductService:
     @classmethod
     async def delete_product(cls, session: AsyncSession, product_id: UUID):
         try:
-            result = await session.execute(select(Product).where(Product.id == product_id))
+            result = await session.execute(
+                select(Product).where(Product.uid == product_id, Product.deleted_at.is_(None))
+            )
             product = result.scalar_one_or_none()
             if not product:
                 raise NoResultFound("Produto não encontrado")
-            await session.delete(product)
+            await delete_row(session, product)
             await session.commit()
+            await ProductCache.invalidate_product(product_id)
             return {
                 "message": "Product deleted successfully",
                 "status": "success",
@@ -189,5 +288,9 @@ class ProductService:
             }
         except NoResultFound as e:
             raise NoResultFound(message=str(e))
+        except IntegrityError:
+            # order_products.product_id é ON DELETE RESTRICT: o histórico de pedidos fica intacto.
+            await session.rollback()
+            raise ProductInUseError("Produto possui pedidos; ative SOFT_DELETE_ENABLED para excluí-lo.")
         except Exception as e:
             send_to_sentry(e)
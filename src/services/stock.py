@@ -0,0 +1,75 @@
+from uuid import UUID
+
+from sqlalchemy import Integer, column, select, update, values
+from sqlalchemy.dialects import postgresql as pg
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.exceptions.errors import InsufficientStockError, ProductNotFoundError
+from src.models.product import Product
+
+
+class StockService:
+
+    @classmethod
+    async def reserve(cls, session: AsyncSession, quantities: dict[UUID, int]) -> dict[UUID, dict]:
+        """
+        Debita o estoque de todos os itens em um único UPDATE ... FROM (VALUES ...) RETURNING.
+
+        As linhas são travadas em ordem de uid (FOR UPDATE) para que pedidos concorrentes
+        com os mesmos produtos não entrem em deadlock, e o `stock >= quantidade` no WHERE
+        garante que nenhum produto fique negativo. Se algum item não puder ser debitado,
+        a transação é desfeita e o erro informa exatamente quais SKUs faltaram.
+
+        Retorna, por produto, o preço e o desconto vigentes no momento da reserva.
+        """
+        product_ids = sorted(quantities)
+        requested = values(
+            column("product_id", pg.UUID(as_uuid=True)),
+            column("quantity", Integer),
+            name="requested",
+        ).data([(product_id, quantities[product_id]) for product_id in product_ids])
+
+        locked = (
+            select(Product.uid)
+            .where(Product.uid.in_(product_ids), Product.deleted_at.is_(None))
+            .order_by(Product.uid)
+            .with_for_update()
+            .cte("locked")
+        )
+        statement = (
+            update(Product)
+            .where(
+                Product.uid == requested.c.product_id,
+                Product.uid.in_(select(locked.c.uid)),
+                Product.stock >= requested.c.quantity,
+            )
+            .values(stock=Product.stock - requested.c.quantity)
+            .returning(Product.uid, Product.price, Product.discount_percentage)
+        )
+        result = await session.execute(statement, execution_options={"synchronize_session": False})
+        reserved = {
+            row.uid: {"price": row.price, "discount_percentage": row.discount_percentage}
+            for row in result
+        }
+
+        short = [product_id for product_id in product_ids if product_id not in reserved]
+        if short:
+            await session.rollback()
+            await cls._raise_shortage(session, short)
+
+        return reserved
+
+    @classmethod
+    async def _raise_shortage(cls, session: AsyncSession, short: list[UUID]) -> None:
+        result = await session.execute(
+            select(Product.uid, Product.bar_code).where(Product.uid.in_(short), Product.deleted_at.is_(None))
+        )
+        found = {row.uid: row.bar_code for row in result}
+
+        missing = [str(product_id) for product_id in short if product_id not in found]
+        if missing:
+            raise ProductNotFoundError(f"Produtos não encontrados: {', '.join(missing)}")
+
+        raise InsufficientStockError(
+            f"Estoque insuficiente para: {', '.join(found[product_id] for product_id in short)}"
+        )
@@ -1,13 +1,25 @@
+import os
 from unittest.mock import Mock
+from uuid import uuid4
 
 import pytest
 import pytest_asyncio
+from fastapi_pagination import add_pagination
 from httpx import AsyncClient, ASGITransport
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src import app
+from src.auth.cache import Principal
 from src.auth.dependencies import AccessTokenBearer, RefreshTokenBearer
-from src.auth.security import RoleChecker
-from src.db.database import get_session
+from src.auth.security import RoleChecker, get_current_user
+from src.core.settings import settings
+from src.db.database import get_read_session, get_session
+from src.db.partitions import ensure_partitions
+from src.db.query_stats import install_query_instrumentation
 
 mock_session = Mock()
 mock_user_service = Mock()
@@ -25,6 +37,14 @@ app.dependency_overrides[get_session] = get_mock_session
 app.dependency_overrides[role_checker] = Mock()
 app.dependency_overrides[refresh_token_bearer] = Mock()
 
+# O ASGITransport não roda o lifespan, onde o add_pagination alcança as rotas incluídas
+# depois dele; sem isso as rotas paginadas não recebem os parâmetros de página.
+add_pagination(app)
+
+# Testes de integração rodam contra um PostgreSQL descartável (o schema é recriado a cada
+# teste); sem TEST_DATABASE_URL eles são pulados.
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
 
 @pytest.fixture
 def fake_session():
@@ -42,8 +62,71 @@ def fake_user_service():
     return mock_user_service
 
 
+@pytest.fixture
+def as_role():
+    """
+    Authenticate the requests as a verified user with the given role.
+    """
+    def authenticate(role: str) -> Principal:
+        principal = Principal(uid=uuid4(), email=f"{role}@test.com", role=role, is_verified=True, is_active=True)
+        app.dependency_overrides[get_current_user] = lambda: principal
+        return principal
+
+    yield authenticate
+    app.dependency_overrides.pop(get_current_user, None)
+
+
 @pytest_asyncio.fixture
 async def client():
     transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+    async with AsyncClient(transport=transport, base_url="http://localhost") as ac:
+        yield ac
+
+
+@pytest_asyncio.fixture
+async def pg_engine():
+    """
+    Engine for the test database, with the schema recreated and the statement counters on.
+    """
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL não configurada")
+
+    engine = create_async_engine(TEST_DATABASE_URL, poolclass=NullPool)
+    install_query_instrumentation(engine)
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await conn.run_sync(SQLModel.metadata.drop_all)
+        await conn.run_sync(SQLModel.metadata.create_all)
+        await ensure_partitions(conn, months_ahead=1)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def db_sessionmaker(pg_engine):
+    return async_sessionmaker(bind=pg_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@pytest_asyncio.fixture
+async def db_session(db_sessionmaker):
+    async with db_sessionmaker() as session:
+        yield session
+
+
+@pytest_asyncio.fixture
+async def db_client(db_sessionmaker, monkeypatch):
+    """
+    Client whose read and write sessions go to the test database, without Redis caches.
+    """
+    async def get_test_session():
+        async with db_sessionmaker() as session:
+            yield session
+
+    monkeypatch.setattr(settings.redis, "PRODUCT_CACHE_ENABLED", False)
+    app.dependency_overrides[get_session] = get_test_session
+    app.dependency_overrides[get_read_session] = get_test_session
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://localhost") as ac:
         yield ac
+    app.dependency_overrides[get_session] = get_mock_session
+    app.dependency_overrides.pop(get_read_session, None)
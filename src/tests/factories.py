@@ -0,0 +1,74 @@
+from datetime import datetime
+from uuid import uuid4
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.models.address import Address
+from src.models.category import Category, ProductCategory
+from src.models.customer import Customer
+from src.models.orders import Order, OrderKey, OrderProduct, OrderStatusEnum
+from src.models.product import Product
+
+
+async def create_category(session: AsyncSession, name: str = "Camisas") -> Category:
+    category = Category(uid=uuid4(), name=name)
+    session.add(category)
+    await session.commit()
+    return category
+
+
+async def create_product(
+        session: AsyncSession, categories: list[Category] = (), bar_code: str | None = None, **fields
+) -> Product:
+    product = Product(
+        uid=uuid4(),
+        title=fields.pop("title", "Camisa polo"),
+        description=fields.pop("description", "Algodão"),
+        price=fields.pop("price", 100.0),
+        stock=fields.pop("stock", 10),
+        brand="Lu",
+        bar_code=bar_code or uuid4().hex,
+        section=fields.pop("section", "masculino"),
+        is_published=True,
+        **fields,
+    )
+    session.add(product)
+    session.add_all([ProductCategory(product_id=product.uid, category_id=category.uid) for category in categories])
+    await session.commit()
+    return product
+
+
+async def create_customer(session: AsyncSession, email: str | None = None, **fields) -> Customer:
+    customer = Customer(
+        uid=uuid4(),
+        email=email or f"{uuid4().hex[:8]}@test.com",
+        username="cliente",
+        password_hash="x",
+        is_verified=True,
+        **fields,
+    )
+    session.add(customer)
+    session.add(Address(
+        customer_id=customer.uid, address_type="casa", street="Rua A", city="Vitória",
+        state="ES", country="BR", number=1, postal_code="29000000",
+    ))
+    await session.commit()
+    return customer
+
+
+async def create_order(
+        session: AsyncSession, customer: Customer, products: list[Product], created_at: datetime | None = None
+) -> Order:
+    order = Order(
+        uid=uuid4(),
+        customer_id=customer.uid,
+        status=OrderStatusEnum.paid,
+        created_at=created_at or datetime.now(),
+        products=[
+            OrderProduct(product_id=product.uid, quantity=1, unit_price=product.price) for product in products
+        ],
+    )
+    session.add(order)
+    session.add(OrderKey(uid=order.uid, created_at=order.created_at))
+    await session.commit()
+    return order
@@ -0,0 +1,22 @@
+import pytest
+
+
+EXPORT_PATHS = ["/api/v1/orders/export", "/api/v1/orders/items/export", "/api/v1/customers/export"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path", EXPORT_PATHS)
+async def test_exports_require_authentication(client, path):
+    response = await client.get(path)
+
+    assert response.status_code in (401, 403)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path", EXPORT_PATHS)
+async def test_exports_are_admin_only(client, as_role, path):
+    as_role("customer")
+
+    response = await client.get(path)
+
+    assert response.status_code == 403
@@ -0,0 +1,94 @@
+import asyncio
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql
+
+from src.db.partitions import month_start
+from src.filters.orders import order_created_at
+from src.models.address import Address
+from src.models.orders import Order, OrderKey
+from src.services import orders as orders_service
+from src.services.orders import OrderService
+from src.tests.factories import create_customer, create_order, create_product
+
+
+def _order(total: float) -> Order:
+    return Order(customer_id=None, status="paid", created_at=datetime(2025, 6, 1, 10), total_price=total, products=[])
+
+
+@pytest.mark.asyncio
+async def test_daily_sales_shards_do_not_block_each_other(db_sessionmaker, monkeypatch):
+    shards = iter([0, 1])
+    monkeypatch.setattr(orders_service.random, "randrange", lambda _: next(shards))
+
+    async with db_sessionmaker() as first, db_sessionmaker() as second:
+        await OrderService._record_daily_sales(first, _order(10.0))
+        # A primeira transação segue aberta (com o lock do shard 0); a segunda não espera por ela.
+        await asyncio.wait_for(OrderService._record_daily_sales(second, _order(5.0)), timeout=2)
+        await second.commit()
+        await first.commit()
+
+    async with db_sessionmaker() as session:
+        stats = await OrderService.get_stats(session, date(2025, 6, 1), date(2025, 6, 1))
+
+    assert stats.orders_count == 2
+    assert stats.revenue == 15.0
+    assert [(day.day, day.orders_count, day.revenue) for day in stats.days] == [(date(2025, 6, 1), 2, 15.0)]
+
+
+@pytest.mark.asyncio
+async def test_created_order_is_found_by_uid(db_client, db_session):
+    customer = await create_customer(db_session)
+    product = await create_product(db_session, stock=3)
+    address = await db_session.scalar(select(Address).where(Address.customer_id == customer.uid))
+
+    response = await db_client.post("/api/v1/orders/", json={
+        "customer_id": str(customer.uid),
+        "status": "paid",
+        "items": [{"product_id": str(product.uid), "quantity": 2}],
+        "shipping_address": address.model_dump(mode="json"),
+    })
+    assert response.status_code == 201, response.text
+    order_id = response.json()["data"]["uid"]
+
+    key = await db_session.scalar(select(OrderKey).where(OrderKey.uid == order_id))
+    assert key is not None
+    response = await db_client.get(f"/api/v1/orders/{order_id}")
+    assert response.status_code == 200, response.text
+    assert response.json()["uid"] == order_id
+    response = await db_client.get("/api/v1/orders/", params={"uid": order_id})
+    assert [order["uid"] for order in response.json()["items"]] == [order_id]
+
+
+@pytest.mark.asyncio
+async def test_order_lookup_by_uid_reads_a_single_partition(pg_engine, db_session):
+    customer = await create_customer(db_session)
+    product = await create_product(db_session)
+    now, next_month = datetime.now(), month_start(date.today(), 1)
+    order = await create_order(db_session, customer, [product], created_at=now)
+    await create_order(db_session, customer, [product], created_at=datetime(next_month.year, next_month.month, 2))
+
+    query = select(Order.uid).where(Order.uid == order.uid, Order.created_at == order_created_at(order.uid))
+    sql = query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    async with pg_engine.connect() as conn:
+        plan = (await conn.execute(text(f"EXPLAIN (ANALYZE, FORMAT JSON) {sql}"))).scalar()[0]["Plan"]
+
+    def scanned(node: dict) -> list[str]:
+        relation = node.get("Relation Name", "")
+        names = [relation] if relation.startswith("orders_p") and node.get("Actual Loops") else []
+        return names + [name for child in node.get("Plans", []) for name in scanned(child)]
+
+    assert scanned(plan) == [f"orders_p{now:%Y_%m}"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("role", [None, "customer"])
+async def test_sales_stats_are_admin_only(client, as_role, role):
+    if role:
+        as_role(role)
+
+    response = await client.get("/api/v1/orders/stats")
+
+    assert response.status_code in (401, 403)
@@ -0,0 +1,53 @@
+import base64
+import json
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from src.exceptions.errors import InvalidCursorError
+from src.utils.pagination import decode_cursor, encode_cursor
+
+
+def _raw_cursor(payload) -> str:
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+
+@pytest.mark.parametrize("direction", ["next", "prev"])
+def test_cursor_round_trip(direction):
+    values = [datetime(2025, 3, 1, 12, 30, 15, 123456), uuid4(), 42.5, "Camisa"]
+
+    cursor = encode_cursor(direction, values)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor, len(values)) == (direction, values)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "não é base64",
+        base64.urlsafe_b64encode(b"\xff\xfe").decode(),
+        _raw_cursor([1, 2]),
+        _raw_cursor({"d": "next"}),
+        _raw_cursor({"d": "next", "k": 5}),
+        _raw_cursor({"d": "next", "k": [["dt"]]}),
+        _raw_cursor({"d": "next", "k": [["dt", "ontem"]]}),
+        _raw_cursor({"d": "next", "k": [["uuid", "123"]]}),
+        _raw_cursor({"d": "up", "k": [["raw", 1]]}),
+        _raw_cursor({"d": "next", "k": [["raw", 1], ["raw", 2]]}),
+    ],
+)
+def test_decode_cursor_rejects_malformed_cursors(cursor):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, 1)
+
+
+@pytest.mark.asyncio
+async def test_malformed_cursor_is_a_bad_request(client, as_role):
+    as_role("admin")
+
+    response = await client.get("/api/v1/customers/cursor", params={"cursor": "nada"})
+
+    assert response.status_code == 400
+    assert response.json()["error_code"] == "invalid_cursor"
@@ -0,0 +1,42 @@
+from datetime import date
+
+import pytest
+from sqlalchemy import text
+
+from src.db.partitions import ensure_partitions, month_start, partition_name
+
+
+@pytest.mark.parametrize(
+    "day, offset, expected",
+    [
+        (date(2025, 6, 17), 0, date(2025, 6, 1)),
+        (date(2025, 6, 1), 1, date(2025, 7, 1)),
+        (date(2025, 11, 30), 2, date(2026, 1, 1)),
+        (date(2025, 12, 31), 1, date(2026, 1, 1)),
+        (date(2025, 1, 15), 12, date(2026, 1, 1)),
+        (date(2025, 1, 15), 25, date(2027, 2, 1)),
+    ],
+)
+def test_month_start_rolls_over_years(day, offset, expected):
+    assert month_start(day, offset) == expected
+
+
+def test_partition_name_is_zero_padded():
+    assert partition_name("orders", date(2026, 3, 1)) == "orders_p2026_03"
+
+
+@pytest.mark.asyncio
+async def test_ensure_partitions_creates_missing_months_once(pg_engine):
+    async with pg_engine.begin() as conn:
+        created = await ensure_partitions(conn, months_ahead=2, today=date(2030, 12, 5))
+        again = await ensure_partitions(conn, months_ahead=2, today=date(2030, 12, 5))
+        bound = await conn.scalar(text(
+            "SELECT pg_get_expr(relpartbound, oid) FROM pg_class WHERE relname = 'orders_p2031_02'"
+        ))
+
+    assert created == [
+        "orders_p2030_12", "orders_p2031_01", "orders_p2031_02",
+        "order_products_p2030_12", "order_products_p2031_01", "order_products_p2031_02",
+    ]
+    assert again == []
+    assert bound == "FOR VALUES FROM ('2031-02-01 00:00:00') TO ('2031-03-01 00:00:00')"
@@ -0,0 +1,46 @@
+import asyncio
+import threading
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.core.settings import settings
+from src.exceptions.errors import PasswordHashingBusyError
+from src.services.accounts import UserService
+from src.utils.passwords import PasswordHasher
+
+
+@pytest.fixture
+def one_slot(monkeypatch):
+    monkeypatch.setattr(settings.security, "PASSWORD_HASH_MAX_PENDING", 1)
+    monkeypatch.setattr(settings.security, "PASSWORD_HASH_EXECUTOR", "thread")
+    monkeypatch.setattr(PasswordHasher, "_pending", 0)
+    monkeypatch.setattr(PasswordHasher, "_executor", None)
+    yield
+    PasswordHasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_hasher_rejects_work_beyond_the_pending_limit(one_slot):
+    release = threading.Event()
+    running = asyncio.create_task(PasswordHasher._run(release.wait))
+    await asyncio.sleep(0.01)
+
+    with pytest.raises(PasswordHashingBusyError):
+        await PasswordHasher.hash("segredo")
+
+    release.set()
+    assert await running is True
+    assert PasswordHasher._pending == 0
+    assert await PasswordHasher.verify("segredo", await PasswordHasher.hash("segredo")) is True
+
+
+@pytest.mark.asyncio
+async def test_login_answers_503_while_the_hasher_is_saturated(client, one_slot, monkeypatch):
+    monkeypatch.setattr(UserService, "get_user_by_email", AsyncMock(return_value=Mock(password_hash="x")))
+    monkeypatch.setattr(PasswordHasher, "_pending", 1)
+
+    response = await client.post("/api/v1/auth/login", json={"email": "cliente@test.com", "password": "Segredo@12"})
+
+    assert response.status_code == 503
+    assert response.json()["error_code"] == "password_hashing_busy"
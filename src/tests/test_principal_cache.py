@@ -0,0 +1,67 @@
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from src.auth.cache import Principal, PrincipalCache
+from src.auth.security import get_current_user
+from src.core.settings import settings
+from src.services.accounts import UserService
+
+
+def _principal(email: str = "cliente@test.com") -> Principal:
+    return Principal(uid=uuid4(), email=email, role="customer", is_verified=True, is_active=True)
+
+
+@pytest.fixture(autouse=True)
+def local_cache(monkeypatch):
+    monkeypatch.setattr(PrincipalCache, "_entries", type(PrincipalCache._entries)())
+    monkeypatch.setattr(settings.auth, "PRINCIPAL_CACHE_REDIS", False)
+    monkeypatch.setattr(settings.auth, "PRINCIPAL_CACHE_TTL", 30)
+
+
+@pytest.mark.asyncio
+async def test_current_user_is_loaded_once_while_cached(monkeypatch):
+    principal = _principal()
+    lookup = AsyncMock(return_value=principal)
+    monkeypatch.setattr(UserService, "get_principal_by_email", lookup)
+
+    for _ in range(3):
+        assert await get_current_user({"email": principal.email}, session=None) == principal
+
+    lookup.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_invalidate_forces_a_new_lookup(monkeypatch):
+    principal = _principal()
+    lookup = AsyncMock(return_value=principal)
+    monkeypatch.setattr(UserService, "get_principal_by_email", lookup)
+
+    await get_current_user({"email": principal.email}, session=None)
+    await PrincipalCache.invalidate(principal.email, None)
+    assert await PrincipalCache.get(principal.email) is None
+    await get_current_user({"email": principal.email}, session=None)
+
+    assert lookup.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_expired_entries_are_dropped(monkeypatch):
+    monkeypatch.setattr(settings.auth, "PRINCIPAL_CACHE_TTL", 0)
+    await PrincipalCache.set(_principal())
+
+    assert await PrincipalCache.get("cliente@test.com") is None
+    assert "cliente@test.com" not in PrincipalCache._entries
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_entry_is_evicted(monkeypatch):
+    monkeypatch.setattr(settings.auth, "PRINCIPAL_CACHE_MAXSIZE", 2)
+    for email in ("a@test.com", "b@test.com"):
+        await PrincipalCache.set(_principal(email))
+
+    await PrincipalCache.get("a@test.com")
+    await PrincipalCache.set(_principal("c@test.com"))
+
+    assert list(PrincipalCache._entries) == ["a@test.com", "c@test.com"]
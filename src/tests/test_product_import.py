@@ -0,0 +1,93 @@
+import json
+
+import pytest
+from sqlalchemy import select
+
+from src.core.settings import settings
+from src.models.product import Product
+from src.services.product_import import ProductImportService
+from src.tests.factories import create_category
+
+
+async def _body(text: str, chunk_size: int = 7):
+    # Blocos pequenos para cortar linhas e caracteres multibyte ao meio, como no stream real.
+    data = text.encode()
+    for start in range(0, len(data), chunk_size):
+        yield data[start:start + chunk_size]
+
+
+async def _collect(records) -> list:
+    return [record async for record in records]
+
+
+CSV_HEADER = "title,description,price,bar_code,section,stock,discount_percentage,categories\n"
+
+
+@pytest.mark.asyncio
+async def test_csv_reader_reports_each_bad_row():
+    body = "﻿" + CSV_HEADER + (
+        'Camisa,"Algodão\ncom gola",99.9,A1,masculino,5,0,Camisas;Polo\n'
+        "Calça,Jeans,120,A2\n"
+        "Bermuda,Sarja,barato,A3,masculino,1,0,Bermudas\n"
+        "\n"
+        'Meia,"sem fim,10,A4,masculino,1,0,Meias\n'
+    )
+
+    records = await _collect(ProductImportService._read_csv(_body(body)))
+
+    assert [(line, error) for line, _, error in records] == [
+        (2, None),
+        (4, "Esperadas 8 colunas, encontradas 4"),
+        (5, "could not convert string to float: 'barato'"),
+        (7, "Aspas não fechadas no fim do arquivo"),
+    ]
+    line, row, _ = records[0]
+    assert row["description"] == "Algodão\ncom gola"
+    assert row["price"] == 99.9
+    assert row["categories"] == [{"name": "Camisas"}, {"name": "Polo"}]
+    assert records[2][1]["bar_code"] == "A3"
+
+
+@pytest.mark.asyncio
+async def test_ndjson_reader_reports_each_bad_line():
+    body = "\n".join([
+        json.dumps({"title": "Camisa", "categories": ["Camisas", {"name": "Polo"}]}),
+        "{quebrado",
+        "",
+        json.dumps(["não", "objeto"]),
+        json.dumps({"title": "Calça"}),
+    ])
+
+    records = await _collect(ProductImportService._read_ndjson(_body(body)))
+
+    assert [(line, error is None) for line, _, error in records] == [(1, True), (2, False), (4, False), (5, True)]
+    assert records[0][1]["categories"] == [{"name": "Camisas"}, {"name": "Polo"}]
+    assert records[1][2].startswith("JSON inválido")
+    assert records[2][2] == "JSON inválido: a linha deve ser um objeto JSON"
+    assert records[3][1]["categories"] == []
+
+
+@pytest.mark.asyncio
+async def test_import_reports_rejected_rows_and_keeps_the_valid_ones(db_session, monkeypatch):
+    monkeypatch.setattr(settings.redis, "PRODUCT_CACHE_ENABLED", False)
+    await create_category(db_session, "Camisas")
+    row = {"title": "Camisa", "description": "Algodão", "price": 99.9, "section": "masculino", "stock": 5,
+           "brand": "Lu", "discount_percentage": 0, "categories": ["Camisas"]}
+    body = "\n".join(json.dumps(line) for line in [
+        {**row, "bar_code": "B1"},
+        {**row, "bar_code": "B2", "discount_percentage": 150},
+        {**row, "bar_code": "B3", "categories": ["Inexistente"]},
+        {**row, "bar_code": "B4", "categories": []},
+        {**row, "bar_code": "B1", "title": "Camisa nova"},
+    ])
+
+    report = await ProductImportService.import_products(db_session, _body(body), "ndjson")
+
+    assert (report.total_rows, report.imported, report.failed) == (5, 1, 4)
+    assert {(error.line, error.bar_code) for error in report.errors} == {(1, "B1"), (2, "B2"), (3, "B3"), (4, "B4")}
+    messages = {error.line: error.message for error in report.errors}
+    assert "discount_percentage" in messages[2]
+    assert messages[3] == "Categorias não encontradas: Inexistente"
+    assert messages[4] == "Informe ao menos uma categoria"
+    titles = (await db_session.execute(select(Product.bar_code, Product.title))).all()
+    assert titles == [("B1", "Camisa nova")]
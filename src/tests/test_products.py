@@ -0,0 +1,64 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.core.responses import orjson_dumps
+from src.services.products import ProductService
+from src.tests.factories import create_category, create_product
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "method, path",
+    [
+        ("list_products", "/api/v1/products/"),
+        ("list_products_by_cursor", "/api/v1/products/cursor"),
+        ("search_products", "/api/v1/products/search?q=camisa"),
+    ],
+)
+async def test_product_listing_failure_is_not_a_200_null(client, as_role, monkeypatch, method, path):
+    as_role("customer")
+    monkeypatch.setattr(ProductService, method, AsyncMock(return_value=None))
+
+    response = await client.get(path)
+
+    assert response.status_code == 500
+    assert response.json()["error_code"] == "error_response"
+
+
+@pytest.mark.asyncio
+async def test_product_listing_is_serialized_with_orjson(client, as_role, monkeypatch):
+    as_role("customer")
+    page = {"items": [], "total": 0, "page": 1, "size": 50, "pages": 0, "total_exact": True}
+    monkeypatch.setattr(ProductService, "list_products", AsyncMock(return_value=page))
+
+    response = await client.get("/api/v1/products/")
+
+    assert response.status_code == 200
+    assert response.json() == page
+
+
+@pytest.mark.asyncio
+async def test_update_product_returns_its_categories(db_client, db_session, as_role):
+    as_role("admin")
+    category = await create_category(db_session, "Camisas")
+    product = await create_product(db_session, [category], title="Camisa polo")
+    payload = {
+        "title": "Camisa polo slim", "description": "Algodão", "price": 120.0, "bar_code": product.bar_code,
+        "section": "masculino", "stock": 5, "discount_percentage": 0,
+    }
+
+    response = await db_client.put(f"/api/v1/products/{product.uid}", json=payload)
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["title"] == "Camisa polo slim"
+    assert [category["name"] for category in data["categories"]] == ["Camisas"]
+
+
+def test_orjson_serializes_asyncpg_uuids():
+    from asyncpg.pgproto.pgproto import UUID as AsyncpgUUID
+
+    uid = AsyncpgUUID("6f9619ff-8b86-d011-b42d-00c04fc964ff")
+
+    assert orjson_dumps({"uid": uid}) == b'{"uid":"6f9619ff-8b86-d011-b42d-00c04fc964ff"}'
@@ -0,0 +1,123 @@
+"""
+Regression guard for the number of SQL statements per request, read from the
+QueryStats the access middleware starts for each request.
+"""
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+
+from src.db.inserts import insert_unique
+from src.db.query_stats import get_query_stats, start_query_stats
+from src.models.address import Address
+from src.models.customer import Customer
+from src.tests.factories import create_category, create_customer, create_order, create_product
+
+
+async def _statements(client, path: str) -> int:
+    response = await client.get(path)
+    assert response.status_code == 200, response.text
+    return get_query_stats().count
+
+
+async def _write_statements(client, path: str, payload: dict) -> int:
+    response = await client.post(path, json=payload)
+    assert response.status_code == 201, response.text
+    return get_query_stats().count
+
+
+@pytest.mark.asyncio
+async def test_product_listing_statements_do_not_grow_with_the_page(db_client, db_session, as_role):
+    as_role("customer")
+    category = await create_category(db_session)
+    for _ in range(5):
+        await create_product(db_session, [category])
+
+    # count(*) + página + categorias da página
+    assert await _statements(db_client, "/api/v1/products/?size=5") == 3
+    assert await _statements(db_client, "/api/v1/products/cursor?size=5") == 2
+
+
+@pytest.mark.asyncio
+async def test_customer_listing_statements_do_not_grow_with_the_page(db_client, db_session, as_role):
+    as_role("admin")
+    for _ in range(5):
+        await create_customer(db_session)
+
+    assert await _statements(db_client, "/api/v1/customers/?size=5") == 2
+    # Os endereços da página vêm em uma única consulta extra.
+    assert await _statements(db_client, "/api/v1/customers/?size=5&include_addresses=true") == 3
+
+
+@pytest.mark.asyncio
+async def test_order_listing_statements_do_not_grow_with_the_page(db_client, db_session, as_role):
+    as_role("admin")
+    customer = await create_customer(db_session)
+    products = [await create_product(db_session) for _ in range(3)]
+    for _ in range(5):
+        await create_order(db_session, customer, products)
+
+    # count(*) + página + itens dos pedidos (selectinload)
+    assert await _statements(db_client, "/api/v1/orders/?size=5") == 3
+    assert await _statements(db_client, "/api/v1/orders/cursor?size=5") == 2
+
+
+@pytest.mark.asyncio
+async def test_insert_unique_is_a_single_statement(db_session):
+    stats = start_query_stats()
+
+    customer = await insert_unique(
+        db_session, Customer, Customer(uid=uuid4(), email="novo@test.com", password_hash="x").model_dump()
+    )
+    duplicate = await insert_unique(
+        db_session, Customer, Customer(uid=uuid4(), email="novo@test.com", password_hash="x").model_dump()
+    )
+
+    # Sem o noload, o relacionamento selectin de endereços custaria um SELECT a mais.
+    assert stats.count == 2
+    assert customer.addresses == []
+    assert duplicate is None
+
+
+@pytest.mark.asyncio
+async def test_create_product_statements(db_client, db_session, as_role):
+    as_role("admin")
+    categories = [await create_category(db_session, name) for name in ("Camisas", "Polo")]
+
+    # categorias + INSERT ... RETURNING do produto + vínculos com as categorias
+    assert await _write_statements(db_client, "/api/v1/products/", {
+        "title": "Camisa polo", "description": "Algodão", "price": 100.0, "bar_code": "789100",
+        "section": "masculino", "stock": 10, "brand": "Lu", "discount_percentage": 0,
+        "categories": [{"uid": str(category.uid), "name": category.name} for category in categories],
+    }) == 3
+
+
+@pytest.mark.asyncio
+async def test_create_customer_statements(db_client, as_role):
+    as_role("admin")
+
+    # INSERT ... RETURNING do cliente + endereço
+    assert await _write_statements(db_client, "/api/v1/customers/", {
+        "username": "cliente", "email": "novo@test.com", "first_name": "Ana", "last_name": "Silva",
+        "cpf": "12345678901", "password": "Segredo@12",
+        "address": {
+            "address_type": "casa", "street": "Rua A", "number": 1, "city": "Vitória",
+            "state": "ES", "country": "BR", "postal_code": "29000000",
+        },
+    }) == 2
+
+
+@pytest.mark.asyncio
+async def test_create_order_statements(db_client, db_session):
+    customer = await create_customer(db_session)
+    products = [await create_product(db_session) for _ in range(3)]
+    address = await db_session.scalar(select(Address).where(Address.customer_id == customer.uid))
+
+    # cliente + endereço + reserva do estoque (um UPDATE) + pedido + itens + chave de partição
+    # + agregado diário; o número não cresce com a quantidade de itens.
+    assert await _write_statements(db_client, "/api/v1/orders/", {
+        "customer_id": str(customer.uid),
+        "status": "paid",
+        "items": [{"product_id": str(product.uid), "quantity": 1} for product in products],
+        "shipping_address": address.model_dump(mode="json"),
+    }) == 7
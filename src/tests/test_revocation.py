@@ -0,0 +1,133 @@
+import fnmatch
+import time
+from uuid import uuid4
+
+import pytest
+from prometheus_client import REGISTRY
+
+from src.auth import revocation
+from src.auth.revocation import RevocationRegistry
+from src.db import redis as redis_module
+from src.db.redis import backfill_revoked_jtis, revoked_jtis
+
+
+def _checks(result: str) -> float:
+    return REGISTRY.get_sample_value("jwt_revocation_checks_total", {"result": result}) or 0.0
+
+
+@pytest.fixture
+def synced_mirror(monkeypatch):
+    async def token_in_blocklist(jti):
+        return jti == "revoked"
+
+    monkeypatch.setattr(revocation, "token_in_blocklist", token_in_blocklist)
+    monkeypatch.setattr(RevocationRegistry, "_revoked", {"revoked": time.time() + 60})
+    monkeypatch.setattr(RevocationRegistry, "_synced", True)
+    monkeypatch.setattr(RevocationRegistry, "_saturated", False)
+    monkeypatch.setattr(RevocationRegistry, "_counters", dict.fromkeys(RevocationRegistry._counters, 0))
+
+
+@pytest.mark.asyncio
+async def test_revocation_checks_are_exported_as_metrics(client, synced_mirror):
+    before = {result: _checks(result) for result in ("hit", "miss", "confirmed", "fallback")}
+
+    assert await RevocationRegistry.is_revoked("revoked") is True
+    assert await RevocationRegistry.is_revoked("valid") is False
+    RevocationRegistry._synced = False
+    assert await RevocationRegistry.is_revoked("valid") is False
+
+    assert {result: _checks(result) - before[result] for result in before} == {
+        "hit": 1, "miss": 1, "confirmed": 1, "fallback": 1,
+    }
+    response = await client.get("/metrics")
+    assert "jwt_revocation_checks_total" in response.text
+    assert "jwt_revocation_mirror_size" in response.text
+
+
+@pytest.mark.asyncio
+async def test_revocation_healthcheck_reports_the_mirror(client, synced_mirror):
+    await RevocationRegistry.is_revoked("valid")
+
+    response = await client.get("/api/v1/healthcheck/revocation")
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "hits": 0, "misses": 1, "confirmed": 0, "fallbacks": 0, "size": 1, "synced": True, "saturated": False,
+    }
+
+
+class InMemoryBlocklist:
+    """
+    The handful of Redis commands the blocklist backfill uses, over plain dicts.
+    """
+
+    def __init__(self):
+        self.values: dict[bytes, tuple[bytes, float | None]] = {}
+        self.zset: dict[str, float] = {}
+        self.scans = 0
+
+    def put(self, key: str, value: str, ttl: float | None = None) -> None:
+        self.values[key.encode()] = (value.encode(), time.time() + ttl if ttl else None)
+
+    async def exists(self, key):
+        return int(key.encode() in self.values)
+
+    async def set(self, key, value):
+        self.put(key, value)
+
+    async def zadd(self, key, mapping):
+        self.zset.update(mapping)
+
+    async def zrangebyscore(self, key, low, high, withscores=False):
+        return [(jti.encode(), score) for jti, score in self.zset.items() if score >= low]
+
+    async def scan_iter(self, match, count):
+        self.scans += 1
+        for key in list(self.values):
+            if fnmatch.fnmatchcase(key.decode(), match):
+                yield key
+
+    def pipeline(self, transaction=False):
+        return _Pipeline(self)
+
+
+class _Pipeline:
+    def __init__(self, store: InMemoryBlocklist):
+        self.store, self.replies = store, []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def get(self, key):
+        self.replies.append(self.store.values.get(key, (None, None))[0])
+
+    def pttl(self, key):
+        _, expires_at = self.store.values.get(key, (None, None))
+        self.replies.append(-1 if expires_at is None else int((expires_at - time.time()) * 1000))
+
+    async def execute(self):
+        return self.replies
+
+
+@pytest.mark.asyncio
+async def test_backfill_copies_jtis_revoked_before_the_zset(monkeypatch):
+    store = InMemoryBlocklist()
+    monkeypatch.setattr(redis_module, "token_blocklist", store)
+    legacy = [str(uuid4()) for _ in range(3)]
+    for jti in legacy:
+        store.put(jti, "", ttl=600)
+    store.put(str(uuid4()), "outro valor", ttl=600)
+    store.put(str(uuid4()), "")  # sem TTL: não foi gravada pelo logout
+    store.put("principal:cliente@test.com", "", ttl=600)
+
+    assert await backfill_revoked_jtis(batch_size=2) == 3
+
+    bootstrapped = dict(await revoked_jtis())
+    assert sorted(bootstrapped) == sorted(legacy)
+    assert all(time.time() + 590 < expires_at <= time.time() + 600 for expires_at in bootstrapped.values())
+    # Uma vez feito, os próximos workers não varrem as chaves de novo.
+    assert await backfill_revoked_jtis() == 0
+    assert store.scans == 1
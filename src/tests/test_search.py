@@ -0,0 +1,98 @@
+"""
+Product search (tsvector + pg_trgm) against the test database, plus a comparison with
+the title__ilike listing it replaces.
+"""
+import statistics
+import time
+
+import pytest
+from sqlalchemy import text
+
+from src.tests.factories import create_category, create_product
+
+
+async def _search(client, q: str) -> list[str]:
+    response = await client.get("/api/v1/products/search", params={"q": q})
+    assert response.status_code == 200, response.text
+    return [item["title"] for item in response.json()["items"]]
+
+
+@pytest.mark.asyncio
+async def test_title_matches_rank_above_description_matches(db_client, db_session, as_role):
+    as_role("customer")
+    category = await create_category(db_session)
+    await create_product(db_session, [category], title="Bermuda sarja", description="Combina com jaqueta jeans")
+    await create_product(db_session, [category], title="Jaqueta jeans", description="Algodão")
+    await create_product(db_session, [category], title="Sapato social", description="Couro")
+
+    assert await _search(db_client, "jaqueta") == ["Jaqueta jeans", "Bermuda sarja"]
+
+
+@pytest.mark.asyncio
+async def test_misspelled_terms_are_found_by_trigram_similarity(db_client, db_session, as_role):
+    as_role("customer")
+    category = await create_category(db_session)
+    await create_product(db_session, [category], title="Camiseta", description="Algodão")
+    await create_product(db_session, [category], title="Bermuda", description="Sarja")
+
+    assert await _search(db_client, "camisetta") == ["Camiseta"]
+    assert await _search(db_client, "camisetta") == await _search(db_client, "camiseta")
+
+
+SEED_PRODUCTS = """
+INSERT INTO products (
+    uid, title, description, price, stock, brand, bar_code, section,
+    discount_percentage, rating, is_published, images, created_at, updated_at
+)
+SELECT
+    gen_random_uuid(),
+    CASE
+        WHEN i % 1000 = 0 THEN 'Parka '
+        ELSE (ARRAY['Camiseta', 'Bermuda', 'Vestido', 'Saia', 'Jaqueta'])[1 + i % 5] || ' '
+    END || md5(i::text),
+    -- Um em cada dez produtos cita a jaqueta só na descrição.
+    CASE WHEN i % 10 = 1 THEN 'Combina com jaqueta' ELSE 'Peça ' || md5((i * 7)::text) END,
+    100, 10, 'Lu', 'BENCH' || i, 'masculino', 0, 0, true, '[]', now(), now()
+FROM generate_series(1, :rows) AS i
+"""
+
+
+@pytest.mark.asyncio
+async def test_search_compared_with_the_ilike_listing(db_client, pg_engine, as_role, record_property):
+    as_role("customer")
+    rows, runs = 20_000, 5
+    async with pg_engine.begin() as conn:
+        await conn.execute(text(SEED_PRODUCTS), {"rows": rows})
+    # A carga em massa deixa as linhas na pending list dos índices GIN até o próximo VACUUM
+    # (o autovacuum faria isso em produção); sem ele as duas consultas varrem a lista.
+    async with pg_engine.connect() as conn:
+        await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("VACUUM ANALYZE products"))
+
+    async def timed(path: str, params: dict) -> tuple[float, int]:
+        durations = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            response = await db_client.get(path, params={**params, "size": 20})
+            durations.append(time.perf_counter() - started)
+            assert response.status_code == 200, response.text
+        return statistics.median(durations), response.json()["total"]
+
+    # Termo frequente (30% das linhas casam e todas são ranqueadas) e termo seletivo.
+    for term, ilike_expected, search_expected in [
+        ("jaqueta", rows // 5, rows // 5 + rows // 10),
+        ("parka", rows // 1000, rows // 1000),
+    ]:
+        ilike_time, ilike_total = await timed("/api/v1/products/", {"title__ilike": term})
+        search_time, search_total = await timed("/api/v1/products/search", {"q": term})
+
+        record_property(f"{term}_ilike_median_ms", round(ilike_time * 1000, 1))
+        record_property(f"{term}_search_median_ms", round(search_time * 1000, 1))
+        print(
+            f"\n{rows} produtos, '{term}': title ILIKE {ilike_time * 1000:.1f} ms ({ilike_total} resultados), "
+            f"busca {search_time * 1000:.1f} ms ({search_total} resultados, ranqueados)"
+        )
+
+        # A busca encontra também quem cita o termo só na descrição, que o ILIKE no título perde.
+        assert ilike_total == ilike_expected
+        assert search_total == search_expected
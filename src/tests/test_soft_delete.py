@@ -0,0 +1,74 @@
+import pytest
+from sqlalchemy import select
+
+from src.core.settings import settings
+from src.filters.products import ProductFilter
+from src.models.customer import Customer
+from src.models.product import Product
+from src.schemas.categories import CategoryCreateModel
+from src.services.categories import CategoryService
+from src.services.customers import CustomerService
+from src.services.products import PRODUCT_LIST_COLUMNS, ProductService
+from src.tests.factories import create_category, create_customer, create_product
+
+
+@pytest.fixture(autouse=True)
+def soft_delete(monkeypatch):
+    monkeypatch.setattr(settings.app, "SOFT_DELETE_ENABLED", True)
+    monkeypatch.setattr(settings.redis, "PRODUCT_CACHE_ENABLED", False)
+
+
+@pytest.mark.asyncio
+async def test_soft_deleted_category_frees_its_name(db_session):
+    category = await create_category(db_session, "Camisas")
+
+    await CategoryService.delete_category(db_session, category.uid)
+    created = await CategoryService.create_category(db_session, CategoryCreateModel(name="Camisas"))
+
+    assert created["data"].uid != category.uid
+    assert created["data"].deleted_at is None
+
+
+@pytest.mark.asyncio
+async def test_soft_deleted_product_frees_its_bar_code(db_session):
+    category = await create_category(db_session)
+    product = await create_product(db_session, [category], bar_code="789")
+
+    await ProductService.delete_product(db_session, product.uid)
+    replacement = await create_product(db_session, [category], bar_code="789")
+
+    assert replacement.uid != product.uid
+
+
+@pytest.mark.asyncio
+async def test_soft_deleted_customer_frees_email_and_cpf(db_session):
+    customer = await create_customer(db_session, email="ana@test.com", cpf="12345678901")
+
+    await CustomerService.delete_customer(db_session, customer.uid)
+    again = await create_customer(db_session, email="ana@test.com", cpf="12345678901")
+
+    deleted_uid, live_uid = customer.uid, again.uid
+    db_session.expire_all()
+    assert (await db_session.get(Customer, deleted_uid)).deleted_at is not None
+    assert (await db_session.get(Customer, live_uid)).deleted_at is None
+
+
+@pytest.mark.asyncio
+async def test_products_hide_soft_deleted_categories(db_session):
+    live = await create_category(db_session, "Camisas")
+    deleted = await create_category(db_session, "Promoção")
+    product = await create_product(db_session, [live, deleted])
+
+    await CategoryService.delete_category(db_session, deleted.uid)
+
+    detail = await ProductService.get_product(db_session, product.uid)
+    assert [category.name for category in detail.data.categories] == ["Camisas"]
+
+    result = await db_session.execute(select(*PRODUCT_LIST_COLUMNS))
+    rows = await ProductService._rows_to_dicts(db_session, result.all())
+    assert [category["name"] for category in rows[0]["categories"]] == ["Camisas"]
+
+    matches = await db_session.execute(
+        ProductFilter(categories__name__ilike="Promoção").filter(select(Product.uid))
+    )
+    assert matches.all() == []
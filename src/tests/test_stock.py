@@ -0,0 +1,72 @@
+import asyncio
+import time
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select
+
+from src.exceptions.errors import InsufficientStockError, ProductNotFoundError
+from src.models.address import Address
+from src.models.product import Product
+from src.schemas.address import AddressModel
+from src.schemas.orders import OrderCreateModel
+from src.services.orders import OrderService
+from src.services.stock import StockService
+from src.tests.factories import create_customer, create_product
+
+
+@pytest.mark.asyncio
+async def test_concurrent_reservations_do_not_oversell(db_sessionmaker, db_session):
+    product_id = (await create_product(db_session, stock=1)).uid
+
+    async def reserve():
+        async with db_sessionmaker() as session:
+            reserved = await StockService.reserve(session, {product_id: 1})
+            # Segura o lock por um instante para a outra reserva esperar por ele.
+            await asyncio.sleep(0.1)
+            await session.commit()
+            return reserved
+
+    results = await asyncio.gather(reserve(), reserve(), return_exceptions=True)
+
+    assert sum(isinstance(result, InsufficientStockError) for result in results) == 1
+    assert sum(isinstance(result, dict) for result in results) == 1
+    db_session.expire_all()
+    assert await db_session.scalar(select(Product.stock).where(Product.uid == product_id)) == 0
+
+
+@pytest.mark.asyncio
+async def test_reserving_a_soft_deleted_product_reports_it_as_not_found(db_session):
+    product = await create_product(db_session, stock=5, deleted_at=datetime.now())
+
+    with pytest.raises(ProductNotFoundError):
+        await StockService.reserve(db_session, {product.uid: 1})
+
+
+@pytest.mark.asyncio
+async def test_parallel_orders_for_one_hot_product(db_sessionmaker, db_session, record_property):
+    orders, stock = 50, 20
+    customer = await create_customer(db_session)
+    address = await db_session.scalar(select(Address).where(Address.customer_id == customer.uid))
+    product_id = (await create_product(db_session, stock=stock)).uid
+    order = OrderCreateModel(
+        customer_id=customer.uid,
+        status="paid",
+        items=[{"product_id": product_id, "quantity": 1}],
+        shipping_address=AddressModel.model_validate(address),
+    )
+
+    async def place_order():
+        async with db_sessionmaker() as session:
+            return await OrderService.create_order(session, order)
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(place_order() for _ in range(orders)), return_exceptions=True)
+    elapsed = time.perf_counter() - started
+    record_property("orders_per_second", round(orders / elapsed, 1))
+    print(f"\n{orders} pedidos concorrentes para {stock} unidades em {elapsed:.3f}s")
+
+    assert sum(getattr(result, "status", None) == "success" for result in results) == stock
+    assert sum(isinstance(result, InsufficientStockError) for result in results) == orders - stock
+    db_session.expire_all()
+    assert await db_session.scalar(select(Product.stock).where(Product.uid == product_id)) == 0
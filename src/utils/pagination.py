@@ -0,0 +1,186 @@
+import base64
+import binascii
+import json
+import math
+import uuid
+from datetime import datetime
+from typing import Any, Callable, Optional, Sequence
+
+from fastapi_pagination.api import resolve_params
+from sqlalchemy import func, select, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.cache import CountCache
+from src.exceptions.errors import InvalidCursorError
+
+_NEXT = "next"
+_PREV = "prev"
+
+
+def _dump_value(value: Any) -> list:
+    if isinstance(value, datetime):
+        return ["dt", value.isoformat()]
+    if isinstance(value, uuid.UUID):
+        return ["uuid", str(value)]
+    return ["raw", value]
+
+
+def _load_value(item: list) -> Any:
+    kind, value = item
+    if kind == "dt":
+        return datetime.fromisoformat(value)
+    if kind == "uuid":
+        return uuid.UUID(value)
+    return value
+
+
+def encode_cursor(direction: str, values: Sequence[Any]) -> str:
+    """
+    Gera um cursor opaco a partir da direção e dos valores das chaves de ordenação.
+    """
+    payload = {"d": direction, "k": [_dump_value(v) for v in values]}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, keys_count: int) -> tuple[str, list]:
+    """
+    Decodifica um cursor gerado por `encode_cursor`.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        direction = payload["d"]
+        values = [_load_value(item) for item in payload["k"]]
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise InvalidCursorError()
+
+    if direction not in (_NEXT, _PREV) or len(values) != keys_count:
+        raise InvalidCursorError()
+
+    return direction, values
+
+
+async def keyset_paginate(
+        session: AsyncSession,
+        query,
+        sort_keys: Sequence,
+        cursor: Optional[str],
+        size: int,
+        transformer: Optional[Callable[[list], list]] = None,
+) -> dict:
+    """
+    Paginação por cursor (keyset) sobre chaves de ordenação estáveis.
+
+    Em vez de OFFSET, filtra por `(k1, k2, ...) > (v1, v2, ...)` a partir da última
+    linha da página anterior, então o custo de cada página não depende da profundidade.
+    """
+    direction, values = _NEXT, None
+    if cursor:
+        direction, values = decode_cursor(cursor, len(sort_keys))
+
+    if values is not None:
+        row_key, cursor_key = tuple_(*sort_keys), tuple_(*values)
+        query = query.where(row_key > cursor_key if direction == _NEXT else row_key < cursor_key)
+
+    if direction == _NEXT:
+        query = query.order_by(*sort_keys)
+    else:
+        query = query.order_by(*[key.desc() for key in sort_keys])
+
+    result = await session.execute(query.limit(size + 1))
+    if len(query.column_descriptions) == 1:
+        rows = list(result.scalars().unique().all())
+    else:
+        rows = list(result.all())
+
+    has_more = len(rows) > size
+    rows = rows[:size]
+    if direction == _PREV:
+        rows.reverse()
+
+    def key_of(row) -> list:
+        return [getattr(row, key.key) for key in sort_keys]
+
+    next_cursor = prev_cursor = None
+    if rows:
+        if direction == _NEXT:
+            next_cursor = encode_cursor(_NEXT, key_of(rows[-1])) if has_more else None
+            prev_cursor = encode_cursor(_PREV, key_of(rows[0])) if values is not None else None
+        else:
+            next_cursor = encode_cursor(_NEXT, key_of(rows[-1]))
+            prev_cursor = encode_cursor(_PREV, key_of(rows[0])) if has_more else None
+
+    return {
+        "items": transformer(rows) if transformer else rows,
+        "size": size,
+        "next_cursor": next_cursor,
+        "prev_cursor": prev_cursor,
+    }
+
+
+async def count_rows(
+        session: AsyncSession,
+        query,
+        count_mode: str = "exact",
+        table_name: Optional[str] = None,
+        filter_params: Optional[dict] = None,
+) -> tuple[int, bool]:
+    """
+    Total de linhas da consulta e se ele é exato.
+
+    No modo "estimate", sem filtros usa `pg_class.reltuples` da tabela (mantido pelo
+    ANALYZE/autovacuum) e, com filtros, a contagem em cache no Redis por alguns segundos.
+    Se a estimativa não estiver disponível, cai na contagem exata.
+    """
+    if count_mode == "estimate" and table_name:
+        if not filter_params:
+            estimate = await session.scalar(
+                text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table_name AS regclass)"),
+                {"table_name": table_name},
+            )
+            # reltuples é -1 enquanto a tabela nunca foi analisada.
+            if estimate is not None and estimate >= 0:
+                return int(estimate), False
+        else:
+            cached = await CountCache.get(table_name, filter_params)
+            if cached is not None:
+                return cached, False
+
+    total = await session.scalar(select(func.count()).select_from(query.order_by(None).subquery()))
+    if count_mode == "estimate" and table_name and filter_params:
+        await CountCache.set(table_name, filter_params, total)
+    return total, True
+
+
+async def paginate_rows(
+        session: AsyncSession,
+        query,
+        count_mode: str = "exact",
+        table_name: Optional[str] = None,
+        filter_params: Optional[dict] = None,
+) -> dict:
+    """
+    Paginação LIMIT/OFFSET com os parâmetros da requisição (page/size), no formato de `CountedPage`.
+
+    Devolve as linhas cruas em `items` (ou as entidades, para `select(Model)`), sem validar
+    cada item contra o schema: quem chama monta os itens da resposta uma única vez.
+    """
+    params = resolve_params()
+    raw_params = params.to_raw_params().as_limit_offset()
+
+    total, total_exact = await count_rows(session, query, count_mode, table_name, filter_params)
+    result = await session.execute(query.limit(raw_params.limit).offset(raw_params.offset))
+    if len(query.column_descriptions) == 1:
+        items = list(result.scalars().unique().all())
+    else:
+        items = list(result.all())
+
+    return {
+        "items": items,
+        "total": total,
+        "page": params.page,
+        "size": params.size,
+        "pages": math.ceil(total / params.size) if total else 0,
+        "total_exact": total_exact,
+    }
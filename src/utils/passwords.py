@@ -0,0 +1,67 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+from src.core.settings import settings
+from src.exceptions.errors import PasswordHashingBusyError
+from src.utils.utils import (
+    generate_password_hash,
+    verify_password,
+    verify_and_update_password,
+)
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt off the event loop in a bounded worker pool.
+
+    Once PASSWORD_HASH_MAX_PENDING operations are queued or running, new calls fail
+    fast with PasswordHashingBusyError instead of piling up behind a login burst.
+    """
+    _executor: Executor | None = None
+    _pending: int = 0
+
+    @classmethod
+    def _get_executor(cls) -> Executor:
+        if cls._executor is None:
+            workers = settings.security.PASSWORD_HASH_WORKERS
+            if settings.security.PASSWORD_HASH_EXECUTOR == "process":
+                cls._executor = ProcessPoolExecutor(max_workers=workers)
+            else:
+                cls._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt")
+        return cls._executor
+
+    @classmethod
+    async def _run(cls, func, *args):
+        if cls._pending >= settings.security.PASSWORD_HASH_MAX_PENDING:
+            raise PasswordHashingBusyError()
+
+        cls._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(cls._get_executor(), func, *args)
+        finally:
+            cls._pending -= 1
+
+    @classmethod
+    async def hash(cls, password: str) -> str:
+        return await cls._run(generate_password_hash, password)
+
+    @classmethod
+    async def verify(cls, password: str, hash: str) -> bool:
+        return await cls._run(verify_password, password, hash)
+
+    @classmethod
+    async def verify_and_update(cls, password: str, hash: str) -> tuple[bool, str | None]:
+        """
+        Verify a password; when rehash-on-login is enabled and the stored hash uses
+        outdated cost parameters, also return the replacement hash.
+        """
+        if not settings.security.PASSWORD_REHASH_ON_LOGIN:
+            return await cls.verify(password, hash), None
+        return await cls._run(verify_and_update_password, password, hash)
+
+    @classmethod
+    def shutdown(cls) -> None:
+        if cls._executor is not None:
+            cls._executor.shutdown(wait=False, cancel_futures=True)
+            cls._executor = None
@@ -9,7 +9,11 @@ from passlib.context import CryptContext
 
 from src.core.settings import settings
 
-passwd_context = CryptContext(schemes=["bcrypt"])
+passwd_context = CryptContext(
+    schemes=["bcrypt"],
+    bcrypt__default_rounds=settings.security.BCRYPT_ROUNDS,
+    bcrypt__min_rounds=settings.security.BCRYPT_ROUNDS,
+)
 
 serializer = URLSafeTimedSerializer(
     secret_key=settings.security.JWT_SECRET_KEY, salt="email-configuration"
@@ -27,6 +31,13 @@ def verify_password(password: str, hash: str) -> bool:
     return passwd_context.verify(password, hash)
 
 
+def verify_and_update_password(password: str, hash: str) -> tuple[bool, str | None]:
+    """
+    Verify a password and, if the hash uses outdated cost parameters, return a new hash.
+    """
+    return passwd_context.verify_and_update(password, hash)
+
+
 def create_access_token(user_data: dict, expiry: timedelta = None, refresh: bool = False) -> str:
     """
     Generates a JSON Web Token (JWT), signed with a predefined secret and algorithm,